@@ -0,0 +1,176 @@
+'''
+Synthetic DBML schema generator.
+
+The output depends only on the arguments, so the same command always
+generates the same schema:
+
+    python -m benchmarks.generate --tables 1000 -o schema.dbml
+
+Every table has an `id` primary key and `columns - 1` more columns. Inline
+and standalone references take columns of the tables round-robin and point
+to the `id` of a random other table, composite indexes and notes are spread
+over the tables the same way, and table groups split the tables evenly.
+'''
+import argparse
+import random
+import sys
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+COLUMN_TYPES = ('int', 'varchar', 'text', 'timestamp', 'boolean', 'decimal(10, 2)')
+ENUM_ITEMS = 4
+
+
+def ref_slots(tables: int, columns: int) -> List[Tuple[int, int]]:
+    '''(table, column) pairs of the non-id columns, one column of each table at a time.'''
+    return [(t, c) for c in range(1, columns) for t in range(tables)]
+
+
+def generate_schema(
+    tables: int = 100,
+    columns: int = 8,
+    enums: int = 10,
+    inline_refs: int = 100,
+    refs: int = 100,
+    indexes: int = 100,
+    notes: int = 100,
+    table_groups: int = 10,
+    seed: int = 0,
+) -> str:
+    '''
+    DBML source with `tables` tables of `columns` columns, `enums` enums,
+    `inline_refs` inline and `refs` standalone references, `indexes` composite
+    indexes, `notes` table and column notes and `table_groups` table groups.
+
+    References need a free column each and composite indexes need two
+    columns, so the counts are limited by the number of tables and columns.
+    '''
+    if tables < 1 or columns < 1:
+        raise ValueError('At least one table with one column is required')
+    slots = ref_slots(tables, columns)
+    if inline_refs + refs > len(slots):
+        raise ValueError(f'Not enough columns for {inline_refs + refs} references, max {len(slots)}')
+    if indexes and columns < 3:
+        raise ValueError('Composite indexes need at least 3 columns per table')
+    if tables < 2 and inline_refs + refs:
+        raise ValueError('References need at least 2 tables')
+
+    rng = random.Random(seed)
+    types = [*COLUMN_TYPES, *(f'enum_{e}' for e in range(enums))]
+
+    def target(table: int) -> int:
+        other = rng.randrange(tables - 1)
+        return other + 1 if other >= table else other
+
+    inline = {slot: target(slot[0]) for slot in slots[:inline_refs]}
+    standalone = [(slot, target(slot[0])) for slot in slots[inline_refs:inline_refs + refs]]
+    ref_columns = {slot for slot, _ in standalone} | set(inline)
+
+    table_indexes: List[List[Tuple[int, int]]] = [[] for _ in range(tables)]
+    pairs = [(a, b) for a in range(1, columns) for b in range(a + 1, columns)]
+    for i in range(indexes):
+        table, pair = i % tables, i // tables
+        if pair >= len(pairs):
+            raise ValueError(f'Not enough columns for {indexes} composite indexes')
+        table_indexes[table].append(pairs[pair])
+
+    table_notes = set(range(min(notes, tables)))
+    column_notes = set(slots[:max(notes - tables, 0)])
+    if len(column_notes) < notes - len(table_notes):
+        raise ValueError(f'Not enough columns for {notes} notes')
+
+    out = []
+    for e in range(enums):
+        out.append(f'Enum enum_{e} {{\n')
+        out.extend(f'  item_{i}\n' for i in range(ENUM_ITEMS))
+        out.append('}\n\n')
+
+    for t in range(tables):
+        out.append(f'Table table_{t} {{\n  id int [pk, increment]\n')
+        for c in range(1, columns):
+            settings = []
+            if (t, c) in ref_columns:
+                type_ = 'int'
+                settings.append('not null')
+            else:
+                type_ = rng.choice(types)
+            if (t, c) in inline:
+                settings.append(f'ref: > table_{inline[t, c]}.id')
+            if (t, c) in column_notes:
+                settings.append(f"note: 'Column {c} of table {t}'")
+            settings_str = f' [{", ".join(settings)}]' if settings else ''
+            out.append(f'  col_{c} {type_}{settings_str}\n')
+        if table_indexes[t]:
+            out.append('\n  indexes {\n')
+            for i, (a, b) in enumerate(table_indexes[t]):
+                out.append(f"    (col_{a}, col_{b}) [name: 'table_{t}_index_{i}']\n")
+            out.append('  }\n')
+        if t in table_notes:
+            out.append(f"\n  Note: 'Table {t}'\n")
+        out.append('}\n\n')
+
+    for (t, c), other in standalone:
+        out.append(f'Ref: table_{t}.col_{c} > table_{other}.id\n')
+    if standalone:
+        out.append('\n')
+
+    for g in range(table_groups):
+        members = range(g, tables, table_groups)
+        if not members:
+            break
+        out.append(f'TableGroup group_{g} {{\n')
+        out.extend(f'  table_{t}\n' for t in members)
+        out.append('}\n\n')
+
+    return ''.join(out)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--tables', type=int, default=100)
+    parser.add_argument('--columns', type=int, default=8, help='columns per table')
+    parser.add_argument('--enums', type=int, default=10)
+    parser.add_argument('--inline-refs', type=int, help='default: one per table')
+    parser.add_argument('--refs', type=int, help='standalone refs, default: one per table')
+    parser.add_argument('--indexes', type=int, help='composite indexes, default: one per table')
+    parser.add_argument('--notes', type=int, help='default: one per table')
+    parser.add_argument('--table-groups', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+
+
+def schema_options(args: argparse.Namespace, tables: Optional[int] = None) -> dict:
+    '''generate_schema arguments from the command line, per table counts default to `tables`.'''
+    tables = args.tables if tables is None else tables
+
+    def per_table(value: Optional[int]) -> int:
+        return tables if value is None else value
+
+    return {
+        'tables': tables,
+        'columns': args.columns,
+        'enums': args.enums,
+        'inline_refs': per_table(args.inline_refs),
+        'refs': per_table(args.refs),
+        'indexes': per_table(args.indexes),
+        'notes': per_table(args.notes),
+        'table_groups': args.table_groups,
+        'seed': args.seed,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Generate a synthetic DBML schema.')
+    add_arguments(parser)
+    parser.add_argument('-o', '--output', help='output file, default: stdout')
+    args = parser.parse_args(argv)
+    source = generate_schema(**schema_options(args))
+    if args.output:
+        with open(args.output, 'w', encoding='utf8') as f:
+            f.write(source)
+    else:
+        sys.stdout.write(source)
+
+
+if __name__ == '__main__':
+    main()
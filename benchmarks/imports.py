@@ -0,0 +1,74 @@
+'''
+Import time benchmark.
+
+Every statement is run in a fresh interpreter, the time of the interpreter
+start without imports is subtracted. The results are written as JSON:
+
+    python -m benchmarks.imports --repeat 10 -o imports.json
+'''
+import argparse
+import json
+import subprocess
+import sys
+from time import perf_counter
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from .run import environment
+from .run import measure
+
+
+STATEMENTS = {
+    'baseline': 'pass',
+    'pydbml': 'import pydbml',
+    'classes': 'from pydbml.classes import Table',
+    'database_sql': (
+        'from pydbml import Database\n'
+        'from pydbml.classes import Column, Table\n'
+        'db = Database()\n'
+        'db.add(Table("t", columns=[Column("id", "int")]))\n'
+        'db.sql'
+    ),
+    'parser': 'from pydbml import PyDBML',
+}
+
+
+def time_statement(statement: str) -> float:
+    start = perf_counter()
+    subprocess.run([sys.executable, '-c', statement], check=True)
+    return perf_counter() - start
+
+
+def modules_loaded(statement: str) -> List[str]:
+    '''pydbml modules imported by the statement.'''
+    code = f'{statement}\nimport sys\nprint("\\n".join(m for m in sys.modules if m.startswith("pydbml")))'
+    output = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True)
+    return sorted(output.stdout.split())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Measure import time of pydbml.')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('-o', '--output', help='JSON output file, default: stdout')
+    args = parser.parse_args(argv)
+
+    results: Dict[str, dict] = {}
+    for name, statement in STATEMENTS.items():
+        results[name] = measure(lambda: time_statement(statement), args.repeat)
+        results[name]['modules'] = len(modules_loaded(statement))
+    baseline = results['baseline']['min']
+    for name, result in results.items():
+        result['import'] = result['min'] - baseline
+        print(f'{name}: {result["import"] * 1000:.1f}ms', file=sys.stderr)
+
+    report = json.dumps({'environment': environment(), 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+'''
+Benchmarks of parsing and rendering on synthetic schemas.
+
+For each schema size times:
+
+* parse — PyDBML.parse of the source;
+* build_database — building the Database from parsed blueprints;
+* sql — Database.sql, rendered from scratch (the cache is cleared before each run);
+* dbml — Database.dbml, also rendered from scratch;
+* round_trip — parsing the source, rendering it to DBML and parsing the
+  result again.
+
+Every case is run `--repeat` times, the results are written as JSON:
+
+    python -m benchmarks.run --sizes 100 1000 10000 -o results.json
+
+Counts other than tables default to one per table (see
+`benchmarks.generate`), so the sizes give a scaling curve of the same
+schema shape.
+'''
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from datetime import timezone
+from time import perf_counter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+import pyparsing as pp
+
+from pydbml import PyDBML
+from pydbml.parser.cache import get_version
+from pydbml.parser.parser import PyDBMLParser
+
+from .generate import add_arguments
+from .generate import generate_schema
+from .generate import schema_options
+
+
+CASES = ('parse', 'build_database', 'sql', 'dbml', 'round_trip')
+
+
+def measure(
+    func: Callable[[], Any],
+    repeat: int,
+    setup: Optional[Callable[[], Any]] = None
+) -> Dict[str, Any]:
+    '''Wall times of `repeat` calls of func, in seconds. `setup` runs untimed before each call.'''
+    runs = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = perf_counter()
+        func()
+        runs.append(perf_counter() - start)
+    return {'min': min(runs), 'mean': sum(runs) / len(runs), 'runs': runs}
+
+
+def run_size(options: Dict[str, Any], repeat: int, cases: List[str]) -> Dict[str, Any]:
+    source = generate_schema(**options)
+    parser = PyDBMLParser(source)
+    db = parser.parse()
+    timings = {}
+    for case in cases:
+        # rendered SQL and DBML are cached in the database, time rendering from scratch
+        setup = db.invalidate if case in ('sql', 'dbml') else None
+        if case == 'parse':
+            func = lambda: PyDBML.parse(source)
+        elif case == 'build_database':
+            # blueprints are kept by the parser, building again gives an equal database
+            func = parser.build_database
+        elif case == 'sql':
+            func = lambda: db.sql
+        elif case == 'dbml':
+            func = lambda: db.dbml
+        else:
+            func = lambda: PyDBML.parse(PyDBML.parse(source).dbml)
+        timings[case] = measure(func, repeat, setup)
+    return {
+        'schema': options,
+        'source_bytes': len(source.encode('utf8')),
+        'objects': {
+            'tables': len(db.tables),
+            'refs': len(db.refs),
+            'enums': len(db.enums),
+            'table_groups': len(db.table_groups),
+        },
+        'timings': timings,
+    }
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'pydbml': get_version(),
+        'pyparsing': pp.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description='Run pydbml benchmarks on synthetic schemas.')
+    add_arguments(parser)
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[100, 1000],
+        help='table counts to benchmark, overrides --tables',
+    )
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    parser.add_argument('-o', '--output', help='JSON output file, default: stdout')
+    args = parser.parse_args(argv)
+
+    results = []
+    for size in args.sizes:
+        result = run_size(schema_options(args, size), args.repeat, args.cases)
+        results.append(result)
+        summary = ', '.join(f'{case} {t["min"]:.3f}s' for case, t in result['timings'].items())
+        print(f'{size} tables: {summary}', file=sys.stderr)
+
+    report = json.dumps({'environment': environment(), 'results': results}, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf8') as f:
+            f.write(report + '\n')
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,18 @@
+from typing import TYPE_CHECKING
+
 from . import _classes
-from .parser import PyDBML
+from .changes import diff
 from .database import Database
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import PyDBML
+
+
+def __getattr__(name: str):
+    # The parser builds the grammar on import, which takes most of the import
+    # time, so it is only imported when PyDBML is used.
+    if name == 'PyDBML':
+        from .parser import PyDBML
+        globals()['PyDBML'] = PyDBML
+        return PyDBML
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
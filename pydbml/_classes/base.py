@@ -1,13 +1,79 @@
+from hashlib import blake2b
 from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import SupportsIndex
 from typing import Tuple
+from typing import cast
 
 from pydbml.exceptions import AttributeMissingError
 
 
+_missing = object()
+
+
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def slot_names(cls: type) -> Tuple[str, ...]:
+    '''Names of the instance attributes declared in __slots__ of the class and its bases.'''
+    result = _slot_names.get(cls)
+    if result is None:
+        names: List[str] = []
+        for klass in reversed(cls.__mro__):
+            for name in klass.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and name not in names:
+                    names.append(name)
+        result = _slot_names[cls] = tuple(names)
+    return result
+
+
+_compared_slots: Dict[type, Tuple[str, ...]] = {}
+
+
+def compared_slots(cls: type) -> Tuple[str, ...]:
+    '''Slots of the class which are compared in SQLObject.__eq__.'''
+    result = _compared_slots.get(cls)
+    if result is None:
+        skip = {'_fingerprint', *getattr(cls, 'dont_compare_fields', ())}
+        result = _compared_slots[cls] = tuple(name for name in slot_names(cls) if name not in skip)
+    return result
+
+
+def fingerprint_value(value: Any) -> Any:
+    '''
+    Stable representation of an attribute value for fingerprints. Values
+    which are equal get equal representations: numbers and booleans are
+    represented by their hash, which is the same for 1, 1.0 and True.
+    '''
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, int, float)):
+        return ('number', hash(value))
+    if isinstance(value, dict):
+        if not value:
+            return ('dict',)
+        return ('dict', tuple(sorted((str(k), fingerprint_value(v)) for k, v in value.items())))
+    text = getattr(value, 'text', None)
+    if isinstance(text, str):  # Note, Expression
+        return (type(value).__name__, text)
+    return ('object',)
+
+
+def fingerprint_of(parts: Tuple[Any, ...]) -> str:
+    '''Hex digest of the parts, which are strings, None, other digests and tuples of them.'''
+    return blake2b(repr(parts).encode('utf8'), digest_size=16).hexdigest()
+
+
 class SQLObject:
     '''
     Base class for all SQL objects.
     '''
+    __slots__ = ()
+
     required_attributes: Tuple[str, ...] = ()
     dont_compare_fields: Tuple[str, ...] = ()
 
@@ -29,7 +95,8 @@ class SQLObject:
             from pydbml.renderer.sql.default import DefaultSQLRenderer
             renderer = DefaultSQLRenderer
 
-        return renderer.render(self)
+        # all SQL objects are DBML objects too
+        return render_cached(cast(DBMLObject, self), renderer)
 
     def __setattr__(self, name: str, value: Any):
         """
@@ -45,20 +112,109 @@ class SQLObject:
 
         if not isinstance(other, self.__class__):
             return False
-        # not comparing those because they are circular references
 
-        self_dict = dict(self.__dict__)
-        other_dict = dict(other.__dict__)
+        # fingerprints, if both are computed and tracked, tell different objects apart at once
+        self_fingerprint = getattr(self, '_fingerprint', None)
+        other_fingerprint = getattr(other, '_fingerprint', None)
+        if (
+            self_fingerprint and other_fingerprint and self_fingerprint != other_fingerprint
+            and cast(DBMLObject, self)._fingerprint_tracked()
+            and cast(DBMLObject, other)._fingerprint_tracked()
+        ):
+            return False
+
+        if type(other) is type(self) and not hasattr(self, '__dict__'):
+            # slots only, compare one attribute at a time and stop at the first difference
+            for name in compared_slots(type(self)):
+                value = getattr(self, name, _missing)
+                other_value = getattr(other, name, _missing)
+                if value is not other_value and not value == other_value:
+                    return False
+            return True
 
-        for field in self.dont_compare_fields:
+        self_dict = self._fields()
+        other_dict = other._fields()
+
+        # not comparing those because they are circular references
+        for field in ('_fingerprint', *self.dont_compare_fields):
             self_dict.pop(field, None)
             other_dict.pop(field, None)
 
         return self_dict == other_dict
 
+    def _fields(self) -> Dict[str, Any]:
+        '''Instance attributes, both from __dict__ and from __slots__.'''
+        result = dict(getattr(self, '__dict__', {}))
+        for name in slot_names(type(self)):
+            value = getattr(self, name, _missing)
+            if value is not _missing:
+                result[name] = value
+        return result
+
 
 class DBMLObject:
     '''Base class for all DBML objects.'''
+    __slots__ = ()
+
+    # Cached fingerprint. Classes with fingerprints declare a `_fingerprint`
+    # slot or set it in __init__, for others it is always None.
+    _fingerprint: Optional[str] = None
+    # Objects which are a part of their parent's fingerprint, but don't
+    # have their own, pass every change to the parent.
+    _forward_changes = False
+
+    def __setattr__(self, name: str, value: Any):
+        if self._forward_changes or (
+            name != '_fingerprint' and getattr(self, '_fingerprint', None) is not None
+        ):
+            self._invalidate_fingerprint()
+        object.__setattr__(self, name, value)
+
+    def __setstate__(self, state: Any) -> None:
+        '''
+        Restore a copied or unpickled object. It is not a change, so the
+        attributes are set without invalidating fingerprints: parents may
+        not be restored yet.
+        '''
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        for attributes in (dict_state, slot_state):
+            for name, value in (attributes or {}).items():
+                object.__setattr__(self, name, value)
+
+    def _fingerprint_tracked(self) -> bool:
+        '''
+        Whether a change of any part of the fingerprint reaches this object
+        (see `_fingerprint_parents`). Other fingerprints are computed on every
+        call and never cached.
+        '''
+        return True
+
+    def _cached_fingerprint(self, parts: Callable[[], Tuple[Any, ...]]) -> str:
+        if not self._fingerprint_tracked():
+            return fingerprint_of(parts())
+        if not self._fingerprint:  # None or '', see Database._track_changes
+            self._fingerprint = fingerprint_of(parts())
+        return self._fingerprint
+
+    def _fingerprint_parents(self) -> Iterable[Any]:
+        '''Objects which fingerprints include the fingerprint of this one.'''
+        return ()
+
+    def _render_root(self) -> Optional[Any]:
+        '''Database which caches the rendered object, see `render_cached`.'''
+        return getattr(self, 'database', None)
+
+    def _invalidate_fingerprint(self) -> None:
+        '''
+        Drop the cached fingerprint of the object and of the objects which
+        include it. A fingerprint is only computed after the fingerprints it
+        includes, so if this one is not cached, the parents are not either.
+        '''
+        if getattr(self, '_fingerprint', None) is not None:
+            self._fingerprint = None
+            for parent in self._fingerprint_parents():
+                parent._invalidate_fingerprint()
+
     @property
     def dbml(self) -> str:
         if hasattr(self, 'database') and self.database is not None:
@@ -67,4 +223,84 @@ class DBMLObject:
             from pydbml.renderer.dbml.default import DefaultDBMLRenderer
             renderer = DefaultDBMLRenderer
 
-        return renderer.render(self)
+        return render_cached(self, renderer)
+
+
+def render_cached(obj: DBMLObject, renderer: Any) -> str:
+    '''
+    Render the object, or return the result cached in its database. Objects
+    which are not in a database are rendered every time.
+    '''
+    database = obj._render_root()
+    if database is None:
+        return renderer.render(obj)
+    return database._cached_render(obj, renderer, lambda: renderer.render(obj))
+
+
+class TrackedList(list):
+    '''
+    List of the items of an enum or a table group. Changing it in place
+    invalidates the fingerprint of the owner, like assigning an attribute.
+    '''
+    __slots__ = ('owner',)
+
+    def __init__(self, owner: Any, items: Iterable[Any] = ()) -> None:
+        self.owner = owner
+        super().__init__(items)
+
+    def _changed(self) -> None:
+        # unpickled and copied lists are filled before the owner is set
+        owner = getattr(self, 'owner', None)
+        if owner is not None:
+            owner._invalidate_fingerprint()
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._changed()
+
+    def extend(self, items: Iterable[Any]) -> None:
+        super().extend(items)
+        self._changed()
+
+    def insert(self, index: SupportsIndex, item: Any) -> None:
+        super().insert(index, item)
+        self._changed()
+
+    def remove(self, item: Any) -> None:
+        super().remove(item)
+        self._changed()
+
+    def pop(self, index: SupportsIndex = -1) -> Any:
+        result = super().pop(index)
+        self._changed()
+        return result
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: Any) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __iadd__(self, items: Iterable[Any]) -> 'TrackedList':  # type: ignore[misc]
+        super().__iadd__(items)
+        self._changed()
+        return self
+
+    def __imul__(self, count: SupportsIndex) -> 'TrackedList':  # type: ignore[misc]
+        super().__imul__(count)
+        self._changed()
+        return self
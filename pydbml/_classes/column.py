@@ -1,15 +1,22 @@
+from typing import Any
 from typing import List, Dict
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Union
 
-from pydbml.exceptions import TableNotFoundError
+from pydbml.exceptions import TableNotFoundError, UnknownDatabaseError
 from .base import SQLObject, DBMLObject
+from .base import fingerprint_value
 from .enum import Enum
 from .expression import Expression
+from .note import EMPTY_NOTE
 from .note import Note
+from .note import make_note
+from .note import note_of
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.parser.span import SourceSpan
+    from pydbml.database import Database
     from .table import Table
     from .reference import Reference
 
@@ -17,8 +24,24 @@ if TYPE_CHECKING:  # pragma: no cover
 class Column(SQLObject, DBMLObject):
     '''Class representing table column.'''
 
+    __slots__ = (
+        '_fingerprint',
+        'table',
+        '_name',
+        'type',
+        'unique',
+        'not_null',
+        '_pk',
+        'autoinc',
+        'comment',
+        '_note',
+        'properties',
+        'span',
+        'default',
+    )
+
     required_attributes = ('name', 'type')
-    dont_compare_fields = ('table',)
+    dont_compare_fields = ('table', 'span')
 
     def __init__(self,
                  name: str,
@@ -32,6 +55,8 @@ class Column(SQLObject, DBMLObject):
                  comment: Optional[str] = None,
                  properties: Union[Dict[str, str], None] = None
                  ):
+        self._fingerprint = None
+        self.table: Optional['Table'] = None
         self.name = name
         self.type = type
         self.unique = unique
@@ -39,11 +64,11 @@ class Column(SQLObject, DBMLObject):
         self.pk = pk
         self.autoinc = autoinc
         self.comment = comment
-        self.note = Note(note)
+        self.note = make_note(note)
         self.properties = properties if properties else {}
+        self.span: Optional['SourceSpan'] = None
 
         self.default = default
-        self.table: Optional['Table'] = None
 
     def __eq__(self, other: object) -> bool:
         if other is self:
@@ -56,14 +81,83 @@ class Column(SQLObject, DBMLObject):
             return False
         return super().__eq__(other)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, val: str) -> None:
+        old_name = getattr(self, '_name', None)
+        self._name = val
+        if self.table is not None:
+            self.table._rename_column(self, old_name)
+
+    @property
+    def pk(self) -> bool:
+        return self._pk
+
+    @pk.setter
+    def pk(self, val: bool) -> None:
+        self._pk = val
+        if self.table is not None:
+            self.table._reset_primary_key()
+
     @property
     def note(self):
-        return self._note
+        return note_of(self)
 
     @note.setter
     def note(self, val: Note) -> None:
         self._note = val
-        val.parent = self
+        if val is not EMPTY_NOTE:
+            val.parent = self
+
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the column, cached until the column changes. Equal
+        columns have equal fingerprints. The table is not a part of it.
+        '''
+        def parts():
+            if isinstance(self.type, Enum):
+                type_ = ('enum', self.type.fingerprint())
+            else:
+                type_ = fingerprint_value(self.type)
+            return (
+                'Column',
+                self.name,
+                type_,
+                bool(self.unique),
+                bool(self.not_null),
+                bool(self.pk),
+                bool(self.autoinc),
+                fingerprint_value(self.default),
+                fingerprint_value(self._note),
+                self.comment,
+                fingerprint_value(self.properties),
+            )
+        return self._cached_fingerprint(parts)
+
+    def _fingerprint_tracked(self) -> bool:
+        # enums find the columns of their type through the database
+        return not isinstance(self.type, Enum) or (
+            self.database is not None and self.type.database is self.database
+        )
+
+    def _fingerprint_parents(self) -> List[Any]:
+        if self.table is None:
+            return []
+        result: List[Any] = [self.table]
+        result.extend(i for i in self.table.indexes if any(s is self for s in i.subjects))
+        if self.table.database is not None:
+            index = self.table.database._get_ref_index()
+            result.extend(
+                r for r in (*index.refs_from(self.table), *index.refs_to(self.table))
+                if any(c is self for c in (*r.col1, *r.col2))
+            )
+        return result
+
+    def _render_root(self) -> Optional['Database']:
+        return self.table.database if self.table else None
 
     def get_refs(self) -> List['Reference']:
         '''
@@ -71,7 +165,9 @@ class Column(SQLObject, DBMLObject):
         '''
         if not self.table:
             raise TableNotFoundError('Table for the column is not set')
-        return [ref for ref in self.table.get_refs() if self in ref.col1]
+        if not self.table.database:
+            raise UnknownDatabaseError('Database for the table is not set')
+        return list(self.table.database._get_ref_index().refs_from_column(self))
 
     @property
     def database(self):
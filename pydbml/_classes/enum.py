@@ -1,33 +1,59 @@
+from typing import Any
 from typing import Iterable
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 
 from .base import SQLObject, DBMLObject
+from .base import fingerprint_value
+from .base import TrackedList
+from .note import EMPTY_NOTE
 from .note import Note
+from .note import make_note
+from .note import note_of
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.parser.span import SourceSpan
 
 
 class EnumItem(SQLObject, DBMLObject):
     '''Single enum item'''
 
+    __slots__ = ('enum', 'name', '_note', 'comment')
+
     required_attributes = ('name',)
+    dont_compare_fields = ('enum',)
+    _forward_changes = True
 
     def __init__(self,
                  name: str,
                  note: Optional[Union[Note, str]] = None,
                  comment: Optional[str] = None):
+        self.enum: Optional['Enum'] = None
         self.name = name
-        self.note = Note(note)
+        self.note = make_note(note)
         self.comment = comment
 
     @property
     def note(self):
-        return self._note
+        return note_of(self)
 
     @note.setter
     def note(self, val: Note) -> None:
         self._note = val
-        val.parent = self
+        if val is not EMPTY_NOTE:
+            val.parent = self
+
+    def _invalidate_fingerprint(self) -> None:
+        # the item is a part of its enum's fingerprint
+        enum = getattr(self, 'enum', None)
+        if enum is not None:
+            enum._invalidate_fingerprint()
+
+    def _render_root(self) -> Any:
+        enum = getattr(self, 'enum', None)
+        return enum._render_root() if enum is not None else None
 
     def __repr__(self):
         '''<EnumItem 'en-US'>'''
@@ -40,6 +66,7 @@ class EnumItem(SQLObject, DBMLObject):
 
 class Enum(SQLObject, DBMLObject):
     required_attributes = ('name', 'schema', 'items')
+    dont_compare_fields = ('span',)
 
     def __init__(self,
                  name: str,
@@ -50,15 +77,48 @@ class Enum(SQLObject, DBMLObject):
         self.name = name
         self.schema = schema
         self.comment = comment
+        self.span: Optional['SourceSpan'] = None
         self.items: List[EnumItem] = []
         for item in items:
             self.add_item(item)
 
+    def __setattr__(self, name, value):
+        if name == 'items':
+            value = TrackedList(self, value)
+        super().__setattr__(name, value)
+        if name in ('name', 'schema') and getattr(self, 'database', None) is not None:
+            self.database._reset_names()
+
     def add_item(self, item: Union['EnumItem', str]) -> None:
+        if isinstance(item, str):
+            item = EnumItem(item)
         if isinstance(item, EnumItem):
+            item.enum = self
             self.items.append(item)
-        elif isinstance(item, str):
-            self.items.append(EnumItem(item))
+            self._invalidate_fingerprint()
+
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the enum and its items, cached until they change.
+        Equal enums have equal fingerprints.
+        '''
+        def parts():
+            items = tuple(
+                (i.name, fingerprint_value(i._note), i.comment)
+                for i in self.items
+            )
+            return ('Enum', self.name, self.schema, self.comment, items)
+        return self._cached_fingerprint(parts)
+
+    def _fingerprint_parents(self) -> List[Any]:
+        if self.database is None:
+            return []
+        result: List[Any] = [self.database]
+        # columns of this type include the enum name
+        result.extend(
+            c for t in self.database.tables for c in t.columns if c.type is self
+        )
+        return result
 
     def __getitem__(self, key: int) -> EnumItem:
         return self.items[key]
@@ -2,6 +2,8 @@ from .base import SQLObject, DBMLObject
 
 
 class Expression(SQLObject, DBMLObject):
+    __slots__ = ('text',)
+
     def __init__(self, text: str):
         self.text = text
 
@@ -5,18 +5,26 @@ from typing import TYPE_CHECKING
 from typing import Union
 
 from .base import SQLObject, DBMLObject
+from .base import fingerprint_value
 from .column import Column
 from .expression import Expression
+from .note import EMPTY_NOTE
 from .note import Note
+from .note import make_note
+from .note import note_of
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+    from pydbml.parser.span import SourceSpan
     from .table import Table
 
 
 class Index(SQLObject, DBMLObject):
     '''Class representing index.'''
+    __slots__ = ('_fingerprint', 'subjects', 'table', 'name', 'unique', 'type', 'pk', '_note', 'comment', 'span')
+
     required_attributes = ('subjects', 'table')
-    dont_compare_fields = ('table',)
+    dont_compare_fields = ('table', 'span')
 
     def __init__(self,
                  subjects: List[Union[str, Column, Expression]],
@@ -36,6 +44,7 @@ class Index(SQLObject, DBMLObject):
                  pk: bool = False,
                  note: Optional[Union[Note, str]] = None,
                  comment: Optional[str] = None):
+        self._fingerprint = None
         self.subjects = subjects
         self.table: Optional[Table] = None
 
@@ -43,17 +52,55 @@ class Index(SQLObject, DBMLObject):
         self.unique = unique
         self.type = type
         self.pk = pk
-        self.note = Note(note)
+        self.note = make_note(note)
         self.comment = comment
+        self.span: Optional['SourceSpan'] = None
 
     @property
     def note(self):
-        return self._note
+        return note_of(self)
 
     @note.setter
     def note(self, val: Note) -> None:
         self._note = val
-        val.parent = self
+        if val is not EMPTY_NOTE:
+            val.parent = self
+
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the index, combined from the fingerprints of its
+        column subjects. It is cached until the index or the columns change.
+        Equal indexes have equal fingerprints.
+        '''
+        def parts():
+            subjects = tuple(
+                s.fingerprint() if isinstance(s, Column) else fingerprint_value(s)
+                for s in self.subjects
+            )
+            return (
+                'Index',
+                subjects,
+                self.name,
+                bool(self.unique),
+                self.type,
+                bool(self.pk),
+                fingerprint_value(self._note),
+                self.comment,
+            )
+        return self._cached_fingerprint(parts)
+
+    def _fingerprint_tracked(self) -> bool:
+        # columns find their indexes through the table
+        return self.table is not None and all(
+            s.table is self.table and s._fingerprint_tracked()
+            for s in self.subjects if isinstance(s, Column)
+        )
+
+    def _fingerprint_parents(self) -> List['Table']:
+        return [] if self.table is None else [self.table]
+
+    def _render_root(self) -> Optional['Database']:
+        return self.table.database if self.table else None
 
     @property
     def subject_names(self):
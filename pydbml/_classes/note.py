@@ -4,12 +4,39 @@ from .base import SQLObject, DBMLObject
 
 
 class Note(SQLObject, DBMLObject):
+    __slots__ = ('text', 'parent')
+
     dont_compare_fields = ('parent',)
+    _forward_changes = True
 
     def __init__(self, text: Any) -> None:
+        self.parent: Any = None
         self.text: str
         self.text = str(text) if text is not None else ''
-        self.parent: Any = None
+
+    def __setattr__(self, name: str, value: Any):
+        if self is EMPTY_NOTE:
+            raise AttributeError(
+                'EMPTY_NOTE is shared between objects and cannot be changed, '
+                'change the note of the object instead'
+            )
+        super().__setattr__(name, value)
+
+    def _invalidate_fingerprint(self) -> None:
+        # the note is a part of its parent's fingerprint
+        parent = getattr(self, 'parent', None)
+        if parent is not None:
+            parent._invalidate_fingerprint()
+
+    def _render_root(self) -> Any:
+        parent = getattr(self, 'parent', None)
+        return parent._render_root() if parent is not None else None
+
+    def __reduce_ex__(self, protocol):
+        # copies and unpickled objects share the empty note too
+        if self is EMPTY_NOTE:
+            return 'EMPTY_NOTE'
+        return super().__reduce_ex__(protocol)
 
     def __str__(self):
         '''Note text'''
@@ -21,3 +48,63 @@ class Note(SQLObject, DBMLObject):
     def __repr__(self):
         '''Note('Note text')'''
         return f'Note({repr(self.text)})'
+
+
+class EmptyNote(Note):
+    '''
+    Note of an object without a note, returned by its `note` property. The
+    object stores the shared EMPTY_NOTE, this note is created on access and
+    becomes the note of the object when it is changed (copy on write).
+    '''
+    __slots__ = ()
+
+    def __init__(self, parent: Any) -> None:
+        object.__setattr__(self, 'text', '')
+        object.__setattr__(self, 'parent', parent)
+
+    def __setattr__(self, name: str, value: Any):
+        parent = self.parent
+        object.__setattr__(self, '__class__', Note)
+        if name != 'parent' and parent is not None and parent._note is EMPTY_NOTE:
+            parent.note = self
+        else:
+            # the object got another note meanwhile, or this one is moved
+            object.__setattr__(self, 'parent', None)
+        setattr(self, name, value)
+
+    def _render_root(self) -> Any:
+        # a new note on every access, ids of them can't key the render cache
+        return None
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Note) and other.text == ''
+
+
+EMPTY_NOTE = Note.__new__(Note)
+'''
+Note of the columns, indexes and enum items without a note. It is shared,
+so it has no parent and cannot be changed. The `note` property of the
+objects returns an EmptyNote instead, which can be changed.
+'''
+object.__setattr__(EMPTY_NOTE, 'text', '')
+object.__setattr__(EMPTY_NOTE, 'parent', None)
+
+
+def note_of(parent: Any) -> Note:
+    '''Value of the `note` property of the objects, which store EMPTY_NOTE.'''
+    note = parent._note
+    return EmptyNote(parent) if note is EMPTY_NOTE else note
+
+
+def make_note(value: Any) -> Note:
+    '''
+    A new Note with the text of the value (a Note or a string), or EMPTY_NOTE
+    if there is no text.
+
+    >>> make_note('note text')
+    Note('note text')
+    >>> make_note(None) is make_note('') is EMPTY_NOTE
+    True
+    '''
+    text = str(value) if value is not None else ''
+    return Note(text) if text else EMPTY_NOTE
@@ -8,6 +8,7 @@ from pydbml._classes.note import Note
 
 class Project(DBMLObject):
     dont_compare_fields = ('database',)
+    _forward_changes = True
 
     def __init__(self,
                  name: str,
@@ -20,6 +21,12 @@ class Project(DBMLObject):
         self.note = Note(note)
         self.comment = comment
 
+    def _invalidate_fingerprint(self) -> None:
+        # the project is a part of the database fingerprint
+        database = getattr(self, 'database', None)
+        if database is not None:
+            database._invalidate_fingerprint()
+
     def __repr__(self):
         """<Project 'myproject'>"""
         return f'<Project {self.name!r}>'
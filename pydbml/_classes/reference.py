@@ -2,6 +2,8 @@ from itertools import chain
 from typing import Collection
 from typing import Literal
 from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import Union
 
 from pydbml.constants import MANY_TO_MANY
@@ -10,6 +12,9 @@ from .base import SQLObject, DBMLObject
 from .column import Column
 from .table import Table
 
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.parser.span import SourceSpan
+
 
 class Reference(SQLObject, DBMLObject):
     '''
@@ -17,8 +22,26 @@ class Reference(SQLObject, DBMLObject):
     It is a separate object, which is not connected to Table or Column objects
     and its `sql` property contains the ALTER TABLE clause.
     '''
+    __slots__ = (
+        '_fingerprint',
+        'database',
+        'type',
+        'col1',
+        'col2',
+        'name',
+        'comment',
+        'on_update',
+        'on_delete',
+        '_inline',
+        'span',
+        '_tables',
+    )
+
     required_attributes = ('type', 'col1', 'col2')
-    dont_compare_fields = ('database', '_inline')
+    dont_compare_fields = ('database', '_inline', 'span', '_tables')
+
+    # key of the columns and their tables, table1, table2 (see _get_tables)
+    _tables: Optional[Tuple[Tuple[int, ...], Optional[Table], Optional[Table]]]
 
     def __init__(self,
                  type: Literal['>', '<', '-', '<>'],
@@ -29,6 +52,7 @@ class Reference(SQLObject, DBMLObject):
                  on_update: Optional[str] = None,
                  on_delete: Optional[str] = None,
                  inline: bool = False):
+        self._fingerprint = None
         self.database = None
         self.type = type
         self.col1 = [col1] if isinstance(col1, Column) else list(col1)
@@ -38,6 +62,49 @@ class Reference(SQLObject, DBMLObject):
         self.on_update = on_update
         self.on_delete = on_delete
         self._inline = inline
+        self.span: Optional['SourceSpan'] = None
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('col1', 'col2'):
+            object.__setattr__(self, '_tables', None)
+            if getattr(self, 'database', None) is not None:
+                self.database._reset_ref_index()
+        if name in ('type', 'col1', 'col2') and getattr(self, 'database', None) is not None:
+            self.database._reset_names()
+
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the reference, combined from the fingerprints of
+        its columns. It is cached until the reference or the columns change
+        (changes of the columns are tracked through the database). Equal
+        references have equal fingerprints.
+
+        Like column fingerprints, it doesn't include the table names, the
+        database fingerprint does.
+        '''
+        def parts():
+            return (
+                'Reference',
+                self.type,
+                tuple(c.fingerprint() for c in self.col1),
+                tuple(c.fingerprint() for c in self.col2),
+                self.name,
+                self.comment,
+                self.on_update,
+                self.on_delete,
+            )
+        return self._cached_fingerprint(parts)
+
+    def _fingerprint_tracked(self) -> bool:
+        # columns find their references through the database
+        return self.database is not None and all(
+            c.table is not None and c.table.database is self.database and c._fingerprint_tracked()
+            for c in chain(self.col1, self.col2)
+        )
+
+    def _fingerprint_parents(self):
+        return [] if self.database is None else [self.database]
 
     @property
     def inline(self) -> bool:
@@ -67,15 +134,30 @@ class Reference(SQLObject, DBMLObject):
             abstract=True
         )
 
+    def _get_tables(self) -> Tuple[Optional[Table], Optional[Table]]:
+        '''
+        Validated tables of col1 and col2. They are cached until any column
+        is replaced, added or removed, or moved to another table.
+        '''
+        columns = (*self.col1, *self.col2)
+        key = (len(self.col1), *map(id, columns), *(id(c.table) for c in columns))
+        cached = self._tables
+        if cached is None or cached[0] != key:
+            self._validate()
+            table1 = self.col1[0].table if self.col1 else None
+            table2 = self.col2[0].table if self.col2 else None
+            cached = (key, table1, table2)
+            # not a change of the reference, keep the fingerprint
+            object.__setattr__(self, '_tables', cached)
+        return cached[1], cached[2]
+
     @property
     def table1(self) -> Optional[Table]:
-        self._validate()
-        return self.col1[0].table if self.col1 else None
+        return self._get_tables()[0]
 
     @property
     def table2(self) -> Optional[Table]:
-        self._validate()
-        return self.col2[0].table if self.col2 else None
+        return self._get_tables()[1]
 
     def __repr__(self):
         '''
@@ -111,9 +193,9 @@ class Reference(SQLObject, DBMLObject):
 
     def _validate(self):
         table1 = self.col1[0].table
-        if any(c.table != table1 for c in self.col1):
+        if any(c.table is not table1 for c in self.col1):
             raise DBMLError('Columns in col1 are from different tables')
 
         table2 = self.col2[0].table
-        if any(c.table != table2 for c in self.col2):
+        if any(c.table is not table2 for c in self.col2):
             raise DBMLError('Columns in col2 are from different tables')
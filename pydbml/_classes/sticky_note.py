@@ -5,6 +5,7 @@ from pydbml._classes.base import DBMLObject
 
 class StickyNote(DBMLObject):
     dont_compare_fields = ('database',)
+    _forward_changes = True
 
     def __init__(self, name: str, text: Any) -> None:
         self.name = name
@@ -12,6 +13,12 @@ class StickyNote(DBMLObject):
 
         self.database = None
 
+    def _invalidate_fingerprint(self) -> None:
+        # sticky notes are a part of the database fingerprint
+        database = getattr(self, 'database', None)
+        if database is not None:
+            database._invalidate_fingerprint()
+
     def __str__(self):
         '''StickyNote('mynote', 'Note text')'''
         return self.__class__.__name__ + f'({repr(self.name)}, {repr(self.text)})'
@@ -2,16 +2,19 @@ from typing import Iterable, Dict
 from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
+from typing import Tuple
 from typing import Union
 
 from pydbml.exceptions import ColumnNotFoundError, IndexNotFoundError, UnknownDatabaseError
 from .base import SQLObject, DBMLObject
+from .base import fingerprint_value
 from .column import Column
 from .index import Index
 from .note import Note
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydbml.database import Database
+    from pydbml.parser.span import SourceSpan
     from .reference import Reference
 
 
@@ -19,7 +22,7 @@ class Table(SQLObject, DBMLObject):
     '''Class representing table.'''
 
     required_attributes = ('name', 'schema')
-    dont_compare_fields = ('database',)
+    dont_compare_fields = ('database', '_column_dict', '_primary_key', 'span')
 
     def __init__(self,
                  name: str,
@@ -37,6 +40,10 @@ class Table(SQLObject, DBMLObject):
         self.name = name
         self.schema = schema
         self.columns: List[Column] = []
+        # column name -> position of the first column with this name
+        self._column_dict: Dict[str, int] = {}
+        # number of columns and positions of the primary key columns
+        self._primary_key: Optional[Tuple[int, Tuple[int, ...]]] = None
         for column in columns or []:
             self.add_column(column)
         self.indexes: List[Index] = []
@@ -48,6 +55,7 @@ class Table(SQLObject, DBMLObject):
         self.comment = comment
         self.abstract = abstract
         self.properties = properties if properties else {}
+        self.span: Optional['SourceSpan'] = None
 
     @property
     def note(self):
@@ -62,8 +70,37 @@ class Table(SQLObject, DBMLObject):
     def full_name(self) -> str:
         return f'{self.schema}.{self.name}'
 
+    @property
+    def primary_key(self) -> Tuple[Column, ...]:
+        '''
+        Columns with the `pk` flag, in the table order. Composite primary keys
+        defined by a pk index are not included.
+
+        >>> table = Table('products', columns=[Column('id', 'int', pk=True), Column('name', 'varchar')])
+        >>> table.primary_key
+        (<Column 'id', 'int'>,)
+        >>> table['name'].pk = True
+        >>> [c.name for c in table.primary_key]
+        ['id', 'name']
+        '''
+        cached = self._primary_key
+        if (
+            cached is None
+            or cached[0] != len(self.columns)
+            or not all(self.columns[i].pk for i in cached[1])
+        ):
+            # the columns list was changed directly, find the keys again;
+            # a cache, it doesn't change the table
+            cached = (len(self.columns), tuple(i for i, c in enumerate(self.columns) if c.pk))
+            object.__setattr__(self, '_primary_key', cached)
+        return tuple(self.columns[i] for i in cached[1])
+
+    def _reset_primary_key(self) -> None:
+        '''Called when columns are added, deleted or change their `pk` flag.'''
+        object.__setattr__(self, '_primary_key', None)
+
     def _has_composite_pk(self) -> bool:
-        return sum(c.pk for c in self.columns) > 1
+        return len(self.primary_key) > 1
 
     def add_column(self, c: Column) -> None:
         '''
@@ -74,17 +111,51 @@ class Table(SQLObject, DBMLObject):
             raise TypeError('Columns must be of type Column')
         c.table = self
         self.columns.append(c)
+        self._column_dict.setdefault(c.name, len(self.columns) - 1)
+        self._reset_primary_key()
+        self._reset_ref_index()
+        self._invalidate_fingerprint()
 
     def delete_column(self, c: Union[Column, int]) -> Column:
         if isinstance(c, Column):
             if c in self.columns:
                 c.table = None
-                return self.columns.pop(self.columns.index(c))
+                result = self.columns.pop(self.columns.index(c))
             else:
                 raise ColumnNotFoundError(f'Column {c} if missing in the table')
         elif isinstance(c, int):
             self.columns[c].table = None
-            return self.columns.pop(c)
+            result = self.columns.pop(c)
+        self._index_columns()
+        self._reset_primary_key()
+        self._reset_ref_index()
+        self._invalidate_fingerprint()
+        return result
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ('name', 'schema') and getattr(self, 'database', None) is not None:
+            # references are registered by the names of their tables
+            self.database._reset_names()
+
+    def _reset_ref_index(self) -> None:
+        '''Columns of this table may be referenced, drop the database ref index.'''
+        if self.database is not None:
+            self.database._reset_ref_index()
+            self.database._reset_names()
+
+    def _index_columns(self) -> None:
+        '''Map column names to the position of the first column with the name.'''
+        # updated in place, it is not a change of the table
+        self._column_dict.clear()
+        for i, col in enumerate(self.columns):
+            self._column_dict.setdefault(col.name, i)
+
+    def _rename_column(self, c: Column, old_name: Optional[str]) -> None:
+        '''Called by the column when it's renamed to keep the name index in sync.'''
+        self._index_columns()
+        if self.database is not None:
+            self.database._reset_names()
 
     def add_index(self, i: Index) -> None:
         '''
@@ -98,8 +169,10 @@ class Table(SQLObject, DBMLObject):
                 raise ColumnNotFoundError(f'Column {subject} not in the table')
         i.table = self
         self.indexes.append(i)
+        self._invalidate_fingerprint()
 
     def delete_index(self, i: Union[Index, int]) -> Index:
+        self._invalidate_fingerprint()
         if isinstance(i, Index):
             if i in self.indexes:
                 i.table = None
@@ -110,19 +183,54 @@ class Table(SQLObject, DBMLObject):
             self.indexes[i].table = None
             return self.indexes.pop(i)
 
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the table, combined from the fingerprints of its
+        columns and indexes. It is cached until the table or any of them
+        changes. Equal tables have equal fingerprints.
+        '''
+        def parts():
+            return (
+                'Table',
+                self.name,
+                self.schema,
+                self.alias,
+                fingerprint_value(self.note),
+                self.header_color,
+                self.comment,
+                bool(self.abstract),
+                fingerprint_value(self.properties),
+                tuple(c.fingerprint() for c in self.columns),
+                tuple(i.fingerprint() for i in self.indexes),
+            )
+        return self._cached_fingerprint(parts)
+
+    def _fingerprint_tracked(self) -> bool:
+        return (
+            all(c._fingerprint_tracked() for c in self.columns)
+            and all(i._fingerprint_tracked() for i in self.indexes)
+        )
+
+    def _fingerprint_parents(self) -> List['Database']:
+        return [] if self.database is None else [self.database]
+
     def get_refs(self) -> List['Reference']:
         if not self.database:
             raise UnknownDatabaseError('Database for the table is not set')
-        return [ref for ref in self.database.refs if ref.table1 == self]
+        return list(self.database._get_ref_index().refs_from(self))
 
     def __getitem__(self, k: Union[int, str]) -> Column:
         if isinstance(k, int):
             return self.columns[k]
         elif isinstance(k, str):
-            for c in self.columns:
-                if c.name == k:
-                    return c
-            raise ColumnNotFoundError(f'Column {k} not present in table {self.name}')
+            i = self._column_dict.get(k)
+            if i is None or i >= len(self.columns) or self.columns[i].name != k:
+                # the columns list was changed directly, index it again
+                self._index_columns()
+                i = self._column_dict.get(k)
+                if i is None:
+                    raise ColumnNotFoundError(f'Column {k} not present in table {self.name}')
+            return self.columns[i]
         else:
             raise TypeError('indeces must be str or int')
 
@@ -2,6 +2,7 @@ from typing import List
 from typing import Optional
 
 from pydbml._classes.base import DBMLObject
+from pydbml._classes.base import TrackedList
 from pydbml._classes.note import Note
 from pydbml._classes.table import Table
 
@@ -13,6 +14,7 @@ class TableGroup(DBMLObject):
     them with references to actual tables.
     '''
     dont_compare_fields = ('database',)
+    _forward_changes = True
 
     def __init__(self,
                  name: str,
@@ -27,6 +29,19 @@ class TableGroup(DBMLObject):
         self.note = note
         self.color = color
 
+    def __setattr__(self, name, value):
+        if name == 'items':
+            value = TrackedList(self, value)
+        super().__setattr__(name, value)
+        if name == 'name' and getattr(self, 'database', None) is not None:
+            self.database._reset_names()
+
+    def _invalidate_fingerprint(self) -> None:
+        # table groups are a part of the database fingerprint
+        database = getattr(self, 'database', None)
+        if database is not None:
+            database._invalidate_fingerprint()
+
     def __repr__(self):
         """
         >>> tg = TableGroup('mygroup', ['t1', 't2'])
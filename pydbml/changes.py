@@ -0,0 +1,252 @@
+'''
+Structural diff of two databases.
+
+`diff` matches the objects of two databases by their identity keys: tables
+and enums by full name, columns by name, indexes by name (or kind and
+subjects, if unnamed) and references by the names of their tables and
+columns. Tables and enums with equal fingerprints are skipped without
+looking inside, so comparing big schemas with a few changes is cheap after
+the fingerprints are computed.
+
+The result is a list of changes, ordered so that it can be applied as a
+migration: dropped references and indexes first, then dropped tables,
+new and changed enums, new and changed tables, new indexes and references,
+and dropped enums last. `pydbml.renderer.sql.migration` renders it as SQL.
+
+Table groups, sticky notes and the project are not compared. Renamed
+objects are reported as dropped and added.
+'''
+from dataclasses import dataclass
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import TYPE_CHECKING
+from typing import Tuple
+
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import Expression
+from pydbml.classes import Index
+from pydbml.classes import Reference
+from pydbml.classes import Table
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+
+
+ADD = 'add'
+DROP = 'drop'
+ALTER = 'alter'
+
+COLUMN_FIELDS = ('type', 'pk', 'autoinc', 'unique', 'not_null', 'default', 'note')
+TABLE_FIELDS = ('note',)
+REFERENCE_FIELDS = ('type', 'name', 'on_update', 'on_delete')
+
+
+@dataclass
+class Change:
+    '''
+    A single change of the schema.
+
+    `old` is the object in the old database (None for added objects), `new`
+    is the object in the new database (None for dropped objects). For
+    altered objects `fields` lists the names of the changed attributes.
+    '''
+    action: str
+    old: Any = None
+    new: Any = None
+    fields: Tuple[str, ...] = ()
+
+    @property
+    def model(self) -> Any:
+        '''The changed object: the new one, or the old one if it was dropped.'''
+        return self.old if self.new is None else self.new
+
+    def __repr__(self):
+        '''
+        >>> Change(ADD, new=Table('products'))
+        <Change add <Table 'public' 'products'>>
+        >>> Change(ALTER, Column('id', 'int'), Column('id', 'bigint'), ('type',))
+        <Change alter <Column 'id', 'bigint'> type>
+        '''
+        fields = f' {", ".join(self.fields)}' if self.fields else ''
+        return f'<Change {self.action} {self.model!r}{fields}>'
+
+
+def _type_key(value: Any) -> Any:
+    return ('enum', value.schema, value.name) if isinstance(value, Enum) else value
+
+
+def _value_key(value: Any) -> Any:
+    if isinstance(value, Expression):
+        return ('expression', value.text)
+    return value
+
+
+def _changed_fields(old: Any, new: Any, fields: Tuple[str, ...]) -> Tuple[str, ...]:
+    result = []
+    for name in fields:
+        old_value, new_value = getattr(old, name), getattr(new, name)
+        if name == 'type':
+            changed = _type_key(old_value) != _type_key(new_value)
+        elif name == 'note':
+            changed = old_value.text != new_value.text
+        elif name == 'default':
+            changed = _value_key(old_value) != _value_key(new_value)
+        else:
+            changed = old_value != new_value
+        if changed:
+            result.append(name)
+    return tuple(result)
+
+
+def _subjects_key(index: Index) -> Tuple[Any, ...]:
+    return tuple(
+        s.name if isinstance(s, Column) else _value_key(s)
+        for s in index.subjects
+    )
+
+
+def index_key(index: Index) -> Hashable:
+    '''Identity key of the index within its table.'''
+    if index.name:
+        return ('name', index.name)
+    return ('pk' if index.pk else 'index', _subjects_key(index))
+
+
+def _index_definition(index: Index) -> Hashable:
+    return _subjects_key(index), bool(index.pk), bool(index.unique), index.type
+
+
+def reference_key(ref: Reference) -> Hashable:
+    '''Identity key of the reference: full names of its tables and columns.'''
+    def cols(columns: List[Column]):
+        return tuple((c.table.full_name if c.table else None, c.name) for c in columns)
+    return cols(ref.col1), cols(ref.col2)
+
+
+def _match(old: Dict[Hashable, Any], new: Dict[Hashable, Any]):
+    '''Dropped, kept (old, new) and added objects of two keyed collections.'''
+    dropped = [o for k, o in old.items() if k not in new]
+    kept = [(o, new[k]) for k, o in old.items() if k in new]
+    added = [n for k, n in new.items() if k not in old]
+    return dropped, kept, added
+
+
+class _Diff:
+    '''Changes of each kind, collected separately and ordered by `changes`.'''
+
+    def __init__(self) -> None:
+        self.drop_refs: List[Change] = []
+        self.drop_indexes: List[Change] = []
+        self.drop_tables: List[Change] = []
+        self.enums: List[Change] = []
+        self.tables: List[Change] = []
+        self.add_indexes: List[Change] = []
+        self.add_refs: List[Change] = []
+        self.drop_enums: List[Change] = []
+
+    def changes(self) -> List[Change]:
+        return [
+            *self.drop_refs,
+            *self.drop_indexes,
+            *self.drop_tables,
+            *self.enums,
+            *self.tables,
+            *self.add_indexes,
+            *self.add_refs,
+            *self.drop_enums,
+        ]
+
+    def compare_enums(self, old: List[Enum], new: List[Enum]) -> None:
+        dropped, kept, added = _match(
+            {(e.schema, e.name): e for e in old},
+            {(e.schema, e.name): e for e in new}
+        )
+        self.drop_enums.extend(Change(DROP, old=e) for e in dropped)
+        self.enums.extend(Change(ADD, new=e) for e in added)
+        for old_enum, new_enum in kept:
+            if old_enum.fingerprint() == new_enum.fingerprint():
+                continue
+            if [i.name for i in old_enum.items] != [i.name for i in new_enum.items]:
+                self.enums.append(Change(ALTER, old_enum, new_enum, ('items',)))
+
+    def compare_tables(self, old: List[Table], new: List[Table]) -> None:
+        dropped, kept, added = _match(
+            {t.full_name: t for t in old},
+            {t.full_name: t for t in new}
+        )
+        self.drop_tables.extend(Change(DROP, old=t) for t in dropped)
+        self.tables.extend(Change(ADD, new=t) for t in added)
+        for old_table, new_table in kept:
+            if old_table.fingerprint() != new_table.fingerprint():
+                self.compare_table(old_table, new_table)
+
+    def compare_table(self, old: Table, new: Table) -> None:
+        fields = _changed_fields(old, new, TABLE_FIELDS)
+        if fields:
+            self.tables.append(Change(ALTER, old, new, fields))
+
+        dropped, kept, added = _match(
+            {c.name: c for c in old.columns},
+            {c.name: c for c in new.columns}
+        )
+        self.tables.extend(Change(ADD, new=c) for c in added)
+        for old_column, new_column in kept:
+            if old_column.fingerprint() == new_column.fingerprint():
+                continue
+            fields = _changed_fields(old_column, new_column, COLUMN_FIELDS)
+            if fields:
+                self.tables.append(Change(ALTER, old_column, new_column, fields))
+        self.tables.extend(Change(DROP, old=c) for c in dropped)
+
+        dropped, kept, added = _match(
+            {index_key(i): i for i in old.indexes},
+            {index_key(i): i for i in new.indexes}
+        )
+        changed = [
+            (o, n) for o, n in kept
+            if _index_definition(o) != _index_definition(n)
+        ]
+        dropped.extend(o for o, _ in changed)
+        added[:0] = (n for _, n in changed)
+        self.drop_indexes.extend(Change(DROP, old=i) for i in dropped)
+        self.add_indexes.extend(Change(ADD, new=i) for i in added)
+
+    def compare_refs(self, old: List[Reference], new: List[Reference]) -> None:
+        dropped, kept, added = _match(
+            {reference_key(r): r for r in old},
+            {reference_key(r): r for r in new}
+        )
+        changed = [(o, n) for o, n in kept if _changed_fields(o, n, REFERENCE_FIELDS)]
+        dropped.extend(o for o, _ in changed)
+        added[:0] = (n for _, n in changed)
+        self.drop_refs.extend(Change(DROP, old=r) for r in dropped)
+        self.add_refs.extend(Change(ADD, new=r) for r in added)
+
+
+def diff(old: 'Database', new: 'Database') -> List[Change]:
+    '''
+    Changes which turn the schema of the old database into the schema of the
+    new one, in the order they should be applied.
+
+    Tables and columns are reported as added, dropped or altered, indexes
+    and references as added or dropped (a changed index or reference is
+    dropped and added again). Columns of added and dropped tables and
+    indexes of added tables are not reported separately.
+
+    >>> from pydbml import Database
+    >>> old, new = Database(), Database()
+    >>> _ = old.add(Table('products', columns=[Column('id', 'int')]))
+    >>> _ = new.add(Table('products', columns=[Column('id', 'bigint'), Column('name', 'varchar')]))
+    >>> diff(old, new)
+    [<Change add <Column 'name', 'varchar'>>, <Change alter <Column 'id', 'bigint'> type>]
+    '''
+    if old.fingerprint() == new.fingerprint():
+        return []
+    result = _Diff()
+    result.compare_enums(old.enums, new.enums)
+    result.compare_tables(old.tables, new.tables)
+    result.compare_refs(old.refs, new.refs)
+    return result.changes()
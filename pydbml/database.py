@@ -1,26 +1,79 @@
+from itertools import chain
+from pathlib import Path
 from typing import Any, Type
+from typing import Callable
 from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import TextIO
+from typing import Tuple
 from typing import Union
 
+from ._classes.base import DBMLObject
+from ._classes.base import fingerprint_of
+from ._classes.base import fingerprint_value
 from ._classes.sticky_note import StickyNote
-from .classes import Enum, Project, Reference, Table, TableGroup
+from .classes import Column, Enum, Project, Reference, Table, TableGroup
 from .exceptions import DatabaseValidationError
 from .renderer.base import BaseRenderer
-from .renderer.dbml.default.renderer import DefaultDBMLRenderer
-from .renderer.sql.default import DefaultSQLRenderer
+from .snapshot import dump as dump_snapshot
+from .snapshot import load as load_snapshot
+
+
+class RefIndex:
+    '''
+    References of the database grouped by the tables and columns they connect.
+    All lists keep the order of `Database.refs`.
+    '''
+
+    def __init__(self, refs: List[Reference]) -> None:
+        self.size = len(refs)
+        self.position: Dict[int, int] = {}
+        self.outgoing: Dict[int, List[Reference]] = {}
+        self.incoming: Dict[int, List[Reference]] = {}
+        self.by_column: Dict[int, List[Reference]] = {}
+        for position, ref in enumerate(refs):
+            self.position[id(ref)] = position
+            table1, table2 = ref.table1, ref.table2
+            if table1 is not None:
+                self.outgoing.setdefault(id(table1), []).append(ref)
+                for col in dict.fromkeys(map(id, ref.col1)):
+                    self.by_column.setdefault(col, []).append(ref)
+            if table2 is not None:
+                self.incoming.setdefault(id(table2), []).append(ref)
+
+    def refs_from(self, table: Table) -> List[Reference]:
+        '''References where the table is table1.'''
+        return self.outgoing.get(id(table), [])
+
+    def refs_to(self, table: Table) -> List[Reference]:
+        '''References where the table is table2.'''
+        return self.incoming.get(id(table), [])
+
+    def refs_from_column(self, column: Column) -> List[Reference]:
+        '''References where the column is in col1.'''
+        return self.by_column.get(id(column), [])
+
+    def sort(self, refs: Iterable[Reference]) -> List[Reference]:
+        '''Sort references in the order of `Database.refs`.'''
+        return sorted(refs, key=lambda ref: self.position[id(ref)])
 
 
 class Database:
     def __init__(
         self,
-        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
-        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
         allow_properties: bool = False
     ) -> None:
-        self.sql_renderer = sql_renderer
-        self.dbml_renderer = dbml_renderer
+        # None stands for the default renderers, which are imported on first
+        # use, so building databases by hand doesn't load the renderers.
+        self._sql_renderer = sql_renderer
+        self._dbml_renderer = dbml_renderer
         self.tables: List['Table'] = []
         self.table_dict: Dict[str, 'Table'] = {}
         self.refs: List['Reference'] = []
@@ -30,9 +83,38 @@ class Database:
         self.project: Optional['Project'] = None
         self.allow_properties = allow_properties
 
+        # Registries for fast membership checks. Objects are tracked by
+        # identity, SQLObject.__eq__ is a deep comparison.
+        self._members: Set[int] = set()
+        self._enum_dict: Dict[Tuple[str, str], 'Enum'] = {}
+        self._table_group_dict: Dict[str, 'TableGroup'] = {}
+        self._refs_by_key: Dict[Hashable, List['Reference']] = {}
+        self._ref_keys: Dict[int, Hashable] = {}
+        # set when a member is renamed, the registries above are rebuilt
+        self._names_changed = False
+        self._ref_index: Optional[RefIndex] = None
+        self._fingerprint: Optional[str] = None
+        # rendered objects by (id(object), renderer, allow_properties),
+        # dropped on any tracked change
+        self._render_cache: Optional[Dict[Hashable, str]] = None
+
     def __repr__(self) -> str:
         return f"<Database>"
 
+    def __getstate__(self) -> Dict[str, Any]:
+        # caches keyed by object ids, they don't match the copied objects
+        state = self.__dict__.copy()
+        state['_ref_index'] = None
+        state['_render_cache'] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        # registries are keyed by object ids too, rebuild them for the copies
+        members = chain(self.tables, self.refs, self.enums, self.table_groups, self.sticky_notes)
+        self._members = {id(obj) for obj in members}
+        self._reset_names()
+
     def __getitem__(self, k: Union[int, str]) -> Table:
         if isinstance(k, int):
             return self.tables[k]
@@ -46,9 +128,175 @@ class Database:
 
     def _set_database(self, obj: Any) -> None:
         obj.database = self
+        self._invalidate_fingerprint()
 
     def _unset_database(self, obj: Any) -> None:
         obj.database = None
+        self._invalidate_fingerprint()
+
+    def _invalidate_fingerprint(self) -> None:
+        self._fingerprint = None
+        self._render_cache = None
+
+    def _track_changes(self) -> None:
+        '''
+        Mark all objects with fingerprints as tracked (an empty fingerprint),
+        so that a change of any object reaches the database, even if the
+        fingerprints were never computed.
+        '''
+        for obj in self._tracked_objects():
+            if obj._fingerprint is None:
+                object.__setattr__(obj, '_fingerprint', '')
+        if self._fingerprint is None:
+            self._fingerprint = ''
+
+    def _tracked_objects(self) -> Iterable[DBMLObject]:
+        '''Objects of the database which have their own fingerprints.'''
+        groups: List[Iterable[DBMLObject]] = [self.enums, self.refs, self.tables]
+        for table in self.tables:
+            groups.extend((table.columns, table.indexes))
+        return chain.from_iterable(groups)
+
+    def invalidate(self) -> None:
+        '''
+        Drop the fingerprints, rendered SQL and DBML and other data cached
+        from the objects of the database. Changes of attributes and of the
+        items of enums and table groups are tracked, call this after changing
+        other lists or dicts in place, e.g. `table.columns.append(column)` or
+        `column.properties['key'] = value`.
+        '''
+        for obj in self._tracked_objects():
+            if obj._fingerprint:
+                object.__setattr__(obj, '_fingerprint', '')
+        for table in self.tables:
+            table._reset_primary_key()
+        self._invalidate_fingerprint()
+        self._reset_names()
+        self._reset_ref_index()
+
+    def _cached_render(self, obj: Any, renderer: Type[BaseRenderer], render: Callable[[], str]) -> str:
+        '''
+        Result of `render()` for the object of this database, cached until
+        any object of the database changes. See `fingerprint` for the changes
+        which are tracked.
+        '''
+        if self._render_cache is None:
+            self._track_changes()
+            self._render_cache = {}
+        cache = self._render_cache
+        key = (id(obj), renderer, self.allow_properties)
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = render()
+        return result
+
+    def fingerprint(self) -> str:
+        '''
+        Structural hash of the whole schema, combined from the fingerprints
+        of tables, references and enums, and from table groups, sticky notes
+        and the project. It is computed once and cached until any object of
+        the database changes, so comparing fingerprints of two databases is
+        cheap after the first call.
+
+        Changes are tracked through attribute assignments, the add/delete
+        methods and the item lists of enums and table groups. Other lists and
+        dicts changed in place (e.g. `table.columns.append`) are not tracked,
+        call `invalidate` after such changes.
+        '''
+        if not self._fingerprint:
+            def table_group(group: TableGroup):
+                items = tuple(i if isinstance(i, str) else i.full_name for i in group.items)
+                return (group.name, items, fingerprint_value(group.note), group.color, group.comment)
+
+            def ref(ref: Reference):
+                tables = tuple(
+                    c.table.full_name if c.table else None
+                    for c in (*ref.col1, *ref.col2)
+                )
+                return (ref.fingerprint(), tables)
+
+            project = self.project
+            self._fingerprint = fingerprint_of((
+                'Database',
+                tuple(t.fingerprint() for t in self.tables),
+                tuple(ref(r) for r in self.refs),
+                tuple(e.fingerprint() for e in self.enums),
+                tuple(table_group(g) for g in self.table_groups),
+                tuple((n.name, n.text) for n in self.sticky_notes),
+                project and (
+                    project.name,
+                    fingerprint_value(project.items),
+                    fingerprint_value(project.note),
+                    project.comment,
+                ),
+            ))
+        return self._fingerprint
+
+    def _contains(self, obj: Any, items: List[Any]) -> bool:
+        if id(obj) not in self._members:
+            return False
+        if any(i is obj for i in items):
+            return True
+        # removed from the list directly
+        self._members.discard(id(obj))
+        return False
+
+    def _remove(self, obj: Any, items: List[Any]) -> Any:
+        if id(obj) in self._members:
+            for index, item in enumerate(items):
+                if item is obj:
+                    self._members.discard(id(obj))
+                    return items.pop(index)
+        raise DatabaseValidationError(f'{obj} is not in the database.')
+
+    def _get_ref_index(self) -> RefIndex:
+        '''
+        Index of references by table and column. It is built on first use
+        and dropped whenever refs, tables or their columns change.
+        '''
+        if self._ref_index is None or self._ref_index.size != len(self.refs):
+            # size check catches refs added to the list directly
+            self._ref_index = RefIndex(self.refs)
+        return self._ref_index
+
+    def _reset_ref_index(self) -> None:
+        self._ref_index = None
+
+    def _reset_names(self) -> None:
+        '''
+        Called when an enum, table group, table, column or reference changes
+        the names its registry key is made of. The name registries are
+        rebuilt from the lists before they are used next time.
+        '''
+        self._names_changed = True
+
+    def _index_names(self) -> None:
+        if not self._names_changed:
+            return
+        self._names_changed = False
+        self._enum_dict = {}
+        for enum in self.enums:
+            self._enum_dict.setdefault((enum.schema, enum.name), enum)
+        self._table_group_dict = {}
+        for table_group in self.table_groups:
+            self._table_group_dict.setdefault(table_group.name, table_group)
+        self._refs_by_key = {}
+        self._ref_keys = {}
+        for ref in self.refs:
+            key = self._ref_key(ref)
+            self._refs_by_key.setdefault(key, []).append(ref)
+            self._ref_keys[id(ref)] = key
+
+    @staticmethod
+    def _ref_key(ref: Reference) -> Hashable:
+        '''
+        Part of the Reference equality, used to find duplicate candidates.
+        Refs are registered under the key they have when they are added and
+        registered again after renames (see `_reset_names`).
+        '''
+        def cols(columns):
+            return tuple((c.table.full_name if c.table else None, c.name) for c in columns)
+        return (ref.type, cols(ref.col1), cols(ref.col2))
 
     def add(self, obj: Any) -> Any:
         if isinstance(obj, Table):
@@ -67,7 +315,7 @@ class Database:
             raise DatabaseValidationError(f'Unsupported type {type(obj)}.')
 
     def add_table(self, obj: Table) -> Table:
-        if obj in self.tables:
+        if self._contains(obj, self.tables):
             raise DatabaseValidationError(f'{obj} is already in the database.')
         if obj.full_name in self.table_dict:
             raise DatabaseValidationError(f'Table {obj.full_name} is already in the database.')
@@ -77,6 +325,8 @@ class Database:
         self._set_database(obj)
 
         self.tables.append(obj)
+        self._members.add(id(obj))
+        self._reset_ref_index()
         self.table_dict[obj.full_name] = obj
         if obj.alias:
             self.table_dict[obj.alias] = obj
@@ -91,38 +341,57 @@ class Database:
                 'Cannot add reference. At least one of the referenced tables'
                 ' should belong to this database'
             )
-        if obj in self.refs:
+        if self._contains(obj, self.refs):
+            raise DatabaseValidationError(f'{obj} is already in the database.')
+        self._index_names()
+        key = self._ref_key(obj)
+        if any(ref == obj for ref in self._refs_by_key.get(key, ())):
             raise DatabaseValidationError(f'{obj} is already in the database.')
 
         self._set_database(obj)
         self.refs.append(obj)
+        self._members.add(id(obj))
+        self._refs_by_key.setdefault(key, []).append(obj)
+        self._ref_keys[id(obj)] = key
+        self._reset_ref_index()
         return obj
 
+    def _find_enum(self, schema: str, name: str) -> Optional[Enum]:
+        self._index_names()
+        return self._enum_dict.get((schema, name))
+
     def add_enum(self, obj: Enum) -> Enum:
-        if obj in self.enums:
+        if self._contains(obj, self.enums):
             raise DatabaseValidationError(f'{obj} is already in the database.')
-        for enum in self.enums:
-            if enum.name == obj.name and enum.schema == obj.schema:
-                raise DatabaseValidationError(f'Enum {obj.schema}.{obj.name} is already in the database.')
+        if self._find_enum(obj.schema, obj.name) is not None:
+            raise DatabaseValidationError(f'Enum {obj.schema}.{obj.name} is already in the database.')
 
         self._set_database(obj)
         self.enums.append(obj)
+        self._members.add(id(obj))
+        self._enum_dict[(obj.schema, obj.name)] = obj
         return obj
 
     def add_sticky_note(self, obj: StickyNote) -> StickyNote:
         self._set_database(obj)
         self.sticky_notes.append(obj)
+        self._members.add(id(obj))
         return obj
 
+    def _find_table_group(self, name: str) -> Optional[TableGroup]:
+        self._index_names()
+        return self._table_group_dict.get(name)
+
     def add_table_group(self, obj: TableGroup) -> TableGroup:
-        if obj in self.table_groups:
+        if self._contains(obj, self.table_groups):
             raise DatabaseValidationError(f'{obj} is already in the database.')
-        for table_group in self.table_groups:
-            if table_group.name == obj.name:
-                raise DatabaseValidationError(f'TableGroup {obj.name} is already in the database.')
+        if self._find_table_group(obj.name) is not None:
+            raise DatabaseValidationError(f'TableGroup {obj.name} is already in the database.')
 
         self._set_database(obj)
         self.table_groups.append(obj)
+        self._members.add(id(obj))
+        self._table_group_dict[obj.name] = obj
         return obj
 
     def add_project(self, obj: Project) -> Project:
@@ -143,44 +412,44 @@ class Database:
             return self.delete_table_group(obj)
         elif isinstance(obj, Project):
             return self.delete_project()
+        elif isinstance(obj, StickyNote):
+            return self.delete_sticky_note(obj)
         else:
             raise DatabaseValidationError(f'Unsupported type {type(obj)}.')
 
     def delete_table(self, obj: Table) -> Table:
-        try:
-            index = self.tables.index(obj)
-        except ValueError:
-            raise DatabaseValidationError(f'{obj} is not in the database.')
-        self._unset_database(self.tables.pop(index))
+        self._unset_database(self._remove(obj, self.tables))
         result = self.table_dict.pop(obj.full_name)
         if obj.alias:
             self.table_dict.pop(obj.alias)
+        self._reset_ref_index()
         return result
 
     def delete_reference(self, obj: Reference) -> Reference:
-        try:
-            index = self.refs.index(obj)
-        except ValueError:
-            raise DatabaseValidationError(f'{obj} is not in the database.')
-        result = self.refs.pop(index)
+        result = self._remove(obj, self.refs)
+        self._index_names()
+        key = self._ref_keys.pop(id(obj), None)
+        refs = self._refs_by_key.get(key, [])
+        refs[:] = [ref for ref in refs if ref is not obj]
+        self._reset_ref_index()
         self._unset_database(result)
         return result
 
     def delete_enum(self, obj: Enum) -> Enum:
-        try:
-            index = self.enums.index(obj)
-        except ValueError:
-            raise DatabaseValidationError(f'{obj} is not in the database.')
-        result = self.enums.pop(index)
+        result = self._remove(obj, self.enums)
+        # another enum may have been renamed to the same name
+        self._reset_names()
         self._unset_database(result)
         return result
 
     def delete_table_group(self, obj: TableGroup) -> TableGroup:
-        try:
-            index = self.table_groups.index(obj)
-        except ValueError:
-            raise DatabaseValidationError(f'{obj} is not in the database.')
-        result = self.table_groups.pop(index)
+        result = self._remove(obj, self.table_groups)
+        self._reset_names()
+        self._unset_database(result)
+        return result
+
+    def delete_sticky_note(self, obj: StickyNote) -> StickyNote:
+        result = self._remove(obj, self.sticky_notes)
         self._unset_database(result)
         return result
 
@@ -192,12 +461,68 @@ class Database:
         self._unset_database(result)
         return result
 
+    @property
+    def sql_renderer(self) -> Type[BaseRenderer]:
+        if self._sql_renderer is None:
+            from .renderer.sql.default import DefaultSQLRenderer
+            self._sql_renderer = DefaultSQLRenderer
+        return self._sql_renderer
+
+    @sql_renderer.setter
+    def sql_renderer(self, renderer: Optional[Type[BaseRenderer]]) -> None:
+        self._sql_renderer = renderer
+
+    @property
+    def dbml_renderer(self) -> Type[BaseRenderer]:
+        if self._dbml_renderer is None:
+            from .renderer.dbml.default import DefaultDBMLRenderer
+            self._dbml_renderer = DefaultDBMLRenderer
+        return self._dbml_renderer
+
+    @dbml_renderer.setter
+    def dbml_renderer(self, renderer: Optional[Type[BaseRenderer]]) -> None:
+        self._dbml_renderer = renderer
+
     @property
     def sql(self):
-        '''Returs SQL of the parsed results'''
-        return self.sql_renderer.render_db(self)
+        '''Returs SQL of the parsed results, cached until the database changes'''
+        renderer = self.sql_renderer
+        return self._cached_render(self, renderer, lambda: renderer.render_db(self))
 
     @property
     def dbml(self):
-        '''Generates DBML code out of parsed results'''
-        return self.dbml_renderer.render_db(self)
+        '''Generates DBML code out of parsed results, cached until the database changes'''
+        renderer = self.dbml_renderer
+        return self._cached_render(self, renderer, lambda: renderer.render_db(self))
+
+    @staticmethod
+    def _write(pieces: Iterator[str], fp: TextIO) -> None:
+        for i, piece in enumerate(pieces):
+            if i:
+                fp.write('\n\n')
+            fp.write(piece)
+
+    def write_sql(self, fp: TextIO) -> None:
+        '''
+        Write SQL of the database to a text file object. Objects are rendered
+        and written one at a time, the whole output is never held in memory.
+        '''
+        self._write(self.sql_renderer.iter_render_db(self), fp)
+
+    def write_dbml(self, fp: TextIO) -> None:
+        '''Write DBML of the database to a text file object, one object at a time.'''
+        self._write(self.dbml_renderer.iter_render_db(self), fp)
+
+    def dump_snapshot(self, path: Union[str, Path]) -> None:
+        '''Save the database to a binary snapshot file, see `pydbml.snapshot`.'''
+        dump_snapshot(self, path)
+
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: Union[str, Path],
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+    ) -> 'Database':
+        '''Load a database from a snapshot file, without parsing.'''
+        return load_snapshot(path, sql_renderer=sql_renderer, dbml_renderer=dbml_renderer)
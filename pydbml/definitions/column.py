@@ -1,6 +1,6 @@
 import pyparsing as pp
 
-from .common import _, _c, c, n, note, pk, unique
+from .common import _, _c, c, n, note, pk, source_span, span_end, unique
 from .generic import (
     boolean_literal,
     expression,
@@ -16,9 +16,11 @@ from pydbml.parser.blueprints import ColumnBlueprint
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 type_args = ("(" + pp.original_text_for(expression) + ")")
+type_args.set_name('type_args')
 
 # column type is parsed as a single string, it will be split by blueprint
 column_type = pp.Combine((name + pp.Literal('[]')) | (name + '.' + name) | ((name) + type_args[0, 1]))
+column_type.set_name('column_type')
 
 default = pp.CaselessLiteral('default:').suppress() + _ - (
     string_literal
@@ -34,8 +36,10 @@ default = pp.CaselessLiteral('default:').suppress() + _ - (
         lambda s, loc, tok: float(''.join(tok[0])) if '.' in tok[0] else int(tok[0])
     )
 )
+default.set_name('default')
 
 prop = name + pp.Suppress(":") + string_literal
+prop.set_name('prop')
 
 column_setting = _ + (
     pp.CaselessLiteral("not null").set_parse_action(
@@ -51,9 +55,10 @@ column_setting = _ + (
     | note('note')
     | ref_inline('ref*')
     | default('default')
-) + _
+).set_name('column_setting') + _
 
 column_setting_with_property = column_setting | prop.set_results_name('property', list_all_matches=True)
+column_setting_with_property.set_name('column_setting_with_property')
 
 column_settings = '[' - column_setting + ("," + column_setting)[...] + ']' + c
 
@@ -88,16 +93,19 @@ def parse_column_settings(s, loc, tok):
 
 column_settings.set_parse_action(parse_column_settings)
 column_settings_with_properties.set_parse_action(parse_column_settings)
+column_settings.set_name('column_settings')
+column_settings_with_properties.set_name('column_settings_with_properties')
 
 
 constraint = pp.CaselessLiteral("unique") | pp.CaselessLiteral("pk")
+constraint.set_name('constraint')
 
 table_column = _c + (
     name('name')
     + column_type('type')
     + constraint[...]('constraints') + c
     + column_settings('settings')[0, 1]
-) + n
+) + span_end + n
 
 
 table_column_with_properties = _c + (
@@ -105,7 +113,7 @@ table_column_with_properties = _c + (
     + column_type('type')
     + constraint[...]('constraints') + c
     + column_settings_with_properties('settings')[0, 1]
-) + n
+) + span_end + n
 
 
 def parse_column(s, loc, tok):
@@ -133,8 +141,10 @@ def parse_column(s, loc, tok):
         comment = '\n'.join(c[0] for c in tok['comment_before'])
         init_dict['comment'] = comment
 
-    return ColumnBlueprint(**init_dict)
+    return ColumnBlueprint(**init_dict, span=source_span(s, loc, tok))
 
 
 table_column.set_parse_action(parse_column)
 table_column_with_properties.set_parse_action(parse_column)
+table_column.set_name('table_column')
+table_column_with_properties.set_name('table_column_with_properties')
@@ -2,6 +2,8 @@ import pyparsing as pp
 
 from .generic import string_literal
 from pydbml.parser.blueprints import NoteBlueprint
+from pydbml.parser.scanner import skip_trivia
+from pydbml.parser.span import SourceSpan
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
@@ -9,6 +11,7 @@ comment = (
     pp.Suppress("//") + pp.SkipTo(pp.LineEnd())
     | pp.Suppress('/*') + ... + pp.Suppress('*/')
 )
+comment.set_name('comment')
 
 # optional comment or newline
 _ = ('\n' | comment)[...].suppress()
@@ -23,14 +26,27 @@ n = pp.LineEnd()
 
 end = comment[...].suppress() + n | pp.StringEnd()
 
+# zero-width element which returns its position, marks the end of a span
+span_end = pp.Empty().leave_whitespace().set_parse_action(lambda s, loc, tok: loc)('span_end')
+
+
+def source_span(s, loc, tok) -> SourceSpan:
+    '''
+    Span of the element from its first token (after the captured comments)
+    to the span_end marker.
+    '''
+    return SourceSpan(skip_trivia(s, loc), tok['span_end'])
+
 # obligatory newline
 # n = pp.Suppress('\n')[1, ...]
 
 note = pp.CaselessLiteral("note:") + _ - string_literal('text')
 note.set_parse_action(lambda s, loc, tok: NoteBlueprint(tok['text']))
+note.set_name('note')
 
 note_object = pp.CaselessLiteral('note') + _ - '{' + _ - string_literal('text') + _ - '}'
 note_object.set_parse_action(lambda s, loc, tok: NoteBlueprint(tok['text']))
+note_object.set_name('note_object')
 
 pk = pp.CaselessLiteral("pk")
 unique = pp.CaselessLiteral("unique")
@@ -1,6 +1,6 @@
 import pyparsing as pp
 
-from .common import _, _c, c, end, n, note
+from .common import _, _c, c, end, n, note, source_span, span_end
 from .generic import name
 from pydbml.parser.blueprints import EnumBlueprint
 from pydbml.parser.blueprints import EnumItemBlueprint
@@ -23,6 +23,7 @@ def parse_enum_settings(s, loc, tok):
 
 
 enum_settings.set_parse_action(parse_enum_settings)
+enum_settings.set_name('enum_settings')
 
 enum_item = _c + (name('name') + c + enum_settings('settings')[0, 1])
 
@@ -45,10 +46,13 @@ def parse_enum_item(s, loc, tok):
 
 
 enum_item.set_parse_action(parse_enum_item)
+enum_item.set_name('enum_item')
 
 enum_body = enum_item[1, ...]
+enum_body.set_name('enum_body')
 
 enum_name = pp.Combine(name("schema") + '.' + name("name")) | name("name")
+enum_name.set_name('enum_name')
 
 enum = _c + (
     pp.CaselessLiteral('enum')
@@ -56,7 +60,7 @@ enum = _c + (
     - '{'
     + enum_body('items') + n
     - '}'
-) + end
+) + span_end + end
 
 
 def parse_enum(s, loc, tok):
@@ -80,7 +84,8 @@ def parse_enum(s, loc, tok):
         comment = '\n'.join(c[0] for c in tok['comment_before'])
         init_dict['comment'] = comment
 
-    return EnumBlueprint(**init_dict)
+    return EnumBlueprint(**init_dict, span=source_span(s, loc, tok))
 
 
 enum.set_parse_action(parse_enum)
+enum.set_name('enum')
@@ -5,6 +5,7 @@ from pydbml.parser.blueprints import ExpressionBlueprint
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 name = pp.Word(pp.unicode.alphanums + '_') | pp.QuotedString('"')
+name.set_name('name')
 
 # Literals
 
@@ -13,23 +14,27 @@ string_literal = (
     ^ pp.QuotedString('"', escChar="\\")
     ^ pp.QuotedString("'''", escChar="\\", multiline=True)
 )
+string_literal.set_name('string_literal')
 expression_literal = pp.Combine(
     pp.Suppress('`')
     + pp.CharsNotIn('`')[...]
     + pp.Suppress('`')
 ).set_parse_action(lambda s, lok, tok: ExpressionBlueprint(tok[0]))
+expression_literal.set_name('expression_literal')
 
 boolean_literal = (
     pp.CaselessLiteral('true')
     | pp.CaselessLiteral('false')
     | pp.CaselessLiteral('NULL')
 )
+boolean_literal.set_name('boolean_literal')
 number_literal = (
     pp.Word(pp.nums)
     ^ pp.Combine(
         pp.Word(pp.nums) + '.' + pp.Word(pp.nums)
     )
 )
+number_literal.set_name('number_literal')
 
 # Expression
 
@@ -42,3 +47,4 @@ factor = (
     | expr_chars
 )
 expression << factor[...]
+expression.set_name('expression')
@@ -1,6 +1,6 @@
 import pyparsing as pp
 
-from .common import _, _c, c, note, pk, unique
+from .common import _, _c, c, note, pk, source_span, span_end, unique
 from .generic import expression_literal, name, string_literal
 from pydbml.parser.blueprints import ExpressionBlueprint, IndexBlueprint
 
@@ -14,13 +14,14 @@ index_type = pp.CaselessLiteral("type:").suppress() + _ - (
     pp.CaselessLiteral("hash")('type') |
     pp.CaselessLiteral("spgist")('type')
 )
+index_type.set_name('index_type')
 index_setting = _ + (
     unique('unique')
     | index_type
     | pp.CaselessLiteral("name:") + _ - string_literal('name')
     | note('note')
     | pk('pk')
-) + _
+).set_name('index_setting') + _
 index_settings = (
     '[' + index_setting + (',' - index_setting)[...] - ']' + c
 )
@@ -47,8 +48,10 @@ def parse_index_settings(s, lok, tok):
 
 
 index_settings.set_parse_action(parse_index_settings)
+index_settings.set_name('index_settings')
 
 subject = name | expression_literal
+subject.set_name('subject')
 composite_index_syntax = (
     pp.Suppress('(')
     + subject + (
@@ -57,9 +60,11 @@ composite_index_syntax = (
     )[...]
     + pp.Suppress(')')
 )('subject') + c + index_settings('settings')[0, 1]
+composite_index_syntax.set_name('composite_index_syntax')
 
 single_index_syntax = subject('subject') + c + index_settings('settings')[0, 1]
-index = _c + (single_index_syntax ^ composite_index_syntax) + c
+single_index_syntax.set_name('single_index_syntax')
+index = _c + (single_index_syntax ^ composite_index_syntax) + c + span_end
 
 indexes = (
     pp.CaselessLiteral('indexes').suppress() + _
@@ -67,6 +72,7 @@ indexes = (
     - index[1, ...] + _
     + pp.Suppress('}')
 )
+indexes.set_name('indexes')
 
 
 def parse_index(s, lok, tok):
@@ -96,7 +102,8 @@ def parse_index(s, lok, tok):
     if 'comment' not in init_dict and 'comment_before' in tok:
         comment = '\n'.join(c[0] for c in tok['comment_before'])
         init_dict['comment'] = comment
-    return IndexBlueprint(**init_dict)
+    return IndexBlueprint(**init_dict, span=source_span(s, lok, tok))
 
 
 index.set_parse_action(parse_index)
+index.set_name('index')
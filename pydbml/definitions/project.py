@@ -1,14 +1,16 @@
 import pyparsing as pp
 
-from .common import _, _c, c, n, note, note_object
+from .common import _, _c, c, n, note, note_object, source_span, span_end
 from .generic import name, string_literal
 from pydbml.parser.blueprints import NoteBlueprint, ProjectBlueprint
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 project_field = pp.Group(name + _ + pp.Suppress(':') + _ - string_literal)
+project_field.set_name('project_field')
 
 project_element = _ + (note | note_object | project_field) + _
+project_element.set_name('project_element')
 
 project_body = project_element[...]
 
@@ -18,7 +20,7 @@ project = _c + (
     + '{' + _
     - project_body('items') + _
     - '}'
-) + (n | pp.StringEnd())
+) + span_end + (n | pp.StringEnd())
 
 
 def parse_project(s, loc, tok):
@@ -41,7 +43,8 @@ def parse_project(s, loc, tok):
     if 'comment_before' in tok:
         comment = '\n'.join(c[0] for c in tok['comment_before'])
         init_dict['comment'] = comment
-    return ProjectBlueprint(**init_dict)
+    return ProjectBlueprint(**init_dict, span=source_span(s, loc, tok))
 
 
 project.set_parse_action(parse_project)
+project.set_name('project')
@@ -1,12 +1,13 @@
 import pyparsing as pp
 
-from .common import _, _c, c, n
+from .common import _, _c, c, n, source_span, span_end
 from .generic import name
 from pydbml.parser.blueprints import ReferenceBlueprint
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 relation = pp.oneOf("> - < <>")
+relation.set_name('relation')
 
 col_name = (
     (
@@ -15,8 +16,9 @@ col_name = (
         name('table') + '.' + name('field')
     )
 )
+col_name.set_name('col_name')
 
-ref_inline = pp.Literal("ref:") - relation('type') - col_name
+ref_inline = pp.Literal("ref:") - relation('type') - col_name + span_end
 
 
 def parse_inline_relation(s, loc, tok):
@@ -33,10 +35,11 @@ def parse_inline_relation(s, loc, tok):
     }
     if 'schema' in tok:
         result['schema2'] = tok['schema']
-    return ReferenceBlueprint(**result)
+    return ReferenceBlueprint(**result, span=source_span(s, loc, tok))
 
 
 ref_inline.set_parse_action(parse_inline_relation)
+ref_inline.set_name('ref_inline')
 
 on_option = (
     pp.CaselessLiteral('no action')
@@ -45,10 +48,13 @@ on_option = (
     | pp.CaselessLiteral('set null')
     | pp.CaselessLiteral('set default')
 )
+on_option.set_name('on_option')
 update = pp.CaselessLiteral("update:").suppress() + _ + on_option
 delete = pp.CaselessLiteral("delete:").suppress() + _ + on_option
+update.set_name('update')
+delete.set_name('delete')
 
-ref_setting = _ + (update('update') | delete('delete')) + _
+ref_setting = _ + (update('update') | delete('delete')).set_name('ref_setting') + _
 
 ref_settings = (
     '['
@@ -76,6 +82,7 @@ def parse_ref_settings(s, loc, tok):
 
 
 ref_settings.set_parse_action(parse_ref_settings)
+ref_settings.set_name('ref_settings')
 
 composite_name = (
     '(' + pp.White()[...]
@@ -87,7 +94,9 @@ composite_name = (
     )[...]
     + ')'
 )
+composite_name.set_name('composite_name')
 name_or_composite = name | pp.Combine(composite_name)
+name_or_composite.set_name('name_or_composite')
 
 ref_cols = (
     (
@@ -119,6 +128,7 @@ def parse_ref_cols(s, loc, tok):
 
 
 ref_cols.set_parse_action(parse_ref_cols)
+ref_cols.set_name('ref_cols')
 
 ref_body = (
     ref_cols('col1')
@@ -138,14 +148,14 @@ ref_body = (
 # )
 
 
-ref_short = _c + pp.CaselessLiteral('ref') + name('name')[0, 1] + ':' - ref_body
+ref_short = _c + pp.CaselessLiteral('ref') + name('name')[0, 1] + ':' - ref_body + span_end
 ref_long = _c + (
     pp.CaselessLiteral('ref') + _
     + name('name')[0, 1] + _
     + '{' + _
     - ref_body + _
     - '}'
-)
+) + span_end
 
 
 def parse_ref(s, loc, tok):
@@ -181,11 +191,14 @@ def parse_ref(s, loc, tok):
         comment = '\n'.join(c[0] for c in tok['comment_before'])
         init_dict['comment'] = comment
 
-    ref = ReferenceBlueprint(**init_dict)
+    ref = ReferenceBlueprint(**init_dict, span=source_span(s, loc, tok))
     return ref
 
 
 ref_short.set_parse_action(parse_ref)
 ref_long.set_parse_action(parse_ref)
+ref_short.set_name('ref_short')
+ref_long.set_name('ref_long')
 
 ref = ref_short | ref_long + (n | pp.StringEnd())
+ref.set_name('ref')
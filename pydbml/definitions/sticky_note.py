@@ -1,10 +1,10 @@
 import pyparsing as pp
 
-from .common import _, end, _c
+from .common import _, end, _c, source_span, span_end
 from .generic import string_literal, name
 from ..parser.blueprints import StickyNoteBlueprint
 
-sticky_note = _c + pp.CaselessLiteral('note') + _ + (name('name') + _ - '{' + _ - string_literal('text') + _ - '}') + end
+sticky_note = _c + pp.CaselessLiteral('note') + _ + (name('name') + _ - '{' + _ - string_literal('text') + _ - '}') + span_end + end
 
 
 def parse_sticky_note(s, loc, tok):
@@ -15,7 +15,8 @@ def parse_sticky_note(s, loc, tok):
     '''
     init_dict = {'name': tok['name'], 'text': tok['text']}
 
-    return StickyNoteBlueprint(**init_dict)
+    return StickyNoteBlueprint(**init_dict, span=source_span(s, loc, tok))
 
 
 sticky_note.set_parse_action(parse_sticky_note)
+sticky_note.set_name('sticky_note')
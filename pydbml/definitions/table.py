@@ -2,20 +2,22 @@ import pyparsing as pp
 
 from pydbml.parser.blueprints import TableBlueprint
 from .column import table_column, table_column_with_properties
-from .common import _, _c, end, hex_color, note, note_object
+from .common import _, _c, end, hex_color, note, note_object, source_span, span_end
 from .generic import name, string_literal
 from .index import indexes
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 alias = pp.WordStart() + pp.Literal('as').suppress() - pp.WordEnd() - name
+alias.set_name('alias')
 
 
 header_color = (
     pp.CaselessLiteral('headercolor:').suppress() + _
     - pp.Combine(hex_color)('header_color')
 )
-table_setting = _ + (note('note') | header_color) + _
+header_color.set_name('header_color')
+table_setting = _ + (note('note') | header_color).set_name('table_setting') + _
 table_settings = '[' + table_setting + (',' + table_setting)[...] + ']'
 
 
@@ -32,28 +34,34 @@ def parse_table_settings(s, loc, tok):
 
 
 table_settings.set_parse_action(parse_table_settings)
+table_settings.set_name('table_settings')
 
 
 note_element = note | note_object
+note_element.set_name('note_element')
 
 prop = name + pp.Suppress(":") + string_literal
+prop.set_name('prop')
 
 table_element = _ + (
     table_column.set_results_name('columns', list_all_matches=True) |
     note_element('note') |
     indexes.set_results_name('indexes', list_all_matches=True)
 ) + _
+table_element.set_name('table_element')
 table_element_with_property = _ + (
     table_column_with_properties.set_results_name('columns', list_all_matches=True) |
     note_element('note') |
     indexes.set_results_name('indexes', list_all_matches=True) |
     prop.set_results_name('property', list_all_matches=True)
 ) + _
+table_element_with_property.set_name('table_element_with_property')
 
 table_body = table_element[...]
 table_body_with_properties = table_element_with_property[...]
 
 table_name = (name('schema') + '.' + name('name')) | (name('name'))
+table_name.set_name('table_name')
 
 table = _c + (
     pp.CaselessLiteral("table").suppress()
@@ -61,7 +69,7 @@ table = _c + (
     + alias('alias')[0, 1]
     + table_settings('settings')[0, 1] + _
     + '{' - table_body + _ + '}'
-) + end
+) + span_end + end
 
 table_with_properties = _c + (
     pp.CaselessLiteral("table").suppress()
@@ -69,7 +77,7 @@ table_with_properties = _c + (
     + alias('alias')[0, 1]
     + table_settings('settings')[0, 1] + _
     + '{' - table_body_with_properties + _ + '}'
-) + end
+) + span_end + end
 
 
 def parse_table(s, loc, tok):
@@ -110,10 +118,12 @@ def parse_table(s, loc, tok):
     if not init_dict.get('columns'):
         raise SyntaxError(f'Table {init_dict["name"]} at position {loc} has no columns!')
 
-    result = TableBlueprint(**init_dict)
+    result = TableBlueprint(**init_dict, span=source_span(s, loc, tok))
 
     return result
 
 
 table.set_parse_action(parse_table)
 table_with_properties.set_parse_action(parse_table)
+table.set_name('table')
+table_with_properties.set_name('table_with_properties')
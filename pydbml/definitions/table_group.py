@@ -1,15 +1,18 @@
 import pyparsing as pp
 
 from pydbml.parser.blueprints import TableGroupBlueprint, NoteBlueprint
-from .common import _, _c, end, hex_color, note, note_object
+from .common import _, _c, end, hex_color, note, note_object, source_span, span_end
 from .generic import name
 
 pp.ParserElement.set_default_whitespace_chars(' \t\r')
 
 table_name = pp.Combine(name + '.' + name) | name
+table_name.set_name('table_name')
 note_element = note | note_object
+note_element.set_name('note_element')
 
 tg_element = _ + (note_element('note') | table_name.set_results_name('items', list_all_matches=True)) + _
+tg_element.set_name('tg_element')
 
 tg_body = tg_element[...]
 
@@ -18,9 +21,11 @@ tg_color = (
     pp.CaselessLiteral('color:').suppress() + _
     - pp.Combine(hex_color)('color')
 )
-tg_setting = _ + (note('note') | tg_color) + _
+tg_color.set_name('tg_color')
+tg_setting = _ + (note('note') | tg_color).set_name('tg_setting') + _
 
 tg_settings = '[' + tg_setting + (',' + tg_setting)[...] + ']'
+tg_settings.set_name('tg_settings')
 
 table_group = _c + (
     pp.CaselessLiteral('TableGroup')
@@ -29,7 +34,7 @@ table_group = _c + (
     - '{' + _
     - tg_body + _
     - '}'
-) + end
+) + span_end + end
 
 
 def parse_table_group(s, loc, tok):
@@ -52,7 +57,8 @@ def parse_table_group(s, loc, tok):
         init_dict['note'] = note if isinstance(note, NoteBlueprint) else note[0]
     if 'color' in tok:
         init_dict['color'] = tok['color']
-    return TableGroupBlueprint(**init_dict)
+    return TableGroupBlueprint(**init_dict, span=source_span(s, loc, tok))
 
 
 table_group.set_parse_action(parse_table_group)
+table_group.set_name('table_group')
@@ -1,3 +1,6 @@
+from typing import Dict
+
+
 class TableNotFoundError(Exception):
     pass
 
@@ -32,3 +35,58 @@ class DatabaseValidationError(Exception):
 
 class ValidationError(Exception):
     pass
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class SourceFileError(Exception):
+    '''
+    Error in one of the files of a multi-file schema. `path` is the file,
+    `error` is the original exception, which is also the cause.
+
+    Parsers raise it with `wrap`, which makes the error an instance of the
+    original exception type too, so `except TableNotFoundError` or
+    `except pyparsing.ParseException` still catch it.
+    '''
+
+    def __init__(self, path: str, error: Exception):
+        super().__init__(path, error)
+        self.path = path
+        self.error = error
+
+    def __str__(self):
+        return f'{self.path}: {self.error}'
+
+    def __reduce__(self):
+        return SourceFileError.wrap, (self.path, self.error)
+
+    @classmethod
+    def wrap(cls, path: str, error: Exception) -> 'SourceFileError':
+        '''SourceFileError, which is also a copy of the error.'''
+        error_type = type(error)
+        try:
+            wrapper = _wrapper_types.get(error_type)
+            if wrapper is None:
+                wrapper = _wrapper_types[error_type] = type(
+                    error_type.__name__,
+                    (cls, error_type),
+                    {'__slots__': (), '__module__': error_type.__module__}
+                )
+            result = wrapper.__new__(wrapper, *error.args)
+            error_type.__init__(result, *error.args)
+        except Exception:
+            # can't be recreated from its args, raise it as the cause only
+            return cls(path, error)
+        for klass in error_type.__mro__:
+            for name in klass.__dict__.get('__slots__', ()):
+                if hasattr(error, name):
+                    setattr(result, name, getattr(error, name))
+        result.__dict__.update(error.__dict__)
+        result.path = path
+        result.error = error
+        return result
+
+
+_wrapper_types: Dict[type, type] = {}
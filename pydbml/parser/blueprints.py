@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
-from typing import Collection
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Literal
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 
 from pydbml.classes import (
@@ -22,10 +24,20 @@ from pydbml.classes import (
 from pydbml._classes.sticky_note import StickyNote
 from pydbml.exceptions import ColumnNotFoundError, TableNotFoundError, ValidationError
 from pydbml.tools import remove_indentation, strip_empty_lines
+from .span import SourceSpan
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .parser import PyDBMLParser
 
 
 class Blueprint:
-    parser = None
+    parser: Optional['PyDBMLParser'] = None
+    span: Optional[SourceSpan] = None
+
+    def iter_spans(self) -> Iterator[SourceSpan]:
+        '''Spans of this blueprint and of the nested ones.'''
+        if self.span is not None:
+            yield self.span
 
 
 @dataclass
@@ -47,6 +59,7 @@ class NoteBlueprint(Blueprint):
 class StickyNoteBlueprint(Blueprint):
     name: str
     text: str
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     def _preformat_text(self) -> str:
         '''Preformat the note text for idempotence'''
@@ -75,13 +88,14 @@ class ReferenceBlueprint(Blueprint):
     name: Optional[str] = None
     schema1: str = 'public'
     table1: Optional[str] = None
-    col1: Optional[Union[str, Collection[str]]] = None
+    col1: Optional[str] = None
     schema2: str = 'public'
     table2: Optional[str] = None
-    col2: Optional[Union[str, Collection[str]]] = None
+    col2: Optional[str] = None
     comment: Optional[str] = None
     on_update: Optional[str] = None
     on_delete: Optional[str] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     def build(self) -> 'Reference':
         '''
@@ -108,7 +122,7 @@ class ReferenceBlueprint(Blueprint):
         col2_list = [c.strip('() ') for c in self.col2.split(',')]
         col2 = [table2[col] for col in col2_list]
 
-        return Reference(
+        result = Reference(
             type=self.type,
             inline=self.inline,
             col1=col1,
@@ -118,6 +132,8 @@ class ReferenceBlueprint(Blueprint):
             on_update=self.on_update,
             on_delete=self.on_delete
         )
+        result.span = self.span
+        return result
 
 
 @dataclass
@@ -133,31 +149,40 @@ class ColumnBlueprint(Blueprint):
     ref_blueprints: Optional[List[ReferenceBlueprint]] = None
     comment: Optional[str] = None
     properties: Optional[Dict[str, str]] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
+
+    def iter_spans(self) -> Iterator[SourceSpan]:
+        yield from super().iter_spans()
+        for ref_bp in self.ref_blueprints or []:
+            yield from ref_bp.iter_spans()
 
     def build(self) -> 'Column':
-        if isinstance(self.default, ExpressionBlueprint):
-            self.default = self.default.build()
-        if self.parser:
+        default = self.default
+        if isinstance(default, ExpressionBlueprint):
+            default = default.build()
+        type_: Union[str, Enum] = self.type
+        if self.parser and self.parser.database is not None:
             if '.' in self.type:
                 schema, name = self.type.split('.')
             else:
                 schema, name = 'public', self.type
-            for enum in self.parser.database.enums:
-                if (enum.schema, enum.name) == (schema, name):
-                    self.type = enum
-                    break
-        return Column(
+            enum = self.parser.database._find_enum(schema, name)
+            if enum is not None:
+                type_ = enum
+        result = Column(
             name=self.name,
-            type=self.type,
+            type=type_,
             unique=self.unique,
             not_null=self.not_null,
             pk=self.pk,
             autoinc=self.autoinc,
-            default=self.default,
+            default=default,
             note=self.note.build() if self.note else None,
             comment=self.comment,
             properties=self.properties,
         )
+        result.span = self.span
+        return result
 
 
 @dataclass
@@ -179,11 +204,12 @@ class IndexBlueprint(Blueprint):
     pk: bool = False
     note: Optional[NoteBlueprint] = None
     comment: Optional[str] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     table = None
 
     def build(self) -> 'Index':
-        return Index(
+        result = Index(
             # TableBlueprint will process subjects
             subjects=[],
             name=self.name,
@@ -193,6 +219,8 @@ class IndexBlueprint(Blueprint):
             note=self.note.build() if self.note else None,
             comment=self.comment
         )
+        result.span = self.span
+        return result
 
 
 @dataclass
@@ -206,6 +234,14 @@ class TableBlueprint(Blueprint):
     header_color: Optional[str] = None
     comment: Optional[str] = None
     properties: Optional[Dict[str, str]] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
+
+    def iter_spans(self) -> Iterator[SourceSpan]:
+        yield from super().iter_spans()
+        for col_bp in self.columns or []:
+            yield from col_bp.iter_spans()
+        for index_bp in self.indexes or []:
+            yield from index_bp.iter_spans()
 
     def build(self) -> 'Table':
         result = Table(
@@ -217,6 +253,7 @@ class TableBlueprint(Blueprint):
             comment=self.comment,
             properties=self.properties
         )
+        result.span = self.span
         columns = self.columns or []
         indexes = self.indexes or []
         for col_bp in columns:
@@ -228,15 +265,13 @@ class TableBlueprint(Blueprint):
                 if isinstance(subj, ExpressionBlueprint):
                     new_subjects.append(subj.build())
                 else:
-                    for col in result.columns:
-                        if col.name == subj:
-                            new_subjects.append(col)
-                            break
-                    else:
+                    col = result.get(subj)
+                    if col is None:
                         raise ColumnNotFoundError(
                             f'Cannot add index, column "{subj}" not defined in'
-                            ' table "{self.name}".'
+                            f' table "{self.name}".'
                         )
+                    new_subjects.append(col)
             index.subjects = new_subjects
             result.add_index(index)
         return result
@@ -273,14 +308,17 @@ class EnumBlueprint(Blueprint):
     items: List[EnumItemBlueprint]
     schema: str = 'public'
     comment: Optional[str] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     def build(self) -> 'Enum':
-        return Enum(
+        result = Enum(
             name=self.name,
             items=[ei.build() for ei in self.items],
             schema=self.schema,
             comment=self.comment
         )
+        result.span = self.span
+        return result
 
 
 @dataclass
@@ -289,6 +327,7 @@ class ProjectBlueprint(Blueprint):
     items: Optional[Dict[str, str]] = None
     note: Optional[NoteBlueprint] = None
     comment: Optional[str] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     def build(self) -> 'Project':
         return Project(
@@ -306,17 +345,21 @@ class TableGroupBlueprint(Blueprint):
     comment: Optional[str] = None
     note: Optional[NoteBlueprint] = None
     color: Optional[str] = None
+    span: Optional[SourceSpan] = field(default=None, compare=False, repr=False)
 
     def build(self) -> 'TableGroup':
         if not self.parser:
             raise RuntimeError('Parser is not set')
         items = []
+        seen = set()
         for table_name in self.items:
             components = table_name.split('.')
             schema, table = components if len(components) == 2 else ('public', components[0])
             table_obj = self.parser.locate_table(schema, table)
-            if table_obj in items:
+            # the same table may be spelled by its name and by its alias
+            if id(table_obj) in seen:
                 raise ValidationError(f'Table "{table}" is already in group "{self.name}"')
+            seen.add(id(table_obj))
             items.append(table_obj)
         return TableGroup(
             name=self.name,
@@ -0,0 +1,136 @@
+'''
+On-disk cache of parse results.
+
+Parsed databases are stored as snapshots (see `pydbml.snapshot`) under a
+key computed from the source text, the pydbml version, the snapshot format
+and the `allow_properties` flag, so a changed source or a new pydbml version
+never gets a stale result. Files are written atomically, several processes
+can share one cache directory. When the directory grows over `max_size`
+bytes, the least recently used entries are removed.
+'''
+import hashlib
+import os
+import tempfile
+
+from pathlib import Path
+from typing import Optional
+from typing import Type
+from typing import Union
+
+from pydbml.database import Database
+from pydbml.exceptions import SnapshotError
+from pydbml.renderer.base import BaseRenderer
+from pydbml.snapshot import FORMAT_VERSION
+from pydbml.snapshot import dumps
+from pydbml.snapshot import loads
+
+
+CACHE_DIR_ENV = 'PYDBML_CACHE_DIR'
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+SUFFIX = '.snapshot'
+
+
+def get_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return 'unknown'
+    try:
+        return version('pydbml')
+    except PackageNotFoundError:
+        return 'unknown'
+
+
+class ParseCache:
+    def __init__(self, directory: Union[str, Path], max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+
+    @classmethod
+    def from_option(cls, cache_dir: Optional[Union[str, Path]] = None) -> Optional['ParseCache']:
+        '''
+        Cache for the `cache_dir` argument, falling back to the PYDBML_CACHE_DIR
+        environment variable. None if neither is set.
+        '''
+        directory = cache_dir or os.environ.get(CACHE_DIR_ENV)
+        return cls(directory) if directory else None
+
+    def key(self, source: str, allow_properties: bool = False) -> str:
+        header = f'{get_version()}\0{FORMAT_VERSION}\0{int(allow_properties)}\0'
+        return hashlib.sha256((header + source).encode('utf8')).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f'{key}{SUFFIX}'
+
+    def get(
+        self,
+        key: str,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None
+    ) -> Optional[Database]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        try:
+            result = loads(data, sql_renderer=sql_renderer, dbml_renderer=dbml_renderer)
+        except SnapshotError:
+            # written by an incompatible version or damaged, parse again
+            self._remove(path)
+            return None
+        try:
+            # mtime is the last use time for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: str, db: Database) -> None:
+        '''
+        Store the database under the key. The cache is best effort: if the
+        directory can't be written (read-only, full disk), nothing is stored.
+        '''
+        try:
+            data = dumps(db)
+        except SnapshotError:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            self._remove(Path(tmp_name))
+            return
+        except BaseException:
+            self._remove(Path(tmp_name))
+            raise
+        self.evict()
+
+    def evict(self) -> None:
+        '''Remove least recently used entries until the cache fits into max_size.'''
+        entries = []
+        for path in self.directory.glob(f'*{SUFFIX}'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_size:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
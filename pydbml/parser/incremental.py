@@ -0,0 +1,344 @@
+'''
+Incremental reparsing of edited DBML documents.
+
+IncrementalParser keeps the top-level blocks of the previous version of the
+document with their blueprints and built objects. On update, the new text is
+compared with the old one: blocks before and after the edited region are
+reused as is, the rest is split into blocks again, and only blocks with new
+text are parsed. Then the Database is updated in place: objects of removed
+and changed blocks are deleted, new ones are built, and references are
+resolved again if the tables they point to were changed.
+'''
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Type
+
+import pyparsing as pp
+
+from pydbml.classes import Reference, Table
+from pydbml.database import Database
+from pydbml.renderer.base import BaseRenderer
+from pydbml.tools import remove_bom
+from .blueprints import Blueprint
+from .blueprints import ReferenceBlueprint
+from .blueprints import TableBlueprint
+from .parser import PyDBMLParser
+from .parser import parse_block_sources
+from .scanner import ScanError
+from .scanner import iter_blocks
+from .span import LineIndex
+
+
+class ParsedBlock(NamedTuple):
+    keyword: str
+    start: int
+    end: int
+    blueprints: List[Blueprint]
+
+    def shift(self, delta: int) -> 'ParsedBlock':
+        '''Move the block and source spans of its blueprints by `delta`.'''
+        if delta:
+            for blueprint in self.blueprints:
+                for span in blueprint.iter_spans():
+                    span.bind(delta)
+        return self._replace(start=self.start + delta, end=self.end + delta)
+
+
+def common_prefix(a: str, b: str) -> int:
+    '''Length of the common prefix of two strings.'''
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix(a: str, b: str, limit: int) -> int:
+    '''Length of the common suffix of two strings, at most `limit`.'''
+    lo, hi = 0, min(len(a), len(b), limit)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def table_names(schema: str, name: str) -> Tuple[str, str]:
+    '''Keys of Database.table_dict which PyDBMLParser.locate_table looks at.'''
+    return name, f'{schema}.{name}'
+
+
+class IncrementalParser:
+    '''
+    Parser for documents which change a little between parses, like in an
+    editor.
+
+    >>> parser = IncrementalParser()
+    >>> db = parser.update('Table a {\\n  id int\\n}\\n')
+    >>> db = parser.update('Table a {\\n  id int\\n}\\nTable b {\\n  id int\\n}\\n')
+    >>> db.tables
+    [<Table 'public' 'a'>, <Table 'public' 'b'>]
+
+    `update` returns the same Database object every time, with unchanged
+    objects kept. Invalid text is handed to the full grammar, so errors are
+    the same as from PyDBML.parse (and take as long). Syntax errors are
+    raised before the database is touched. If references can't be resolved,
+    the database may be left partially updated, and the next update builds
+    it anew.
+    '''
+
+    def __init__(
+        self,
+        allow_properties: bool = False,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+    ) -> None:
+        self.source = ''
+        self.database: Optional[Database] = None
+        self._allow_properties = allow_properties
+        self._sql_renderer = sql_renderer
+        self._dbml_renderer = dbml_renderer
+        self._text = ''
+        self._blocks: List[ParsedBlock] = []
+        # source spans of all blueprints point to it, it is updated in place
+        self._lines = LineIndex('')
+        # id(blueprint) -> (blueprint, built object)
+        self._objects: Dict[int, Tuple[Blueprint, Any]] = {}
+
+    def __repr__(self):
+        return "<IncrementalParser>"
+
+    def update(self, source: str) -> Database:
+        '''Parse the new version of the document and return the updated database.'''
+        source = remove_bom(source)
+        if self.database is not None and source == self.source:
+            return self.database
+        parser = PyDBMLParser(
+            source,
+            allow_properties=self._allow_properties,
+            sql_renderer=self._sql_renderer,
+            dbml_renderer=self._dbml_renderer,
+        )
+        text = source.expandtabs()
+        try:
+            blocks: Optional[List[ParsedBlock]] = self._split(text)
+        except (ScanError, pp.ParseBaseException, SyntaxError):
+            blocks = None
+        if blocks is not None:
+            blueprints = [bp for block in blocks for bp in block.blueprints]
+        else:
+            # the full grammar raises the same error as PyDBML.parse, outside
+            # of the except clause to not chain it to the fast path error
+            parser._set_syntax()
+            blueprints = parser._parse_blueprints()
+            for blueprint in blueprints:
+                for span in blueprint.iter_spans():
+                    span.lines = self._lines
+            text, blocks = '', []
+        for blueprint in blueprints:
+            parser.add_blueprint(blueprint)
+        try:
+            self._build(parser)
+        except Exception:
+            self.database = None
+            self._objects = {}
+            self._text, self._blocks = '', []
+            raise
+        self._lines.reset(source)
+        self.source = source
+        self._text = text
+        self._blocks = blocks
+        return self.database  # type: ignore
+
+    def _split(self, text: str) -> List[ParsedBlock]:
+        '''
+        Split the text into parsed blocks. Blocks outside of the edited region
+        are taken from the previous version, blocks inside it are scanned
+        again and parsed, unless the same block text was parsed before.
+        '''
+        old_text, old_blocks = self._text, self._blocks
+        prefix = common_prefix(old_text, text)
+        suffix = common_suffix(old_text, text, min(len(old_text), len(text)) - prefix)
+        delta = len(text) - len(old_text)
+
+        # blocks which end before the edit are not affected by it
+        head = 0
+        while head < len(old_blocks) and old_blocks[head].end < prefix:
+            head += 1
+        start = old_blocks[head - 1].end if head else 0
+
+        # block boundaries in the unchanged suffix, in new text positions
+        tail_start = len(text) - suffix
+        old_starts = {
+            b.start + delta: i
+            for i, b in enumerate(old_blocks)
+            if i >= head and b.start + delta >= tail_start
+        }
+
+        scanned = []
+        tail = len(old_blocks)
+        if start not in old_starts:
+            for block in iter_blocks(text, start):
+                scanned.append(block)
+                if block.end in old_starts:
+                    tail = old_starts[block.end]
+                    break
+        else:
+            tail = old_starts[start]
+
+        # whitespace around a block doesn't change its blueprints, but moves them
+        reusable: Dict[Tuple[str, str], List[Tuple[ParsedBlock, int]]] = {}
+        for old_block in old_blocks[head:tail]:
+            block_text = old_text[old_block.start:old_block.end]
+            key = (old_block.keyword, block_text.strip())
+            content_start = old_block.start + len(block_text) - len(block_text.lstrip())
+            reusable.setdefault(key, []).append((old_block, content_start))
+
+        middle = []
+        moved = []
+        for block in scanned:
+            block_text = text[block.start:block.end]
+            key = (block.keyword, block_text.strip())
+            if reusable.get(key):
+                old_block, old_content_start = reusable[key].pop()
+                content_start = block.start + len(block_text) - len(block_text.lstrip())
+                moved.append((old_block, content_start - old_content_start))
+                blueprints = old_block.blueprints
+            else:
+                blueprints = parse_block_sources(
+                    [(block.keyword, block_text, block.start)],
+                    self._allow_properties
+                )
+                for blueprint in blueprints:
+                    for span in blueprint.iter_spans():
+                        span.lines = self._lines
+            middle.append(ParsedBlock(block.keyword, block.start, block.end, blueprints))
+
+        # everything is parsed, now spans of reused blocks can be moved
+        for old_block, block_delta in moved:
+            old_block.shift(block_delta)
+        return [
+            *old_blocks[:head],
+            *middle,
+            *(b.shift(delta) for b in old_blocks[tail:]),
+        ]
+
+    def _reuse(self, blueprint: Blueprint) -> Any:
+        entry = self._objects.get(id(blueprint))
+        if entry is not None and entry[0] is blueprint:
+            return entry[1]
+        return None
+
+    def _build(self, parser: PyDBMLParser) -> None:
+        if self.database is None:
+            self.database = Database(
+                allow_properties=self._allow_properties,
+                sql_renderer=self._sql_renderer,
+                dbml_renderer=self._dbml_renderer,
+            )
+            self._objects = {}
+        db = self.database
+        parser.database = db
+        objects: Dict[int, Tuple[Blueprint, Any]] = {}
+
+        def keep(blueprints: Iterable[Blueprint], ok=lambda bp, obj: True) -> Set[int]:
+            kept = set()
+            for bp in blueprints:
+                obj = self._reuse(bp)
+                if obj is not None and ok(bp, obj):
+                    objects[id(bp)] = (bp, obj)
+                    kept.add(id(obj))
+            return kept
+
+        # enums
+        kept_enums = keep(parser.enums)
+        changed_enums = set()
+        for enum in list(db.enums):
+            if id(enum) not in kept_enums:
+                db.delete_enum(enum)
+                changed_enums.add((enum.schema, enum.name))
+        for enum_bp in parser.enums:
+            if id(enum_bp) not in objects:
+                enum = db.add_enum(enum_bp.build())
+                objects[id(enum_bp)] = (enum_bp, enum)
+                changed_enums.add((enum.schema, enum.name))
+
+        # tables, rebuilt if their column types may resolve to other enums
+        def same_enums(table_bp: TableBlueprint, table: Table) -> bool:
+            for col_bp in table_bp.columns or []:
+                schema, _, name = col_bp.type.rpartition('.')
+                if (schema or 'public', name) in changed_enums:
+                    return False
+            return True
+
+        kept_tables = keep(parser.tables, same_enums)
+        removed_tables = set()
+        changed_names: Set[str] = set()
+        for table in list(db.tables):
+            if id(table) not in kept_tables:
+                db.delete_table(table)
+                removed_tables.add(id(table))
+                changed_names.update(table_names(table.schema, table.name))
+                if table.alias:
+                    changed_names.add(table.alias)
+        for table_bp in parser.tables:
+            if id(table_bp) not in objects:
+                table = db.add_table(table_bp.build())
+                objects[id(table_bp)] = (table_bp, table)
+                changed_names.update(table_names(table.schema, table.name))
+                if table.alias:
+                    changed_names.add(table.alias)
+
+        # references, resolved again if their tables changed
+        def same_tables(ref_bp: ReferenceBlueprint, ref: Reference) -> bool:
+            tables = (c.table for c in (*ref.col1, *ref.col2))
+            if any(id(table) in removed_tables for table in tables):
+                return False
+            names = (
+                *table_names(ref_bp.schema1, ref_bp.table1),  # type: ignore
+                *table_names(ref_bp.schema2, ref_bp.table2),  # type: ignore
+            )
+            return not changed_names.intersection(names)
+
+        kept_refs = keep(parser.refs, same_tables)
+        for ref in list(db.refs):
+            if id(ref) not in kept_refs:
+                db.delete_reference(ref)
+
+        # table groups, sticky notes and project are few and cheap to build
+        for table_group in list(db.table_groups):
+            db.delete_table_group(table_group)
+        for sticky_note in list(db.sticky_notes):
+            db.delete_sticky_note(sticky_note)
+        if db.project is not None:
+            db.delete_project()
+        for table_group_bp in parser.table_groups:
+            db.add_table_group(table_group_bp.build())
+        for note_bp in parser.sticky_notes:
+            db.add_sticky_note(note_bp.build())
+        if parser.project:
+            db.add_project(parser.project.build())
+
+        for ref_bp in parser.refs:
+            if id(ref_bp) not in objects:
+                objects[id(ref_bp)] = (ref_bp, db.add_reference(ref_bp.build()))
+
+        # keep the source order, like PyDBMLParser.build_database
+        db.enums[:] = [objects[id(bp)][1] for bp in parser.enums]
+        db.tables[:] = [objects[id(bp)][1] for bp in parser.tables]
+        db.refs[:] = [objects[id(bp)][1] for bp in parser.refs]
+        db._reset_ref_index()
+        # the order is a part of the fingerprint and of the rendered database
+        db._invalidate_fingerprint()
+        self._objects = objects
@@ -1,9 +1,21 @@
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from contextlib import nullcontext
+from functools import lru_cache
 from io import TextIOWrapper
+from itertools import repeat
 from pathlib import Path
+from threading import RLock
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -18,12 +30,18 @@ from pydbml.definitions.reference import ref
 from pydbml.definitions.sticky_note import sticky_note
 from pydbml.definitions.table import table, table_with_properties
 from pydbml.definitions.table_group import table_group
+from pydbml.exceptions import SourceFileError
 from pydbml.exceptions import TableNotFoundError
 from pydbml.renderer.base import BaseRenderer
-from pydbml.renderer.dbml.default import DefaultDBMLRenderer
-from pydbml.renderer.sql.default import DefaultSQLRenderer
 from pydbml.tools import remove_bom
+from .cache import ParseCache
+from .profiler import ParseProfile
+from .scanner import KEYWORDS
+from .scanner import ScanError
+from .scanner import split_blocks
+from .span import LineIndex
 from .blueprints import (
+    Blueprint,
     EnumBlueprint,
     StickyNoteBlueprint,
     ProjectBlueprint,
@@ -35,6 +53,132 @@ from .blueprints import (
 pp.ParserElement.set_default_whitespace_chars(" \t\r")
 
 
+@lru_cache(maxsize=None)
+def get_syntax(allow_properties: bool = False) -> pp.ParserElement:
+    """
+    Return the top-level DBML grammar.
+
+    The grammar is built once for each `allow_properties` value and shared
+    between all parsers, so it holds no per-parse state. Parsed blueprints are
+    returned as tokens and collected by the parser which called it.
+    """
+    table_expr = table_with_properties if allow_properties else table
+    expr = (
+        table_expr
+        | ref
+        | enum
+        | table_group
+        | project
+        | sticky_note
+    )
+    syntax = expr[...] + ("\n" | comment)[...].suppress() + pp.StringEnd()
+    syntax.streamline()
+    return syntax
+
+
+@lru_cache(maxsize=None)
+def get_block_syntax(keyword: str, allow_properties: bool = False) -> pp.ParserElement:
+    """
+    Return the grammar for a single top-level block, starting with `keyword`
+    (see scanner.KEYWORDS).
+    """
+    syntax = {
+        'table': table_with_properties if allow_properties else table,
+        'ref': ref,
+        'enum': enum,
+        'tablegroup': table_group,
+        'project': project,
+        'note': sticky_note,
+    }[keyword]
+    syntax.streamline()
+    return syntax
+
+
+_packrat_lock = RLock()
+
+
+@contextmanager
+def packrat_parsing(cache_size: Optional[int] = 128) -> Iterator[None]:
+    """
+    Temporarily turn on pyparsing packrat memoization with a bounded cache.
+
+    pyparsing only has a process-wide switch, so previous settings are
+    restored on exit. If memoization is already enabled globally, it is left
+    untouched. Packrat parses hold a lock, so they don't overlap with each
+    other.
+    """
+    with _packrat_lock:
+        if pp.ParserElement._packratEnabled or pp.ParserElement._left_recursion_enabled:
+            yield
+            return
+        saved_parse = pp.ParserElement._parse
+        saved_cache = pp.ParserElement.packrat_cache
+        pp.ParserElement.enable_packrat(cache_size)
+        try:
+            yield
+        finally:
+            with pp.ParserElement.packrat_cache_lock:
+                pp.ParserElement._packratEnabled = False
+                pp.ParserElement._parse = saved_parse
+                pp.ParserElement.packrat_cache = saved_cache
+
+
+def parse_block_sources(
+    sources: Sequence[Tuple[str, str, int]],
+    allow_properties: bool = False,
+    packrat: bool = False,
+    cache_size: Optional[int] = 128,
+    syntaxes: Optional[Dict[str, pp.ParserElement]] = None,
+) -> List[Blueprint]:
+    """
+    Parse top-level blocks, given as (keyword, source, offset) triples, into
+    blueprints. Offset is the position of the block in the document, source
+    spans of the blueprints are moved by it. Blueprints are not bound to any
+    parser, so this also runs in worker processes and the result can be
+    pickled back. `syntaxes` replace the shared block grammars by keyword.
+    """
+    if packrat:
+        with packrat_parsing(cache_size):
+            return parse_block_sources(sources, allow_properties, syntaxes=syntaxes)
+    result = []
+    for keyword, source, offset in sources:
+        if syntaxes is not None:
+            syntax = syntaxes[keyword]
+        else:
+            syntax = get_block_syntax(keyword, allow_properties)
+        tokens = syntax.parse_string(source, parseAll=True)
+        blueprints = PyDBMLParser._collect_blueprints(tokens)
+        if offset:
+            for blueprint in blueprints:
+                for span in blueprint.iter_spans():
+                    span.bind(offset)
+        result.extend(blueprints)
+    return result
+
+
+def parse_source_file(
+    path: str,
+    allow_properties: bool = False,
+    packrat: bool = False,
+    cache_size: Optional[int] = 128,
+) -> List[Blueprint]:
+    """
+    Read one file of a multi-file schema and parse it into blueprints, with
+    source spans bound to the file. Like `parse_block_sources`, this also
+    runs in worker processes.
+    """
+    with open(path, encoding="utf8") as f:
+        source = remove_bom(f.read())
+    parser = PyDBMLParser(source, allow_properties=allow_properties, packrat=packrat, cache_size=cache_size)
+    parser._set_syntax()
+    blueprints = parser._parse_blueprints()
+    lines = LineIndex(source, name=path)
+    for blueprint in blueprints:
+        for span in blueprint.iter_spans():
+            span.lines = lines
+    return blueprints
+
+
 class PyDBML:
     """
     PyDBML parser factory. If properly initiated, returns parsed Database.
@@ -57,8 +201,9 @@ class PyDBML:
         cls,
         source_: Optional[Union[str, Path, TextIOWrapper]] = None,
         allow_properties: bool = False,
-        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
-        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ):
         if source_ is not None:
             if isinstance(source_, str):
@@ -77,6 +222,7 @@ class PyDBML:
                 allow_properties=allow_properties,
                 sql_renderer=sql_renderer,
                 dbml_renderer=dbml_renderer,
+                cache_dir=cache_dir,
             )
         else:
             return super().__new__(cls)
@@ -88,28 +234,112 @@ class PyDBML:
     def parse(
         text: str,
         allow_properties: bool = False,
-        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
-        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+        packrat: bool = False,
+        cache_size: Optional[int] = 128,
+        workers: Optional[int] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
     ) -> Database:
+        """
+        Parse DBML source text into a Database.
+
+        With `packrat=True` the parse uses pyparsing memoization with a cache
+        of `cache_size` entries (None for unbounded). It only affects this
+        call. Memoization has its own overhead, so measure before enabling it:
+        on typical schemas the grammar rarely retries an element at the same
+        position and packrat parsing is slower.
+
+        With `workers=N` top-level blocks are parsed in a pool of N processes.
+        The database is still built in the calling process.
+
+        With `cache_dir` (or the PYDBML_CACHE_DIR environment variable) parse
+        results are cached on disk, keyed by the source text, the pydbml
+        version and `allow_properties`. Unchanged sources are loaded from
+        the cache without parsing.
+        """
         text = remove_bom(text)
+        cache = ParseCache.from_option(cache_dir)
+        if cache is not None:
+            key = cache.key(text, allow_properties)
+            cached = cache.get(key, sql_renderer=sql_renderer, dbml_renderer=dbml_renderer)
+            if cached is not None:
+                return cached
         parser = PyDBMLParser(
             text,
             allow_properties=allow_properties,
             sql_renderer=sql_renderer,
             dbml_renderer=dbml_renderer,
+            packrat=packrat,
+            cache_size=cache_size,
+            workers=workers,
         )
-        return parser.parse()
+        result = parser.parse()
+        if cache is not None:
+            cache.put(key, result)
+        return result
 
     @staticmethod
-    def parse_file(file: Union[str, Path, TextIOWrapper]) -> Database:
+    def parse_file(
+        file: Union[str, Path, TextIOWrapper],
+        cache_dir: Optional[Union[str, Path]] = None,
+    ) -> Database:
         if isinstance(file, TextIOWrapper):
             source = file.read()
         else:
             with open(file, encoding="utf8") as f:
                 source = f.read()
-        source = remove_bom(source)
-        parser = PyDBMLParser(source)
-        return parser.parse()
+        return PyDBML.parse(source, cache_dir=cache_dir)
+
+    @staticmethod
+    def parse_files(
+        paths: Iterable[Union[str, Path]],
+        allow_properties: bool = False,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+        packrat: bool = False,
+        cache_size: Optional[int] = 128,
+        workers: Optional[int] = None,
+    ) -> Database:
+        """
+        Parse a schema split across several DBML files into one Database.
+        References and table groups may point to tables from other files.
+        Objects are added in the order of the paths.
+
+        With `workers=N` the files are read and parsed in a pool of N
+        processes. The database is still built in the calling process.
+
+        Errors in a file, including references to tables which are not
+        defined in any file, are raised as SourceFileError with the path of
+        the file. The error is also an instance of the original exception
+        type. Source spans of the parsed objects have the path in `file`.
+        """
+        parser = PyDBMLParser(
+            '',
+            allow_properties=allow_properties,
+            sql_renderer=sql_renderer,
+            dbml_renderer=dbml_renderer,
+            packrat=packrat,
+            cache_size=cache_size,
+            workers=workers,
+        )
+        parser.add_files([str(path) for path in paths])
+        parser.build_database()
+        return parser.database  # type: ignore
+
+    @staticmethod
+    def parse_directory(
+        directory: Union[str, Path],
+        pattern: str = '**/*.dbml',
+        **kwargs,
+    ) -> Database:
+        """
+        Parse the files in the directory which match the glob pattern (all
+        .dbml files in it and its subdirectories by default) with
+        `parse_files`, in the order of their paths. Keyword arguments are
+        passed to `parse_files`.
+        """
+        return PyDBML.parse_files(sorted(Path(directory).glob(pattern)), **kwargs)
 
 
 class PyDBMLParser:
@@ -117,10 +347,13 @@ class PyDBMLParser:
         self,
         source: str,
         allow_properties: bool = False,
-        sql_renderer: Type[BaseRenderer] = DefaultSQLRenderer,
-        dbml_renderer: Type[BaseRenderer] = DefaultDBMLRenderer,
+        sql_renderer: Optional[Type[BaseRenderer]] = None,
+        dbml_renderer: Optional[Type[BaseRenderer]] = None,
+        packrat: bool = False,
+        cache_size: Optional[int] = 128,
+        workers: Optional[int] = None,
     ):
-        self.database = None
+        self.database: Optional[Database] = None
 
         self.ref_blueprints: List[ReferenceBlueprint] = []
         self.table_groups: List[TableGroupBlueprint] = []
@@ -133,45 +366,134 @@ class PyDBMLParser:
         self._allow_properties = allow_properties
         self._sql_renderer = sql_renderer
         self._dbml_renderer = dbml_renderer
+        self._packrat = packrat
+        self._cache_size = cache_size
+        self._workers = workers
+        self._profile: Optional[ParseProfile] = None
+
+    def parse(self, profile: Optional[ParseProfile] = None):
+        """
+        Parse the source and build the database.
 
-    def parse(self):
-        self._set_syntax()
-        self._syntax.parse_string(self.source, parseAll=True)
-        self.build_database()
+        With a ParseProfile, wall time of the parse phases and counters of the
+        grammar elements are collected into it. Blocks are then parsed in
+        this process, even if workers were requested.
+        """
+        self._profile = profile
+        try:
+            with self._phase('set_syntax'):
+                self._set_syntax()
+            with self._phase('parse_string'), self._profile_grammar() as syntaxes:
+                blueprints = self._parse_blueprints(syntaxes)
+            with self._phase('add_blueprints'):
+                lines = LineIndex(self.source)
+                for blueprint in blueprints:
+                    for span in blueprint.iter_spans():
+                        span.lines = lines
+                    self.add_blueprint(blueprint)
+            with self._phase('build_database'):
+                self.build_database()
+        finally:
+            self._profile = None
         return self.database
 
+    def _phase(self, name: str) -> ContextManager:
+        return nullcontext() if self._profile is None else self._profile.phase(name)
+
+    def _profile_grammar(self) -> ContextManager[Optional[List[pp.ParserElement]]]:
+        '''
+        Grammars to parse with: None for the shared ones, or the profiled
+        copies of the full grammar and of the block grammars by KEYWORDS.
+        '''
+        if self._profile is None:
+            return nullcontext()
+        syntaxes = [
+            self._syntax,
+            *(get_block_syntax(keyword, self._allow_properties) for keyword in KEYWORDS)
+        ]
+        return self._profile.grammar(syntaxes)
+
+    def _parse_blueprints(self, syntaxes: Optional[List[pp.ParserElement]] = None) -> List[Blueprint]:
+        full_syntax, *block_syntaxes = syntaxes or [self._syntax]
+        try:
+            return self._parse_blocks(dict(zip(KEYWORDS, block_syntaxes)) if syntaxes else None)
+        except (ScanError, pp.ParseBaseException, SyntaxError):
+            pass
+        # The full grammar gives the same result for any source the fast
+        # path accepts, and proper error messages for the rest. It runs
+        # outside of the except clause, so its errors are not chained to
+        # the fast path ones.
+        if self._packrat:
+            with packrat_parsing(self._cache_size):
+                tokens = full_syntax.parse_string(self.source, parseAll=True)
+        else:
+            tokens = full_syntax.parse_string(self.source, parseAll=True)
+        return self._collect_blueprints(tokens)
+
+    def _parse_blocks(self, syntaxes: Optional[Dict[str, pp.ParserElement]] = None) -> List[Blueprint]:
+        """
+        Split the source into top-level blocks with the scanner and parse
+        each block with its own grammar, without trying every top-level
+        alternative. With several workers, blocks are parsed in a process
+        pool, in contiguous chunks to keep the source order.
+        """
+        # pyparsing expands tabs before parsing, do it once for all blocks
+        text = self.source.expandtabs()
+        sources = [(b.keyword, text[b.start:b.end], b.start) for b in split_blocks(text)]
+        options = (self._allow_properties, self._packrat, self._cache_size)
+        if not self._workers or self._workers < 2 or len(sources) < 2 or self._profile:
+            return parse_block_sources(sources, *options, syntaxes=syntaxes)
+
+        chunk_count = min(len(sources), self._workers * 4)
+        chunk_size = -(-len(sources) // chunk_count)
+        chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+        result = []
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            for blueprints in executor.map(parse_block_sources, chunks, *map(repeat, options)):
+                result.extend(blueprints)
+        return result
+
+    def add_files(self, paths: Sequence[str]) -> None:
+        """
+        Parse the files and add their blueprints in the order of the paths.
+        With several workers, the files are read and parsed in a process
+        pool. Errors are raised as SourceFileError with the path of the file.
+        """
+        options = (self._allow_properties, self._packrat, self._cache_size)
+        if not self._workers or self._workers < 2 or len(paths) < 2:
+            self._add_file_blueprints(paths, map(parse_source_file, paths, *map(repeat, options)))
+            return
+
+        chunk_size = max(1, len(paths) // (self._workers * 4))
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            results = executor.map(parse_source_file, paths, *map(repeat, options), chunksize=chunk_size)
+            self._add_file_blueprints(paths, results)
+
+    def _add_file_blueprints(self, paths: Sequence[str], results: Iterator[List[Blueprint]]) -> None:
+        for path in paths:
+            try:
+                blueprints = next(results)
+            except Exception as e:
+                raise SourceFileError.wrap(path, e) from e
+            for blueprint in blueprints:
+                self.add_blueprint(blueprint)
+
+    @staticmethod
+    def _collect_blueprints(tokens: pp.ParseResults) -> List[Blueprint]:
+        # long refs and projects leave their trailing line end in tokens
+        return [token for token in tokens if isinstance(token, Blueprint)]
+
     def __repr__(self):
         return "<PyDBMLParser>"
 
     def _set_syntax(self):
-        table_expr = (
-            table_with_properties.copy() if self._allow_properties else table.copy()
-        )
-        ref_expr = ref.copy()
-        enum_expr = enum.copy()
-        table_group_expr = table_group.copy()
-        project_expr = project.copy()
-        note_expr = sticky_note.copy()
-
-        table_expr.addParseAction(self.parse_blueprint)
-        ref_expr.addParseAction(self.parse_blueprint)
-        enum_expr.addParseAction(self.parse_blueprint)
-        table_group_expr.addParseAction(self.parse_blueprint)
-        project_expr.addParseAction(self.parse_blueprint)
-        note_expr.addParseAction(self.parse_blueprint)
-
-        expr = (
-            table_expr
-            | ref_expr
-            | enum_expr
-            | table_group_expr
-            | project_expr
-            | note_expr
-        )
-        self._syntax = expr[...] + ("\n" | comment)[...] + pp.StringEnd()
+        self._syntax = get_syntax(self._allow_properties)
 
     def parse_blueprint(self, s, loc, tok):
-        blueprint = tok[0]
+        self.add_blueprint(tok[0])
+
+    def add_blueprint(self, blueprint: Blueprint) -> None:
+        """Register a top-level blueprint and bind it to this parser."""
         if isinstance(blueprint, TableBlueprint):
             self.tables.append(blueprint)
             ref_bps = blueprint.get_reference_blueprints()
@@ -227,16 +549,32 @@ class PyDBMLParser:
             sql_renderer=self._sql_renderer,
             dbml_renderer=self._dbml_renderer,
         )
-        for enum_bp in self.enums:
-            self.database.add(enum_bp.build())
-        for table_bp in self.tables:
-            self.database.add(table_bp.build())
-            self.ref_blueprints.extend(table_bp.get_reference_blueprints())
-        for table_group_bp in self.table_groups:
-            self.database.add(table_group_bp.build())
-        for note_bp in self.sticky_notes:
-            self.database.add(note_bp.build())
-        if self.project:
-            self.database.add(self.project.build())
-        for ref_bp in self.refs:
-            self.database.add(ref_bp.build())
+        with self._phase('build_database.enums'):
+            for enum_bp in self.enums:
+                self._build_blueprint(enum_bp)
+        with self._phase('build_database.tables'):
+            for table_bp in self.tables:
+                self._build_blueprint(table_bp)
+                self.ref_blueprints.extend(table_bp.get_reference_blueprints())
+        with self._phase('build_database.table_groups'):
+            for table_group_bp in self.table_groups:
+                self._build_blueprint(table_group_bp)
+        with self._phase('build_database.sticky_notes'):
+            for note_bp in self.sticky_notes:
+                self._build_blueprint(note_bp)
+        with self._phase('build_database.project'):
+            if self.project:
+                self._build_blueprint(self.project)
+        with self._phase('build_database.refs'):
+            for ref_bp in self.refs:
+                self._build_blueprint(ref_bp)
+
+    def _build_blueprint(self, blueprint: Blueprint) -> None:
+        """Add the built object to the database, errors name the source file, if any."""
+        try:
+            self.database.add(blueprint.build())  # type: ignore
+        except Exception as e:
+            path = blueprint.span.file if blueprint.span is not None else None
+            if path is None:
+                raise
+            raise SourceFileError.wrap(path, e) from e
@@ -0,0 +1,179 @@
+'''
+Parse profiler.
+
+ParseProfile collects wall time of parse phases and counters of the named
+grammar elements (see `set_name` calls in `pydbml.definitions`):
+
+* tries — how many times the element was tried;
+* hits — how many times it matched;
+* misses — how many times it failed;
+* backtracks — how many tries were at a position where the element had
+  already been tried, that is, repeated work after the parser backtracked;
+* cache_hits — tries answered from the packrat cache.
+
+Counters are collected with pyparsing debug actions, which are set on a
+separately built copy of the grammar for the duration of the parse, so parses
+without a profile are neither counted nor slowed down. Elements which
+pyparsing merged into their parent when streamlining the grammar are counted
+as a part of the parent.
+
+>>> from pydbml.parser.parser import PyDBMLParser
+>>> profile = ParseProfile()
+>>> db = PyDBMLParser('Table a {\\n  id int [pk]\\n}\\n').parse(profile=profile)
+>>> report = profile.report()
+>>> report['elements']['table_column']
+{'tries': 2, 'hits': 1, 'misses': 1, 'backtracks': 0, 'cache_hits': 0}
+>>> [name for name in report['phases'] if '.' not in name]
+['add_blueprints', 'build_database', 'parse_string', 'set_syntax']
+>>> report['phases']['build_database.tables'] > 0
+True
+'''
+import json
+from collections import defaultdict
+from contextlib import contextmanager
+from copy import deepcopy
+from threading import RLock
+from time import perf_counter
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Set
+from typing import Tuple
+
+import pyparsing as pp
+
+
+COUNTERS = ('tries', 'hits', 'misses', 'backtracks', 'cache_hits')
+
+_grammar_lock = RLock()
+# originals and copies of the profiled grammars, see `profiled_copy`
+_copies: Dict[int, Any] = {}
+
+
+def named_elements(syntaxes: Iterable[pp.ParserElement]) -> List[pp.ParserElement]:
+    '''All elements with a custom name, reachable from the syntaxes.'''
+    result = []
+    seen: Set[int] = set()
+    stack = list(syntaxes)
+    while stack:
+        element = stack.pop()
+        if id(element) in seen:
+            continue
+        seen.add(id(element))
+        if element.customName is not None:
+            result.append(element)
+        if isinstance(element, pp.ParseExpression):
+            stack.extend(element.exprs)
+        elif isinstance(element, pp.ParseElementEnhance) and element.expr is not None:
+            stack.append(element.expr)
+    return result
+
+
+def profiled_copy(syntax: pp.ParserElement) -> pp.ParserElement:
+    '''
+    Copy of the shared grammar for profiled parses. Copies are made once and
+    share the elements common to several grammars, like the originals do.
+    '''
+    with _grammar_lock:
+        return deepcopy(syntax, _copies)
+
+
+class ParseProfile:
+    '''
+    Collects the profile of one or several parses, pass it to
+    PyDBMLParser.parse.
+    '''
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = defaultdict(float)
+        self.counters: Dict[str, Dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        # (element, position) pairs tried in the current string
+        self._tried: Set[Tuple[int, int]] = set()
+        self._string = ''
+
+    def __repr__(self):
+        return "<ParseProfile>"
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        '''Add wall time of the block to the phase.'''
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += perf_counter() - start
+
+    def _try(self, instring: str, loc: int, expr: pp.ParserElement, cache_hit: bool = False) -> None:
+        counters = self.counters[expr.customName]
+        counters['tries'] += 1
+        if cache_hit:
+            counters['cache_hits'] += 1
+        if instring is not self._string:
+            # blocks are parsed one after another
+            self._string = instring
+            self._tried.clear()
+        key = (id(expr), loc)
+        if key in self._tried:
+            counters['backtracks'] += 1
+        else:
+            self._tried.add(key)
+
+    def _match(
+        self,
+        instring: str,
+        start: int,
+        end: int,
+        expr: pp.ParserElement,
+        tokens: pp.ParseResults,
+        cache_hit: bool = False
+    ) -> None:
+        self.counters[expr.customName]['hits'] += 1
+
+    def _fail(
+        self,
+        instring: str,
+        loc: int,
+        expr: pp.ParserElement,
+        exc: Exception,
+        cache_hit: bool = False
+    ) -> None:
+        self.counters[expr.customName]['misses'] += 1
+
+    @contextmanager
+    def grammar(self, syntaxes: Iterable[pp.ParserElement]) -> Iterator[List[pp.ParserElement]]:
+        '''
+        Copies of the syntaxes to parse with inside the block, counting
+        matches of their named elements. The copies are shared by profiled
+        parses, so these hold a lock and don't overlap with each other.
+        '''
+        with _grammar_lock:
+            copies = [profiled_copy(s) for s in syntaxes]
+            elements = named_elements(copies)
+            saved = [(e, e.debug, e.debugActions) for e in elements]
+            for element in elements:
+                element.set_debug_actions(self._try, self._match, self._fail)
+            try:
+                yield copies
+            finally:
+                for element, debug, actions in saved:
+                    element.debugActions = actions
+                    element.debug = debug
+                self._tried.clear()
+                self._string = ''
+
+    def report(self) -> Dict[str, Any]:
+        '''
+        Phase times in seconds, sorted by name, and element counters, sorted
+        by the number of tries.
+        '''
+        elements = sorted(self.counters.items(), key=lambda i: (-i[1]['tries'], i[0]))
+        return {
+            'phases': dict(sorted(self.phases.items())),
+            'elements': {name: dict(counters) for name, counters in elements},
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        '''Report as JSON, keyword arguments are passed to json.dumps.'''
+        return json.dumps(self.report(), **kwargs)
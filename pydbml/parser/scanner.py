@@ -0,0 +1,176 @@
+'''
+Pre-scanner which splits DBML source into top-level blocks.
+
+Each block can be parsed with its own grammar instead of trying every
+top-level alternative at every position. The scanner is deliberately
+conservative: whenever it meets something it doesn't fully understand, it
+raises ScanError and the caller should fall back to the full grammar, which
+also produces the proper error message.
+'''
+import re
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+
+
+KEYWORDS = ('table', 'ref', 'enum', 'tablegroup', 'project', 'note')
+
+_keyword = re.compile(r'[A-Za-z]+')
+_whitespace = re.compile(r'[ \t\r\n]*')
+_inline_whitespace = re.compile(r'[ \t\r]*')
+_special = re.compile(r"'''|//|/\*|['\"`{}()\[\]:\n]")
+_quoted_end = {
+    "'": re.compile(r"(?:\\.|[^'\\\n])*'"),
+    '"': re.compile(r'(?:\\.|[^"\\\n])*"'),
+    "'''": re.compile(r"(?:\\.|(?!''')[^\\])*'''", re.DOTALL),
+}
+
+
+class ScanError(Exception):
+    pass
+
+
+class Block(NamedTuple):
+    '''
+    Top-level block of DBML source. The span starts right after the previous
+    block, so it includes the comments before the block, which the grammar
+    collects as `comment_before`.
+    '''
+    keyword: str
+    start: int
+    end: int
+
+
+def skip_trivia(text: str, pos: int) -> int:
+    '''Skip whitespace, line breaks and comments.'''
+    while True:
+        pos = _whitespace.match(text, pos).end()  # type: ignore
+        if text.startswith('//', pos):
+            end = text.find('\n', pos)
+            pos = len(text) if end == -1 else end
+        elif text.startswith('/*', pos):
+            end = text.find('*/', pos + 2)
+            if end == -1:
+                raise ScanError(f'Unterminated comment at {pos}')
+            pos = end + 2
+        else:
+            return pos
+
+
+def skip_quoted(text: str, pos: int, quote: str) -> int:
+    '''Return position after the closing quote. `pos` is right after the opening one.'''
+    if quote == '`':
+        end = text.find('`', pos)
+        if end == -1:
+            raise ScanError(f'Unterminated expression at {pos}')
+        return end + 1
+    match = _quoted_end[quote].match(text, pos)
+    if match is None:
+        raise ScanError(f'Unterminated string at {pos}')
+    return match.end()
+
+
+def skip_line_end(text: str, pos: int) -> int:
+    '''
+    Skip comments after the closing brace and the following line break, like
+    the `end` element of the grammar does.
+    '''
+    while True:
+        pos = _inline_whitespace.match(text, pos).end()  # type: ignore
+        if text.startswith('//', pos):
+            end = text.find('\n', pos)
+            pos = len(text) if end == -1 else end
+        elif text.startswith('/*', pos):
+            end = text.find('*/', pos + 2)
+            if end == -1:
+                raise ScanError(f'Unterminated comment at {pos}')
+            pos = end + 2
+        elif pos == len(text):
+            return pos
+        elif text[pos] == '\n':
+            return pos + 1
+        else:
+            raise ScanError(f'Unexpected text after block at {pos}')
+
+
+def find_block_end(text: str, pos: int, keyword: str) -> int:
+    '''
+    Find the end of the block whose keyword ends at `pos`.
+
+    Blocks end with a closing brace, except for short refs
+    (`Ref: a.id > b.id`) which end at the line break.
+    '''
+    brackets = 0
+    braces = 0
+    short_ref = False
+    while True:
+        match = _special.search(text, pos)
+        if match is None:
+            if short_ref and not brackets:
+                return len(text)
+            raise ScanError(f'Unexpected end of text in {keyword}')
+        token = match.group()
+        pos = match.end()
+        if token in ("'''", "'", '"', '`'):
+            pos = skip_quoted(text, pos, token)
+        elif token == '//':
+            end = text.find('\n', pos)
+            pos = len(text) if end == -1 else end
+        elif token == '/*':
+            end = text.find('*/', pos)
+            if end == -1:
+                raise ScanError(f'Unterminated comment at {match.start()}')
+            pos = end + 2
+        elif token in '([':
+            brackets += 1
+        elif token in ')]':
+            brackets -= 1
+            if brackets < 0:
+                raise ScanError(f'Unbalanced {token!r} at {match.start()}')
+        elif token == '{':
+            if short_ref:
+                raise ScanError(f'Unexpected {token!r} at {match.start()}')
+            braces += 1
+        elif token == '}':
+            braces -= 1
+            if braces < 0:
+                raise ScanError(f'Unbalanced {token!r} at {match.start()}')
+            if braces == 0:
+                if brackets:
+                    raise ScanError(f'Unbalanced brackets before {match.start()}')
+                return skip_line_end(text, pos)
+        elif token == ':':
+            if keyword == 'ref' and not braces and not brackets:
+                short_ref = True
+        elif token == '\n':
+            if short_ref and not brackets:
+                return match.start()
+
+
+def iter_blocks(text: str, start: int = 0) -> Iterator[Block]:
+    '''
+    Yield top-level blocks of DBML source one by one, starting at `start`,
+    which must be a block boundary.
+    '''
+    while True:
+        pos = skip_trivia(text, start)
+        if pos == len(text):
+            return
+        match = _keyword.match(text, pos)
+        if match is None or match.group().lower() not in KEYWORDS:
+            raise ScanError(f'Unknown top-level element at {pos}')
+        keyword = match.group().lower()
+        end = find_block_end(text, match.end(), keyword)
+        yield Block(keyword, start, end)
+        start = end
+
+
+def split_blocks(text: str) -> List[Block]:
+    '''
+    Split DBML source into top-level blocks. Text after the last block may
+    only contain comments and whitespace.
+
+    >>> split_blocks('Table a {\\n  id int\\n}\\nRef: a.id > b.id')
+    [Block(keyword='table', start=0, end=21), Block(keyword='ref', start=21, end=37)]
+    '''
+    return list(iter_blocks(text))
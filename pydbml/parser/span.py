@@ -0,0 +1,163 @@
+'''
+Source locations of parsed elements.
+
+Parse actions only record offsets. Line and column numbers are computed on
+access from the line start offsets of the source, which are collected once
+per parse, so tracking locations costs almost nothing when they are not
+used.
+'''
+import re
+from bisect import bisect_right
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+_line_break = re.compile('\n')
+
+
+def line_starts(text: str) -> List[int]:
+    '''Offsets where lines of the text start.'''
+    return [0, *(m.end() for m in _line_break.finditer(text))]
+
+
+class LineIndex:
+    '''
+    Line start offsets of a source text.
+
+    pyparsing expands tabs before parsing, so offsets of parsed elements are
+    in the text with expanded tabs. `offset` converts them back to offsets in
+    the source.
+
+    `name` is the path of the source file, if the source was read from one of
+    several files (see `PyDBML.parse_files`).
+    '''
+
+    name: Optional[str] = None
+
+    def __init__(self, source: str, name: Optional[str] = None) -> None:
+        self.reset(source)
+        if name is not None:
+            self.name = name
+
+    def reset(self, source: str) -> None:
+        self.source = source
+        self.starts = line_starts(source)
+        self._expanded_starts = line_starts(source.expandtabs()) if '\t' in source else None
+
+    def offset(self, expanded: int) -> int:
+        '''Offset in the source for an offset in the text with expanded tabs.'''
+        if self._expanded_starts is None:
+            return expanded
+        line = bisect_right(self._expanded_starts, expanded) - 1
+        target = expanded - self._expanded_starts[line]
+        pos = self.starts[line]
+        end = self.starts[line + 1] - 1 if line + 1 < len(self.starts) else len(self.source)
+        width = 0
+        while pos < end and width < target:
+            char = self.source[pos]
+            if char == '\t':
+                width = (width // 8 + 1) * 8
+            elif char == '\r':
+                width = 0
+            else:
+                width += 1
+            pos += 1
+        return pos
+
+    def position(self, offset: int) -> Tuple[int, int]:
+        '''Line and column (both starting from 1) of the source offset.'''
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+
+class SourceSpan:
+    '''
+    Location of a parsed element: `start` and `end` offsets in the source,
+    `line`, `column`, `end_line` and `end_column` numbers starting from 1.
+    `file` is the path of the source file for schemas parsed from several
+    files, None otherwise.
+
+    The span covers the element from its first token to its last one, a
+    comment on the same line is included, comments on the lines before it
+    are not.
+
+    Parse actions create spans with offsets in the parsed text. The parser
+    then moves them to the position of the block in the document and binds
+    them to the LineIndex of the source.
+    '''
+
+    __slots__ = ('_start', '_end', 'lines')
+
+    def __init__(self, start: int, end: int, lines: Optional[LineIndex] = None) -> None:
+        self._start = start
+        self._end = end
+        self.lines = lines
+
+    def bind(self, offset: int = 0, lines: Optional[LineIndex] = None) -> None:
+        '''Move the span by `offset` and bind it to the source lines, if given.'''
+        self._start += offset
+        self._end += offset
+        if lines is not None:
+            self.lines = lines
+
+    def _offset(self, expanded: int) -> int:
+        return expanded if self.lines is None else self.lines.offset(expanded)
+
+    def _position(self, offset: int) -> Tuple[int, int]:
+        if self.lines is None:
+            raise RuntimeError('Span is not bound to a source')
+        return self.lines.position(offset)
+
+    @property
+    def start(self) -> int:
+        return self._offset(self._start)
+
+    @property
+    def end(self) -> int:
+        return self._offset(self._end)
+
+    @property
+    def line(self) -> int:
+        return self._position(self.start)[0]
+
+    @property
+    def column(self) -> int:
+        return self._position(self.start)[1]
+
+    @property
+    def end_line(self) -> int:
+        return self._position(self.end)[0]
+
+    @property
+    def end_column(self) -> int:
+        return self._position(self.end)[1]
+
+    @property
+    def file(self) -> Optional[str]:
+        return None if self.lines is None else self.lines.name
+
+    @property
+    def text(self) -> str:
+        if self.lines is None:
+            raise RuntimeError('Span is not bound to a source')
+        return self.lines.source[self.start:self.end]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SourceSpan):
+            return NotImplemented
+        return (self.start, self.end) == (other.start, other.end)
+
+    def __repr__(self):
+        '''
+        >>> SourceSpan(0, 11, LineIndex('Table a {\\n}'))
+        <SourceSpan 1:1-2:2>
+        >>> SourceSpan(0, 10)
+        <SourceSpan 0-10>
+        >>> SourceSpan(0, 11, LineIndex('Table a {\\n}', name='shop.dbml'))
+        <SourceSpan shop.dbml 1:1-2:2>
+        '''
+        if self.lines is None:
+            return f'<SourceSpan {self.start}-{self.end}>'
+        file = f'{self.file} ' if self.file is not None else ''
+        return f'<SourceSpan {file}{self.line}:{self.column}-{self.end_line}:{self.end_column}>'
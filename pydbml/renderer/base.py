@@ -1,4 +1,4 @@
-from typing import Type, Callable, Dict, TYPE_CHECKING
+from typing import Type, Callable, Dict, Iterator, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from pydbml.database import Database
@@ -34,5 +34,23 @@ class BaseRenderer:
         return decorator
 
     @classmethod
-    def render_db(cls, db: 'Database') -> str:
+    def render_db(cls, db: 'Database', workers: Optional[int] = None) -> str:
+        """
+        Render the database. Renderers which support the `part` argument of
+        `iter_render_db` render the pieces in `workers` processes, if it's
+        more than one.
+        """
         raise NotImplementedError  # pragma: no cover
+
+    @classmethod
+    def iter_render_db(cls, db: 'Database', part: Optional[slice] = None) -> Iterator[str]:
+        """
+        Render the database piece by piece. The pieces, joined with blank
+        lines, make up the result of `render_db`. By default the whole
+        database is one piece.
+
+        `part` selects the pieces to render, like a slice of the list of all
+        pieces. The pieces outside of it are not rendered.
+        """
+        if part is None or range(1)[part]:
+            yield cls.render_db(db)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List, Optional
 
 from pydbml.renderer.base import BaseRenderer
 from pydbml._classes.base import DBMLObject
@@ -11,9 +11,19 @@ class DefaultDBMLRenderer(BaseRenderer):
     model_renderers = {}
 
     @classmethod
-    def render_db(cls, db: 'Database') -> str:
+    def iter_render_db(cls, db: 'Database', part: Optional[slice] = None) -> Iterator[str]:
         items: List[DBMLObject] = [db.project] if db.project else []
         refs = (ref for ref in db.refs if not ref.inline)
         items.extend((*db.enums, *db.tables, *refs, *db.table_groups, *db.sticky_notes))
+        if part is not None:
+            items = items[part]
 
-        return '\n\n'.join(cls.render(i) for i in items)
+        return (cls.render(i) for i in items)
+
+    @classmethod
+    def render_db(cls, db: 'Database', workers: Optional[int] = None) -> str:
+        if workers is not None and workers > 1:
+            # multiprocessing takes a while to import
+            from pydbml.renderer.parallel import render_db_parallel
+            return render_db_parallel(cls, db, workers)
+        return '\n\n'.join(cls.iter_render_db(db))
@@ -0,0 +1,101 @@
+'''
+Rendering of a database in a process pool.
+
+Each worker renders every n-th piece of `iter_render_db` (n is the number
+of workers) and the pieces are put back in the serial order, so the result
+is the same as of the serial renderer.
+
+Workers are started with the default start method of multiprocessing, or
+the context passed as `mp_context`. With the `fork` start method, the workers
+get the database from the parent process memory. Otherwise the database is
+sent to each worker once as a snapshot (see `pydbml.snapshot`), which takes
+longer than rendering small databases.
+'''
+import multiprocessing
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from itertools import zip_longest
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import Type
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+    from pydbml.renderer.base import BaseRenderer
+
+
+# renderer and database of the worker process
+_worker: Optional[Tuple[Type['BaseRenderer'], 'Database']] = None
+
+
+def _init_worker(renderer: Type['BaseRenderer'], db: 'Database') -> None:
+    global _worker
+    _worker = renderer, db
+
+
+def _init_worker_from_snapshot(renderer: Type['BaseRenderer'], data: bytes) -> None:
+    from pydbml.snapshot import loads
+    _init_worker(renderer, loads(data))
+
+
+def _render_part(part: slice) -> List[str]:
+    renderer, db = _worker  # type: ignore
+    return list(renderer.iter_render_db(db, part))
+
+
+def _pool(
+    renderer: Type['BaseRenderer'],
+    db: 'Database',
+    workers: int,
+    mp_context: Optional[BaseContext] = None
+) -> ProcessPoolExecutor:
+    '''Pool of `workers` processes, which have the renderer and the database.'''
+    context = mp_context or multiprocessing.get_context()
+    if context.get_start_method() == 'fork':
+        return ProcessPoolExecutor(
+            workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(renderer, db)
+        )
+    else:
+        from pydbml.snapshot import dumps
+        return ProcessPoolExecutor(
+            workers,
+            mp_context=context,
+            initializer=_init_worker_from_snapshot,
+            initargs=(renderer, dumps(db))
+        )
+
+
+def iter_render_db_parallel(
+    renderer: Type['BaseRenderer'],
+    db: 'Database',
+    workers: int,
+    mp_context: Optional[BaseContext] = None
+) -> Iterator[str]:
+    '''
+    Render the database pieces with the renderer in `workers` processes and
+    yield them in the order of `renderer.iter_render_db(db)`. The renderer
+    must support the `part` argument of `iter_render_db`.
+    '''
+    parts = [slice(i, None, workers) for i in range(workers)]
+    with _pool(renderer, db, workers, mp_context) as pool:
+        results = list(pool.map(_render_part, parts))
+
+    for pieces in zip_longest(*results):
+        yield from (piece for piece in pieces if piece is not None)
+
+
+def render_db_parallel(
+    renderer: Type['BaseRenderer'],
+    db: 'Database',
+    workers: int,
+    mp_context: Optional[BaseContext] = None
+) -> str:
+    '''Render the database in `workers` processes, see `iter_render_db_parallel`.'''
+    return '\n\n'.join(iter_render_db_parallel(renderer, db, workers, mp_context))
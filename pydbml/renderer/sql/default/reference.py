@@ -5,7 +5,7 @@ from pydbml.classes import Reference, Column
 from pydbml.constants import MANY_TO_MANY, MANY_TO_ONE, ONE_TO_ONE, ONE_TO_MANY
 from pydbml.exceptions import TableNotFoundError
 from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
-from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql
+from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql, is_deferred
 
 
 def col_names(cols: List[Column]) -> str:
@@ -71,7 +71,8 @@ def render_reference(model: Reference) -> str:
         return generate_many_to_many_sql(model)
 
     result = ''
-    func = generate_inline_sql if model.inline else generate_not_inline_sql
+    inline = model.inline and not is_deferred(model)
+    func = generate_inline_sql if inline else generate_not_inline_sql
     if model.type in (MANY_TO_ONE, ONE_TO_ONE):
         result = func(model=model, source_col=model.col1, ref_col=model.col2)
     elif model.type == ONE_TO_MANY:
@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING
+from typing import Iterator, Optional, TYPE_CHECKING
 
-from pydbml.renderer.sql.default.utils import reorder_tables_for_sql
+from pydbml.renderer.sql.default.utils import deferred_references, sort_tables_for_sql
 from pydbml.renderer.base import BaseRenderer
 
 
@@ -17,8 +17,23 @@ class DefaultSQLRenderer(BaseRenderer):
         return super().render(model)
 
     @classmethod
-    def render_db(cls, db: 'Database') -> str:
-        refs = (ref for ref in db.refs if not ref.inline)
-        tables = reorder_tables_for_sql(db.tables, db.refs)
-        components = (cls.render(i) for i in (*db.enums, *tables, *refs))
-        return '\n\n'.join(components)
+    def iter_render_db(cls, db: 'Database', part: Optional[slice] = None) -> Iterator[str]:
+        tables, deferred = sort_tables_for_sql(db.tables, db.refs)
+        deferred_ids = frozenset(map(id, deferred))
+        refs = (ref for ref in db.refs if not ref.inline or id(ref) in deferred_ids)
+        items = (*db.enums, *tables, *refs)
+        for item in items if part is None else items[part]:
+            token = deferred_references.set(deferred_ids)
+            try:
+                result = cls.render(item)
+            finally:
+                deferred_references.reset(token)
+            yield result
+
+    @classmethod
+    def render_db(cls, db: 'Database', workers: Optional[int] = None) -> str:
+        if workers is not None and workers > 1:
+            # multiprocessing takes a while to import
+            from pydbml.renderer.parallel import render_db_parallel
+            return render_db_parallel(cls, db, workers)
+        return '\n\n'.join(cls.iter_render_db(db))
@@ -1,3 +1,4 @@
+from itertools import chain
 from textwrap import indent
 from typing import List
 
@@ -6,7 +7,7 @@ from pydbml.classes import Table, Reference, Column
 from pydbml.exceptions import UnknownDatabaseError
 from pydbml.renderer.sql.default.note import prepare_text_for_sql
 from pydbml.renderer.sql.default.renderer import DefaultSQLRenderer
-from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql
+from pydbml.renderer.sql.default.utils import comment_to_sql, get_full_name_for_sql, is_deferred
 
 
 def get_references_for_sql(model: Table) -> List[Reference]:
@@ -16,14 +17,11 @@ def get_references_for_sql(model: Table) -> List[Reference]:
     """
     if not model.database:
         raise UnknownDatabaseError(f'Database for the table {model} is not set')
-    result = []
-    for ref in model.database.refs:
-        if (ref.type in (MANY_TO_ONE, ONE_TO_ONE)) and\
-                (ref.table1 == model):
-            result.append(ref)
-        elif (ref.type == ONE_TO_MANY) and (ref.table2 == model):
-            result.append(ref)
-    return result
+    index = model.database._get_ref_index()
+    return index.sort(chain(
+        (ref for ref in index.refs_from(model) if ref.type in (MANY_TO_ONE, ONE_TO_ONE)),
+        (ref for ref in index.refs_to(model) if ref.type == ONE_TO_MANY),
+    ))
 
 
 def get_inline_references_for_sql(model: Table) -> List[Reference]:
@@ -32,7 +30,7 @@ def get_inline_references_for_sql(model: Table) -> List[Reference]:
     '''
     if model.abstract:
         return []
-    return [r for r in get_references_for_sql(model) if r.inline]
+    return [r for r in get_references_for_sql(model) if r.inline and not is_deferred(r)]
 
 
 def create_body(model: Table) -> str:
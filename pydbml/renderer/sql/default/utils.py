@@ -1,33 +1,175 @@
-from typing import List, Dict, Union
+import heapq
+
+from contextvars import ContextVar
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
 
 from pydbml.classes import Enum, Reference, Table
-from pydbml.constants import MANY_TO_ONE, ONE_TO_MANY
+from pydbml.constants import MANY_TO_ONE, ONE_TO_MANY, ONE_TO_ONE
 from pydbml.tools import comment
 
 
+# ids of inline references which are rendered with ALTER TABLE instead of
+# CREATE TABLE, set by DefaultSQLRenderer.iter_render_db to break cycles
+deferred_references: ContextVar[FrozenSet[int]] = ContextVar(
+    'deferred_references',
+    default=frozenset()
+)
+
+
+def is_deferred(ref: 'Reference') -> bool:
+    return id(ref) in deferred_references.get()
+
+
 def comment_to_sql(val: str) -> str:
     return comment(val, '--')
 
 
-def reorder_tables_for_sql(tables: List['Table'], refs: List['Reference']) -> List['Table']:
+def get_table_dependencies(ref: 'Reference') -> Optional[Tuple['Table', 'Table']]:
     """
-    Attempt to reorder the tables, so that they are defined in SQL before they are referenced by
-    inline foreign keys.
+    Return (dependent, dependency) tables for an inline reference: the table
+    which holds the FOREIGN KEY definition and the table it refers to.
+    """
+    if not ref.inline:
+        return None
+    if ref.type in (MANY_TO_ONE, ONE_TO_ONE):
+        dependent, dependency = ref.table1, ref.table2
+    elif ref.type == ONE_TO_MANY:
+        dependent, dependency = ref.table2, ref.table1
+    else:
+        return None
+    if dependent is None or dependency is None:
+        return None
+    return dependent, dependency
+
 
-    Won't aid the rare cases of cross-references and many-to-many relations.
+def strongly_connected_components(graph: List[List[int]]) -> List[int]:
     """
+    Component number for each node of the graph, given as lists of the
+    successors of nodes 0..n-1. Nodes share a number if they are on a cycle.
+
+    >>> strongly_connected_components([[1], [0], [0], []])
+    [0, 0, 1, 2]
+    """
+    # iterative Tarjan's algorithm
+    count = len(graph)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    stack: List[int] = []
+    component = [-1] * count
+    components = 0
+    counter = 0
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        work = [(root, 0)]
+        while work:
+            node, i = work.pop()
+            if i == 0:
+                index[node] = low[node] = counter
+                counter += 1
+                stack.append(node)
+                on_stack[node] = True
+            elif i <= len(graph[node]):
+                # returned from the successor i - 1
+                low[node] = min(low[node], low[graph[node][i - 1]])
+            while i < len(graph[node]):
+                successor = graph[node][i]
+                i += 1
+                if index[successor] == -1:
+                    work.append((node, i))
+                    work.append((successor, 0))
+                    break
+                if on_stack[successor]:
+                    low[node] = min(low[node], index[successor])
+            else:
+                if low[node] == index[node]:
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component[member] = components
+                        if member == node:
+                            break
+                    components += 1
+    return component
+
 
-    references: Dict[str, int] = {}
+def sort_tables_for_sql(
+    tables: List['Table'],
+    refs: List['Reference']
+) -> Tuple[List['Table'], List['Reference']]:
+    """
+    Sort the tables topologically, so that they are defined in SQL after the
+    tables they reference by inline foreign keys. Independent tables keep
+    their original order.
+
+    Inline references which form a cycle can't all be defined in CREATE TABLE.
+    The cycle is broken at the first remaining table which only waits for the
+    tables of its own cycle, and the references from it to those tables are
+    returned as deferred: they should be added with ALTER TABLE after all
+    tables are created. References which are not a part of a cycle are never
+    deferred.
+    """
+
+    position = {id(t): i for i, t in enumerate(tables)}
+    dependencies: Dict[int, List['Reference']] = {}
+    dependents: Dict[int, List[int]] = {}
+    graph: List[List[int]] = [[] for _ in tables]
+    pending = [0] * len(tables)
     for ref in refs:
-        if ref.inline:
-            if ref.type == MANY_TO_ONE and ref.table1 is not None:
-                table_name = ref.table1.name
-            elif ref.type == ONE_TO_MANY and ref.table2 is not None:
-                table_name = ref.table2.name
-            else:  # pragma: no cover
-                continue
-            references[table_name] = references.get(table_name, 0) + 1
-    return sorted(tables, key=lambda t: references.get(t.name, 0), reverse=True)
+        edge = get_table_dependencies(ref)
+        if edge is None:
+            continue
+        dependent, dependency = (position.get(id(t)) for t in edge)
+        if dependent is None or dependency is None or dependent == dependency:
+            continue
+        dependencies.setdefault(dependent, []).append(ref)
+        dependents.setdefault(dependency, []).append(dependent)
+        graph[dependent].append(dependency)
+        pending[dependent] += 1
+
+    ready = [i for i, count in enumerate(pending) if count == 0]
+    heapq.heapify(ready)
+    done = [False] * len(tables)
+    result: List['Table'] = []
+    deferred: List['Reference'] = []
+    component: Optional[List[int]] = None
+    while len(result) < len(tables):
+        if not ready:
+            # only cycles and the tables which wait for them are left
+            if component is None:
+                component = strongly_connected_components(graph)
+            i = next(
+                i for i in range(len(tables))
+                if not done[i] and all(
+                    done[d] or component[d] == component[i] for d in graph[i]
+                )
+            )
+            for ref in dependencies[i]:
+                dependency = position[id(get_table_dependencies(ref)[1])]  # type: ignore
+                if not done[dependency]:
+                    deferred.append(ref)
+            pending[i] = 0
+            heapq.heappush(ready, i)
+        i = heapq.heappop(ready)
+        done[i] = True
+        result.append(tables[i])
+        for dependent in dependents.get(i, ()):
+            pending[dependent] -= 1
+            if pending[dependent] == 0:
+                heapq.heappush(ready, dependent)
+
+    order = {id(ref): i for i, ref in enumerate(refs)}
+    deferred.sort(key=lambda ref: order[id(ref)])
+    return result, deferred
+
+
+def reorder_tables_for_sql(tables: List['Table'], refs: List['Reference']) -> List['Table']:
+    """
+    Reorder the tables, so that they are defined in SQL after the tables they
+    reference by inline foreign keys. See `sort_tables_for_sql`.
+    """
+    return sort_tables_for_sql(tables, refs)[0]
 
 
 def get_full_name_for_sql(model: Union[Table, Enum]) -> str:
@@ -0,0 +1,251 @@
+'''
+SQL for the changes found by `pydbml.changes.diff`.
+
+New objects are rendered by the default SQL renderer, changes as ALTER,
+CREATE and DROP statements. Constraints and indexes which were defined
+without a name are dropped by the names PostgreSQL gives them by default
+("products_pkey", "products_name_key", "orders_user_id_fkey",
+"products_name_idx"). Changes which have no SQL equivalent, like removed
+enum items, are rendered as SQL comments.
+'''
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Union
+
+from pydbml.changes import ADD
+from pydbml.changes import Change
+from pydbml.changes import DROP
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import Expression
+from pydbml.classes import Index
+from pydbml.classes import Reference
+from pydbml.classes import Table
+from pydbml.constants import MANY_TO_MANY
+from pydbml.constants import ONE_TO_MANY
+from pydbml.exceptions import TableNotFoundError
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+from pydbml.renderer.sql.default.enum import render_enum
+from pydbml.renderer.sql.default.index import render_subject
+from pydbml.renderer.sql.default.note import prepare_text_for_sql
+from pydbml.renderer.sql.default.utils import deferred_references
+from pydbml.renderer.sql.default.utils import get_full_name_for_sql
+
+
+def _quoted_text(text: str) -> str:
+    return f"'{text}'"
+
+
+def _table_of(model: Union[Column, Index]) -> Table:
+    if model.table is None:
+        raise TableNotFoundError(f'Table on {model} is not set')
+    return model.table
+
+
+def _default_name(table: Table, columns: Iterable[Any], suffix: str) -> str:
+    '''PostgreSQL default name of a constraint or index.'''
+    names = [c.name if isinstance(c, Column) else 'expr' for c in columns]
+    return '_'.join((table.name, *names, suffix))
+
+
+def _alter_table(table: Table, action: str) -> str:
+    return f'ALTER TABLE {get_full_name_for_sql(table)} {action};'
+
+
+def _drop_constraint(table: Table, name: str) -> str:
+    return _alter_table(table, f'DROP CONSTRAINT "{name}"')
+
+
+def _comment_on_column(column: Column) -> str:
+    text = prepare_text_for_sql(column.note) if column.note else None
+    value = _quoted_text(text) if text is not None else 'NULL'
+    return f'COMMENT ON COLUMN {get_full_name_for_sql(_table_of(column))}."{column.name}" IS {value};'
+
+
+def render_enum_change(change: Change) -> List[str]:
+    if change.action == ADD:
+        return [render_enum(change.new)]
+    name = get_full_name_for_sql(change.model)
+    if change.action == DROP:
+        return [f'DROP TYPE {name};']
+
+    old_items = [i.name for i in change.old.items]
+    new_items = [i.name for i in change.new.items]
+    # the first item is added before an existing one, the rest after the previous
+    kept = [i for i in new_items if i in old_items]
+    result = []
+    for i, item in enumerate(new_items):
+        if item in old_items:
+            continue
+        if i == 0:
+            position = f" BEFORE '{kept[0]}'" if kept else ''
+        else:
+            position = f" AFTER '{new_items[i - 1]}'"
+        result.append(f"ALTER TYPE {name} ADD VALUE '{item}'{position};")
+    removed = [i for i in old_items if i not in new_items]
+    if removed:
+        items = ', '.join(f"'{i}'" for i in removed)
+        result.append(f'-- items {items} were removed from the type {name}, which is not supported by ALTER TYPE')
+    return result
+
+
+def render_table_change(change: Change) -> List[str]:
+    table = change.model
+    if change.action == ADD:
+        # all foreign keys are added after the tables are created
+        token = deferred_references.set(frozenset(map(id, table.database.refs)))
+        try:
+            return [DefaultSQLRenderer.render(table)]
+        finally:
+            deferred_references.reset(token)
+    if change.action == DROP:
+        return [f'DROP TABLE {get_full_name_for_sql(table)};']
+
+    text = prepare_text_for_sql(table.note) if table.note else None
+    value = _quoted_text(text) if text is not None else 'NULL'
+    return [f'COMMENT ON TABLE {get_full_name_for_sql(table)} IS {value};']
+
+
+def _default_sql(value: Any) -> str:
+    if isinstance(value, Expression):
+        return DefaultSQLRenderer.render(value)
+    return str(value)
+
+
+def _column_type_sql(column: Column) -> str:
+    if isinstance(column.type, Enum):
+        return get_full_name_for_sql(column.type)
+    return str(column.type)
+
+
+def _primary_key_change(old_table: Table, new_table: Table, column: Column) -> List[str]:
+    '''
+    The primary key is replaced as a whole, once for all the columns which
+    changed their `pk` flag: by the change of the first of them.
+    '''
+    old_keys = [c.name for c in old_table.primary_key]
+    new_keys = [c.name for c in new_table.primary_key]
+    old_columns = {c.name: c for c in old_table.columns}
+    changed = [
+        c.name for c in new_table.columns
+        if c.name in old_columns and bool(c.pk) != bool(old_columns[c.name].pk)
+    ]
+    if old_keys == new_keys or changed[:1] != [column.name]:
+        return []
+    result = []
+    if old_keys:
+        result.append(_drop_constraint(new_table, f'{old_table.name}_pkey'))
+    if new_keys:
+        keys = ', '.join(f'"{k}"' for k in new_keys)
+        result.append(_alter_table(new_table, f'ADD PRIMARY KEY ({keys})'))
+    return result
+
+
+def render_column_alter(old: Column, new: Column, fields: Iterable[str]) -> List[str]:
+    table = _table_of(new)
+    column = f'"{new.name}"'
+    result = []
+    for field in fields:
+        if field == 'type':
+            result.append(_alter_table(table, f'ALTER COLUMN {column} TYPE {_column_type_sql(new)}'))
+        elif field == 'not_null':
+            action = 'SET' if new.not_null else 'DROP'
+            result.append(_alter_table(table, f'ALTER COLUMN {column} {action} NOT NULL'))
+        elif field == 'default':
+            if new.default is None:
+                action = 'DROP DEFAULT'
+            else:
+                action = f'SET DEFAULT {_default_sql(new.default)}'
+            result.append(_alter_table(table, f'ALTER COLUMN {column} {action}'))
+        elif field == 'unique':
+            if new.unique:
+                result.append(_alter_table(table, f'ADD UNIQUE ({column})'))
+            else:
+                result.append(_drop_constraint(table, _default_name(table, [old], 'key')))
+        elif field == 'pk':
+            result.extend(_primary_key_change(_table_of(old), table, new))
+        elif field == 'note':
+            result.append(_comment_on_column(new))
+        elif field == 'autoinc':
+            result.append(f'-- AUTOINCREMENT of {get_full_name_for_sql(table)}.{column} was changed')
+    return result
+
+
+def render_column_change(change: Change) -> List[str]:
+    column = change.model
+    if change.action == ADD:
+        result = [_alter_table(_table_of(column), f'ADD COLUMN {DefaultSQLRenderer.render(column)}')]
+        if column.note:
+            result.append(_comment_on_column(column))
+        return result
+    if change.action == DROP:
+        return [_alter_table(_table_of(column), f'DROP COLUMN "{column.name}"')]
+    return render_column_alter(change.old, change.new, change.fields)
+
+
+def render_index_change(change: Change) -> List[str]:
+    index = change.model
+    table = _table_of(index)
+    if change.action == ADD:
+        if index.pk:
+            keys = ', '.join(render_subject(s) for s in index.subjects)
+            return [_alter_table(table, f'ADD PRIMARY KEY ({keys})')]
+        return [DefaultSQLRenderer.render(index)]
+
+    if index.pk:
+        return [_drop_constraint(table, index.name or f'{table.name}_pkey')]
+    name = index.name or _default_name(table, index.subjects, 'idx')
+    if table.schema != 'public':
+        return [f'DROP INDEX "{table.schema}"."{name}";']
+    return [f'DROP INDEX "{name}";']
+
+
+def render_reference_change(change: Change) -> List[str]:
+    ref = change.model
+    if change.action == ADD:
+        # inline references of the existing tables are added with ALTER TABLE too
+        token = deferred_references.set(frozenset((id(ref),)))
+        try:
+            return [DefaultSQLRenderer.render(ref)]
+        finally:
+            deferred_references.reset(token)
+
+    if ref.type == MANY_TO_MANY:
+        return [f'DROP TABLE {get_full_name_for_sql(ref.join_table)};']
+    source = ref.col2 if ref.type == ONE_TO_MANY else ref.col1
+    table = _table_of(source[0])
+    return [_drop_constraint(table, ref.name or _default_name(table, source, 'fkey'))]
+
+
+def iter_render_changes(changes: Iterable[Change]) -> Iterator[str]:
+    '''SQL statements for the changes, one change at a time.'''
+    for change in changes:
+        model = change.model
+        if isinstance(model, Enum):
+            statements = render_enum_change(change)
+        elif isinstance(model, Table):
+            statements = render_table_change(change)
+        elif isinstance(model, Column):
+            statements = render_column_change(change)
+        elif isinstance(model, Index):
+            statements = render_index_change(change)
+        elif isinstance(model, Reference):
+            statements = render_reference_change(change)
+        else:
+            raise TypeError(f'Unsupported change: {change!r}')
+        # the primary key is replaced by one of the column changes
+        if statements:
+            yield '\n'.join(statements)
+
+
+def render_changes(changes: Iterable[Change]) -> str:
+    '''
+    SQL migration script for the changes:
+
+    ALTER TABLE "products" ADD COLUMN "name" varchar;
+
+    ALTER TABLE "products" ALTER COLUMN "id" TYPE bigint;
+    '''
+    return '\n\n'.join(iter_render_changes(changes))
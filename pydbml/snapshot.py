@@ -0,0 +1,376 @@
+'''
+Binary snapshots of parsed databases.
+
+A snapshot stores the objects of a Database in a compact form, so it can be
+loaded without parsing the DBML source again. Objects are stored as lists of
+field values, and links between them (column types, index subjects,
+reference columns, table group items) as integer positions in the database
+lists. Source spans of parsed objects are stored as offsets, the source texts
+they point into are stored once in the `sources` list.
+
+Format: MAGIC, format version (unsigned short, big-endian), zlib-compressed
+JSON payload.
+'''
+import json
+import struct
+import zlib
+
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+from typing import Tuple
+from typing import Type
+from typing import Union
+
+from pydbml._classes.sticky_note import StickyNote
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import EnumItem
+from pydbml.classes import Expression
+from pydbml.classes import Index
+from pydbml.classes import Note
+from pydbml.classes import Project
+from pydbml.classes import Reference
+from pydbml.classes import Table
+from pydbml.classes import TableGroup
+from pydbml.exceptions import DatabaseValidationError
+from pydbml.exceptions import SnapshotError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydbml.database import Database
+    from pydbml.parser.span import LineIndex
+    from pydbml.parser.span import SourceSpan
+    from pydbml.renderer.base import BaseRenderer
+
+
+MAGIC = b'PYDBMLSNAP'
+FORMAT_VERSION = 2
+
+_header = struct.Struct('>H')
+
+
+def _note(note: Optional[Note]) -> Optional[str]:
+    return None if note is None else note.text
+
+
+def _expression(val: Any) -> Any:
+    '''Expressions are stored as one-item lists, other values as is.'''
+    return [val.text] if isinstance(val, Expression) else val
+
+
+def _load_expression(val: Any) -> Any:
+    return Expression(val[0]) if isinstance(val, list) else val
+
+
+class _Dumper:
+    def __init__(self, db: 'Database') -> None:
+        self.db = db
+        self.enums = {id(e): i for i, e in enumerate(db.enums)}
+        self.tables = {id(t): i for i, t in enumerate(db.tables)}
+        self.sources: Dict[int, int] = {}
+        self.lines: List['LineIndex'] = []
+
+    def span(self, span: Optional['SourceSpan']) -> Optional[list]:
+        '''Spans are stored as [source position, start, end], unbound ones with null source.'''
+        if span is None:
+            return None
+        source = None
+        if span.lines is not None:
+            source = self.sources.setdefault(id(span.lines), len(self.lines))
+            if source == len(self.lines):
+                self.lines.append(span.lines)
+        return [source, span._start, span._end]
+
+    def column_position(self, column: Column) -> List[int]:
+        table = column.table
+        if table is None or id(table) not in self.tables:
+            raise SnapshotError(f'{column} belongs to a table outside of the database')
+        for i, c in enumerate(table.columns):
+            if c is column:
+                return [self.tables[id(table)], i]
+        raise SnapshotError(f'{column} is not in the columns of {table}')
+
+    def enum(self, enum: Enum) -> list:
+        return [
+            enum.name,
+            enum.schema,
+            enum.comment,
+            [[i.name, _note(i.note), i.comment] for i in enum.items],
+            self.span(enum.span),
+        ]
+
+    def column(self, column: Column) -> list:
+        if isinstance(column.type, Enum):
+            if id(column.type) not in self.enums:
+                raise SnapshotError(f'Enum {column.type} of {column} is not in the database')
+            type_: Union[str, int] = self.enums[id(column.type)]
+        else:
+            type_ = column.type
+        return [
+            column.name,
+            type_,
+            column.unique,
+            column.not_null,
+            column.pk,
+            column.autoinc,
+            _expression(column.default),
+            _note(column.note),
+            column.comment,
+            column.properties,
+            self.span(column.span),
+        ]
+
+    def index(self, index: Index) -> list:
+        subjects: List[Any] = []
+        for subject in index.subjects:
+            if isinstance(subject, Column):
+                subjects.append(self.column_position(subject)[1])
+            else:
+                subjects.append(_expression(subject))
+        return [
+            subjects,
+            index.name,
+            index.unique,
+            index.type,
+            index.pk,
+            _note(index.note),
+            index.comment,
+            self.span(index.span),
+        ]
+
+    def table(self, table: Table) -> list:
+        return [
+            table.name,
+            table.schema,
+            table.alias,
+            _note(table.note),
+            table.header_color,
+            table.comment,
+            table.abstract,
+            table.properties,
+            [self.column(c) for c in table.columns],
+            [self.index(i) for i in table.indexes],
+            self.span(table.span),
+        ]
+
+    def reference(self, ref: Reference) -> list:
+        return [
+            ref.type,
+            [self.column_position(c) for c in ref.col1],
+            [self.column_position(c) for c in ref.col2],
+            ref.name,
+            ref.comment,
+            ref.on_update,
+            ref.on_delete,
+            ref._inline,
+            self.span(ref.span),
+        ]
+
+    def table_group(self, table_group: TableGroup) -> list:
+        items = []
+        for table in table_group.items:
+            if id(table) not in self.tables:
+                raise SnapshotError(f'{table} of {table_group} is not in the database')
+            items.append(self.tables[id(table)])
+        return [
+            table_group.name,
+            items,
+            table_group.comment,
+            _note(table_group.note),
+            table_group.color,
+        ]
+
+    def project(self, project: Optional[Project]) -> Optional[list]:
+        if project is None:
+            return None
+        return [project.name, project.items, _note(project.note), project.comment]
+
+    def payload(self) -> Dict[str, Any]:
+        db = self.db
+        result = {
+            'allow_properties': db.allow_properties,
+            'enums': [self.enum(e) for e in db.enums],
+            'tables': [self.table(t) for t in db.tables],
+            'refs': [self.reference(r) for r in db.refs],
+            'table_groups': [self.table_group(tg) for tg in db.table_groups],
+            'sticky_notes': [[n.name, n.text] for n in db.sticky_notes],
+            'project': self.project(db.project),
+        }
+        result['sources'] = [[lines.source, lines.name] for lines in self.lines]
+        return result
+
+
+class _Loader:
+    def __init__(self, db: 'Database') -> None:
+        self.db = db
+        self.lines: List['LineIndex'] = []
+
+    def span(self, data: Optional[list]) -> Optional['SourceSpan']:
+        from pydbml.parser.span import SourceSpan
+
+        if data is None:
+            return None
+        source, start, end = data
+        return SourceSpan(start, end, None if source is None else self.lines[source])
+
+    def enum(self, data: list) -> Enum:
+        name, schema, comment, items, span = data
+        result = Enum(
+            name=name,
+            items=[EnumItem(name=n, note=note, comment=c) for n, note, c in items],
+            schema=schema,
+            comment=comment
+        )
+        result.span = self.span(span)
+        return result
+
+    def column(self, data: list) -> Column:
+        name, type_, unique, not_null, pk, autoinc, default, note, comment, properties, span = data
+        result = Column(
+            name=name,
+            type=self.db.enums[type_] if isinstance(type_, int) else type_,
+            unique=unique,
+            not_null=not_null,
+            pk=pk,
+            autoinc=autoinc,
+            default=_load_expression(default),
+            note=note,
+            comment=comment,
+            properties=properties
+        )
+        result.span = self.span(span)
+        return result
+
+    def index(self, table: Table, data: list) -> Index:
+        subjects, name, unique, type_, pk, note, comment, span = data
+        result = Index(
+            subjects=[
+                table.columns[s] if isinstance(s, int) else _load_expression(s)
+                for s in subjects
+            ],
+            name=name,
+            unique=unique,
+            type=type_,
+            pk=pk,
+            note=note,
+            comment=comment
+        )
+        result.span = self.span(span)
+        return result
+
+    def table(self, data: list) -> Table:
+        name, schema, alias, note, header_color, comment, abstract, properties, columns, indexes, span = data
+        result = Table(
+            name=name,
+            schema=schema,
+            alias=alias,
+            note=note,
+            header_color=header_color,
+            comment=comment,
+            abstract=abstract,
+            properties=properties
+        )
+        result.span = self.span(span)
+        for column in columns:
+            result.add_column(self.column(column))
+        for index in indexes:
+            result.add_index(self.index(result, index))
+        return result
+
+    def columns(self, positions: List[List[int]]) -> List[Column]:
+        return [self.db.tables[t].columns[c] for t, c in positions]
+
+    def reference(self, data: list) -> Reference:
+        type_, col1, col2, name, comment, on_update, on_delete, inline, span = data
+        result = Reference(
+            type=type_,
+            col1=self.columns(col1),
+            col2=self.columns(col2),
+            name=name,
+            comment=comment,
+            on_update=on_update,
+            on_delete=on_delete,
+            inline=inline
+        )
+        result.span = self.span(span)
+        return result
+
+    def table_group(self, data: list) -> TableGroup:
+        name, items, comment, note, color = data
+        return TableGroup(
+            name=name,
+            items=[self.db.tables[i] for i in items],
+            comment=comment,
+            note=None if note is None else Note(note),
+            color=color
+        )
+
+    def load(self, payload: Dict[str, Any]) -> 'Database':
+        from pydbml.parser.span import LineIndex
+
+        db = self.db
+        self.lines = [LineIndex(source, name) for source, name in payload['sources']]
+        for enum in payload['enums']:
+            db.add_enum(self.enum(enum))
+        for table in payload['tables']:
+            db.add_table(self.table(table))
+        for table_group in payload['table_groups']:
+            db.add_table_group(self.table_group(table_group))
+        for name, text in payload['sticky_notes']:
+            db.add_sticky_note(StickyNote(name=name, text=text))
+        if payload['project'] is not None:
+            name, items, note, comment = payload['project']
+            db.add_project(Project(name=name, items=items, note=note, comment=comment))
+        for ref in payload['refs']:
+            db.add_reference(self.reference(ref))
+        return db
+
+
+def dumps(db: 'Database') -> bytes:
+    '''Return snapshot of the database as bytes.'''
+    payload = json.dumps(_Dumper(db).payload(), separators=(',', ':'), ensure_ascii=False)
+    return MAGIC + _header.pack(FORMAT_VERSION) + zlib.compress(payload.encode('utf8'))
+
+
+def _split(data: bytes) -> Tuple[int, bytes]:
+    if not data.startswith(MAGIC) or len(data) < len(MAGIC) + _header.size:
+        raise SnapshotError('Not a PyDBML snapshot')
+    version, = _header.unpack_from(data, len(MAGIC))
+    return version, data[len(MAGIC) + _header.size:]
+
+
+def loads(data: bytes, **kwargs: Optional[Type['BaseRenderer']]) -> 'Database':
+    '''
+    Load a database from snapshot bytes. Keyword arguments (`sql_renderer`,
+    `dbml_renderer`) are passed to the Database.
+    '''
+    from pydbml.database import Database
+
+    version, body = _split(data)
+    if version != FORMAT_VERSION:
+        raise SnapshotError(
+            f'Unsupported snapshot version {version}, expected {FORMAT_VERSION}'
+        )
+    try:
+        payload = json.loads(zlib.decompress(body).decode('utf8'))
+    except (zlib.error, UnicodeDecodeError, ValueError) as e:
+        raise SnapshotError(f'Corrupted snapshot: {e}') from e
+    try:
+        db = Database(allow_properties=payload['allow_properties'], **kwargs)
+        return _Loader(db).load(payload)
+    except (KeyError, IndexError, TypeError, ValueError, AttributeError, DatabaseValidationError) as e:
+        # valid JSON which doesn't describe a database
+        raise SnapshotError(f'Corrupted snapshot: {e!r}') from e
+
+
+def dump(db: 'Database', path: Union[str, Path]) -> None:
+    '''Write snapshot of the database to a file.'''
+    Path(path).write_bytes(dumps(db))
+
+
+def load(path: Union[str, Path], **kwargs: Optional[Type['BaseRenderer']]) -> 'Database':
+    '''Load a database from a snapshot file.'''
+    return loads(Path(path).read_bytes(), **kwargs)
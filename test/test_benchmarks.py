@@ -0,0 +1,59 @@
+import json
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from benchmarks.generate import generate_schema
+from benchmarks.run import CASES
+from benchmarks.run import main
+from pydbml import PyDBML
+
+
+class TestGenerateSchema(TestCase):
+    def test_counts(self) -> None:
+        source = generate_schema(
+            tables=20,
+            columns=5,
+            enums=3,
+            inline_refs=30,
+            refs=25,
+            indexes=30,
+            notes=35,
+            table_groups=4,
+        )
+        db = PyDBML(source)
+        self.assertEqual(len(db.tables), 20)
+        self.assertTrue(all(len(t.columns) == 5 for t in db.tables))
+        self.assertEqual(len(db.enums), 3)
+        self.assertEqual(len([r for r in db.refs if r.inline]), 30)
+        self.assertEqual(len([r for r in db.refs if not r.inline]), 25)
+        self.assertEqual(sum(len(t.indexes) for t in db.tables), 30)
+        self.assertTrue(all(len(i.subjects) == 2 for t in db.tables for i in t.indexes))
+        notes = [t.note for t in db.tables] + [c.note for t in db.tables for c in t.columns]
+        self.assertEqual(len([n for n in notes if n.text]), 35)
+        self.assertEqual(len(db.table_groups), 4)
+        self.assertEqual(sum(len(g.items) for g in db.table_groups), 20)
+
+    def test_deterministic(self) -> None:
+        self.assertEqual(generate_schema(seed=1), generate_schema(seed=1))
+        self.assertNotEqual(generate_schema(seed=1), generate_schema(seed=2))
+
+    def test_too_many(self) -> None:
+        with self.assertRaises(ValueError):
+            generate_schema(tables=2, columns=3, inline_refs=3, refs=2)
+        with self.assertRaises(ValueError):
+            generate_schema(tables=2, columns=3, indexes=3)
+
+
+class TestRun(TestCase):
+    def test_report(self) -> None:
+        with TemporaryDirectory() as tmp:
+            output = Path(tmp) / 'results.json'
+            main(['--sizes', '3', '5', '--repeat', '1', '--table-groups', '2', '-o', str(output)])
+            report = json.loads(output.read_text())
+        self.assertIn('pydbml', report['environment'])
+        self.assertEqual([r['objects']['tables'] for r in report['results']], [3, 5])
+        for result in report['results']:
+            self.assertEqual(list(result['timings']), list(CASES))
+            self.assertEqual(len(result['timings']['parse']['runs']), 1)
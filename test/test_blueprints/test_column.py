@@ -4,9 +4,11 @@ from unittest.mock import Mock
 from pydbml.classes import Column
 from pydbml.classes import Enum
 from pydbml.classes import EnumItem
+from pydbml.classes import Expression
 from pydbml.classes import Note
 from pydbml.database import Database
 from pydbml.parser.blueprints import ColumnBlueprint
+from pydbml.parser.blueprints import ExpressionBlueprint
 from pydbml.parser.blueprints import NoteBlueprint
 
 
@@ -88,3 +90,28 @@ class TestColumn(TestCase):
         bp.parser = parser
         result = bp.build()
         self.assertIs(result.type, e)
+
+    def test_build_does_not_change_blueprint(self) -> None:
+        s = Database()
+        e = Enum('myenum', items=[EnumItem('i1')])
+        s.add(e)
+        parser = Mock()
+        parser.database = s
+
+        bp = ColumnBlueprint(
+            name='testcol',
+            type='myenum',
+            default=ExpressionBlueprint('now()')
+        )
+        bp.parser = parser
+        result = bp.build()
+        self.assertIs(result.type, e)
+        self.assertIsInstance(result.default, Expression)
+        self.assertEqual(bp.type, 'myenum')
+        self.assertIsInstance(bp.default, ExpressionBlueprint)
+
+        s2 = Database()
+        e2 = Enum('myenum', items=[EnumItem('i2')])
+        s2.add(e2)
+        parser.database = s2
+        self.assertIs(bp.build().type, e2)
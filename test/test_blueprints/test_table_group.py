@@ -60,12 +60,27 @@ class TestTableGroupBlueprint(TestCase):
             comment='Comment text'
         )
 
+        table1 = Table(name='table1')
         parserMock = Mock()
         parserMock.locate_table.side_effect = [
-            Table(name='table1'),
+            table1,
             Table(name='table2'),
-            Table(name='table1')
+            table1
         ]
         bp.parser = parserMock
         with self.assertRaises(ValidationError):
             bp.build()
+
+    def test_duplicate_table_alias(self) -> None:
+        bp = TableGroupBlueprint(
+            name='TestTableGroup',
+            items=['U', 'users'],
+            comment='Comment text'
+        )
+
+        users = Table(name='users', alias='U')
+        parserMock = Mock()
+        parserMock.locate_table.side_effect = [users, users]
+        bp.parser = parserMock
+        with self.assertRaises(ValidationError):
+            bp.build()
@@ -0,0 +1,114 @@
+import os
+import struct
+import time
+import zlib
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydbml import PyDBML
+from pydbml.parser.cache import CACHE_DIR_ENV
+from pydbml.parser.cache import ParseCache
+from pydbml.parser.parser import PyDBMLParser
+from pydbml.snapshot import FORMAT_VERSION
+from pydbml.snapshot import MAGIC
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestParseCache(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.cache_dir = Path(self.tmp.name) / 'cache'
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_hit_skips_parsing(self) -> None:
+        path = TEST_DATA_PATH / 'general.dbml'
+        expected = PyDBML(path)
+        first = PyDBML(path, cache_dir=self.cache_dir)
+        self.assertEqual(first.sql, expected.sql)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+        with patch.object(PyDBMLParser, 'parse', side_effect=AssertionError):
+            second = PyDBML.parse_file(path, cache_dir=self.cache_dir)
+        self.assertEqual(second.sql, expected.sql)
+        self.assertEqual(second.dbml, expected.dbml)
+
+    def test_hit_has_spans(self) -> None:
+        def spans(db):
+            objects = [*db.tables, *db.refs, *db.enums]
+            for table in db.tables:
+                objects.extend(table.columns)
+                objects.extend(table.indexes)
+            return [
+                (o.span.start, o.span.end, o.span.line, o.span.column, o.span.text)
+                for o in objects
+            ]
+
+        source = (TEST_DATA_PATH / 'general.dbml').read_text(encoding='utf8')
+        miss = PyDBML.parse(source, cache_dir=self.cache_dir)
+        with patch.object(PyDBMLParser, 'parse', side_effect=AssertionError):
+            hit = PyDBML.parse(source, cache_dir=self.cache_dir)
+        self.assertEqual(spans(hit), spans(miss))
+
+    def test_env(self) -> None:
+        source = 'Table a {\n  id int\n}'
+        with patch.dict(os.environ, {CACHE_DIR_ENV: str(self.cache_dir)}):
+            PyDBML.parse(source)
+        self.assertEqual(len(list(self.cache_dir.glob('*.snapshot'))), 1)
+
+    def test_key(self) -> None:
+        cache = ParseCache(self.cache_dir)
+        source = 'Table a {\n  id int\n}'
+        self.assertEqual(cache.key(source), cache.key(source))
+        self.assertNotEqual(cache.key(source), cache.key(source, allow_properties=True))
+        self.assertNotEqual(cache.key(source), cache.key(source + '\n'))
+
+    def test_damaged_entry(self) -> None:
+        source = 'Table a {\n  id int\n}'
+        PyDBML.parse(source, cache_dir=self.cache_dir)
+        entry, = self.cache_dir.glob('*.snapshot')
+        entry.write_bytes(b'damaged')
+        result = PyDBML.parse(source, cache_dir=self.cache_dir)
+        self.assertEqual(result.tables[0].name, 'a')
+        self.assertNotEqual(entry.read_bytes(), b'damaged')
+
+    def test_malformed_entry(self) -> None:
+        source = 'Table a {\n  id int\n}'
+        PyDBML.parse(source, cache_dir=self.cache_dir)
+        entry, = self.cache_dir.glob('*.snapshot')
+        entry.write_bytes(MAGIC + struct.pack('>H', FORMAT_VERSION) + zlib.compress(b'{"tables":1}'))
+        result = PyDBML.parse(source, cache_dir=self.cache_dir)
+        self.assertEqual(result.tables[0].name, 'a')
+
+    def test_unwritable_directory(self) -> None:
+        source = 'Table a {\n  id int\n}'
+        with patch('tempfile.mkstemp', side_effect=PermissionError):
+            result = PyDBML.parse(source, cache_dir=self.cache_dir)
+        self.assertEqual(result.tables[0].name, 'a')
+        with patch.object(Path, 'mkdir', side_effect=PermissionError):
+            PyDBML.parse(source, cache_dir=self.cache_dir)
+        with patch('os.fdopen', side_effect=OSError(28, 'No space left on device')):
+            PyDBML.parse(source, cache_dir=self.cache_dir)
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+    def test_eviction(self) -> None:
+        sources = [f'Table t{i} {{\n  id int\n}}' for i in range(3)]
+        for source in sources:
+            PyDBML.parse(source, cache_dir=self.cache_dir)
+        entries = list(self.cache_dir.glob('*.snapshot'))
+        self.assertEqual(len(entries), 3)
+        cache = ParseCache(self.cache_dir, max_size=max(e.stat().st_size for e in entries) * 2)
+        # the first source was used last
+        now = time.time()
+        for i, source in enumerate(sources[1:] + sources[:1]):
+            os.utime(cache._path(cache.key(source)), (now + i, now + i))
+        cache.evict()
+        self.assertFalse(cache._path(cache.key(sources[1])).exists())
+        self.assertTrue(cache._path(cache.key(sources[2])).exists())
+        self.assertTrue(cache._path(cache.key(sources[0])).exists())
+        self.assertEqual(list(self.cache_dir.glob('*.tmp')), [])
@@ -0,0 +1,139 @@
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml import diff
+from pydbml.changes import ADD
+from pydbml.changes import ALTER
+from pydbml.changes import DROP
+from pydbml.changes import Change
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import Index
+from pydbml.classes import Note
+from pydbml.classes import Reference
+from pydbml.classes import Table
+
+
+SOURCE = '''
+Enum status {
+  active
+  done
+}
+
+Table users {
+  id int [pk]
+  name varchar
+  email varchar [unique]
+  indexes {
+    name [name: 'users_name']
+  }
+}
+
+Table posts {
+  id int [pk]
+  user_id int [ref: > users.id]
+  status status
+}
+'''
+
+
+def summary(changes):
+    return [(c.action, type(c.model).__name__, getattr(c.model, 'name', None), c.fields) for c in changes]
+
+
+class TestDiff(TestCase):
+    def setUp(self) -> None:
+        self.old = PyDBML(SOURCE)
+        self.new = PyDBML(SOURCE)
+
+    def test_no_changes(self) -> None:
+        self.assertEqual(diff(self.old, self.new), [])
+
+    def test_columns(self) -> None:
+        users = self.new['public.users']
+        users['id'].type = 'bigint'
+        users['name'].not_null = True
+        users['name'].note = Note('user name')
+        users.add_column(Column('age', 'int'))
+        users.delete_column(users['email'])
+        self.assertEqual(
+            summary(diff(self.old, self.new)),
+            [
+                (ADD, 'Column', 'age', ()),
+                (ALTER, 'Column', 'id', ('type',)),
+                (ALTER, 'Column', 'name', ('not_null', 'note')),
+                (DROP, 'Column', 'email', ()),
+            ]
+        )
+
+    def test_tables(self) -> None:
+        self.new.delete(self.new.refs[0])
+        self.new.delete(self.new['public.posts'])
+        table = self.new.add(Table('tags', columns=[Column('id', 'int')]))
+        table.add_index(Index([table['id']]))
+        changes = diff(self.old, self.new)
+        # references of the dropped table come first, the new table's index is a part of it
+        self.assertEqual(
+            summary(changes),
+            [
+                (DROP, 'Reference', None, ()),
+                (DROP, 'Table', 'posts', ()),
+                (ADD, 'Table', 'tags', ()),
+            ]
+        )
+
+    def test_indexes(self) -> None:
+        users = self.new['public.users']
+        index = users.indexes[0]
+        index.subjects.append(users['email'])
+        # in-place change of the subjects list is not tracked by fingerprints
+        users._fingerprint = None
+        users.add_index(Index([users['email']], unique=True))
+        changes = diff(self.old, self.new)
+        self.assertEqual(
+            summary(changes),
+            [
+                (DROP, 'Index', 'users_name', ()),
+                (ADD, 'Index', 'users_name', ()),
+                (ADD, 'Index', None, ()),
+            ]
+        )
+
+    def test_references(self) -> None:
+        ref = self.new.refs[0]
+        ref.on_delete = 'cascade'
+        users, posts = self.new['public.users'], self.new['public.posts']
+        self.new.add(Reference('>', posts['status'], users['name']))
+        changes = diff(self.old, self.new)
+        self.assertEqual([c.action for c in changes], [DROP, ADD, ADD])
+        self.assertIs(changes[1].new, ref)
+        self.assertEqual(changes[2].new.col2, [users['name']])
+
+    def test_enums(self) -> None:
+        self.new.enums[0].add_item('archived')
+        self.new.add(Enum('kind', ['a', 'b']))
+        self.old.add(Enum('old', ['a']))
+        changes = diff(self.old, self.new)
+        self.assertEqual(
+            summary(changes),
+            [
+                (ADD, 'Enum', 'kind', ()),
+                (ALTER, 'Enum', 'status', ('items',)),
+                (DROP, 'Enum', 'old', ()),
+            ]
+        )
+
+    def test_unchanged_tables_skipped(self) -> None:
+        self.new['public.users'].note = Note('users')
+        self.new['public.posts'].columns  # untouched
+        changes = diff(self.old, self.new)
+        self.assertEqual(summary(changes), [(ALTER, 'Table', 'users', ('note',))])
+        self.assertEqual(
+            self.old['public.posts'].fingerprint(),
+            self.new['public.posts'].fingerprint()
+        )
+
+    def test_change_model(self) -> None:
+        column = Column('id', 'int')
+        self.assertIs(Change(ADD, new=column).model, column)
+        self.assertIs(Change(DROP, old=column).model, column)
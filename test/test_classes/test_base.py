@@ -4,9 +4,18 @@ from pydbml._classes.base import SQLObject
 from pydbml.exceptions import AttributeMissingError
 
 
+class Object(SQLObject):
+    '''SQLObject has empty __slots__, subclasses without __slots__ get __dict__'''
+
+
+class SlotsObject(SQLObject):
+    __slots__ = ('a1', 'b1', 'parent')
+    dont_compare_fields = ('parent',)
+
+
 class TestDBMLObject(TestCase):
     def test_check_attributes_for_sql(self) -> None:
-        o = SQLObject()
+        o = Object()
         o.a1 = None
         o.b1 = None
         o.c1 = None
@@ -20,11 +29,11 @@ class TestDBMLObject(TestCase):
         o.check_attributes_for_sql()
 
     def test_comparison(self) -> None:
-        o1 = SQLObject()
+        o1 = Object()
         o1.a1 = None
         o1.b1 = 'c'
         o1.c1 = 123
-        o2 = SQLObject()
+        o2 = Object()
         o2.a1 = None
         o2.b1 = 'c'
         o2.c1 = 123
@@ -32,3 +41,16 @@ class TestDBMLObject(TestCase):
         o1.a2 = True
         self.assertFalse(o1 == o2)
         self.assertFalse(o1 == 123)
+
+    def test_comparison_slots(self) -> None:
+        o1 = SlotsObject()
+        o1.a1 = 1
+        o1.parent = o1
+        o2 = SlotsObject()
+        o2.a1 = 1
+        self.assertTrue(o1 == o2)
+        o2.b1 = None
+        self.assertFalse(o1 == o2)
+        o1.b1 = None
+        o1.parent = None
+        self.assertTrue(o1 == o2)
@@ -1,4 +1,16 @@
+import pickle
+
+from copy import deepcopy
+
+import pytest
+
+from pydbml._classes.note import EMPTY_NOTE
+from pydbml.classes import Column
+from pydbml.classes import EnumItem
+from pydbml.classes import Expression
+from pydbml.classes import Index
 from pydbml.classes import Note
+from pydbml.classes import Reference
 
 
 def test_init_types():
@@ -21,3 +33,66 @@ def test_str(note1: Note) -> None:
 
 def test_repr(note1: Note) -> None:
     assert repr(note1) == "Note('Simple note')"
+
+
+def test_empty_note_shared() -> None:
+    c1 = Column('c1', 'int')
+    c2 = Column('c2', 'int', note='')
+    i = Index([c1])
+    item = EnumItem('en-US')
+    assert c1._note is c2._note is i._note is item._note is EMPTY_NOTE
+    assert EMPTY_NOTE.parent is None
+    assert c1.note.parent is c1
+    assert c1.note == Note('')
+    assert Note('') == c1.note
+    assert not c1.note
+
+
+def test_empty_note_immutable() -> None:
+    with pytest.raises(AttributeError):
+        EMPTY_NOTE.text = 'note'
+    c1 = Column('c1', 'int')
+    c1.note = Note('note')
+    assert c1.note.parent is c1
+    assert EMPTY_NOTE.text == ''
+
+
+def test_empty_note_copy_on_write() -> None:
+    c1 = Column('c1', 'int')
+    c2 = Column('c2', 'int')
+    i = Index([c1])
+    item = EnumItem('en-US')
+    for obj in (c1, i, item):
+        note = obj.note
+        note.text = 'note'
+        assert type(note) is Note
+        assert obj.note is note
+        assert note.parent is obj
+        assert obj.note.text == 'note'
+    assert c2.note.text == ''
+    assert c2._note is EMPTY_NOTE
+    assert EMPTY_NOTE.text == ''
+
+
+def test_empty_note_write_invalidates() -> None:
+    c1 = Column('c1', 'int')
+    fingerprint = c1.fingerprint()
+    c1.note.text = 'note'
+    assert c1.fingerprint() != fingerprint
+    assert c1.fingerprint() == Column('c1', 'int', note='note').fingerprint()
+
+
+def test_empty_note_copy() -> None:
+    c1 = Column('c1', 'int')
+    assert deepcopy(c1)._note is EMPTY_NOTE
+    assert pickle.loads(pickle.dumps(c1))._note is EMPTY_NOTE
+    c2 = pickle.loads(pickle.dumps(Column('c2', 'int', note='note')))
+    assert c2.note.text == 'note'
+    assert c2.note.parent is c2
+
+
+def test_no_instance_dict() -> None:
+    c1 = Column('c1', 'int')
+    ref = Reference('>', c1, Column('c2', 'int'))
+    for obj in (c1, Index([c1]), Note('note'), EnumItem('en-US'), Expression('now()'), ref):
+        assert not hasattr(obj, '__dict__'), obj
@@ -1,4 +1,5 @@
 from unittest import TestCase
+from unittest.mock import patch
 
 from pydbml.classes import Column
 from pydbml.classes import Reference
@@ -20,6 +21,46 @@ class TestReference(TestCase):
         t.add_column(c1)
         self.assertIs(ref.table1, t)
 
+    def test_tables_cached(self) -> None:
+        t1 = Table('products', columns=[Column('id', 'integer'), Column('name', 'varchar')])
+        t2 = Table('orders', columns=[Column('product_id', 'integer')])
+        ref = Reference('<', t1['id'], t2['product_id'])
+        with patch.object(Reference, '_validate') as mock_validate:
+            self.assertIs(ref.table1, t1)
+            self.assertIs(ref.table2, t2)
+            self.assertIs(ref.table1, t1)
+            self.assertEqual(mock_validate.call_count, 1)
+
+    def test_tables_reset(self) -> None:
+        t1 = Table('products', columns=[Column('id', 'integer'), Column('name', 'varchar')])
+        t2 = Table('orders', columns=[Column('product_id', 'integer')])
+        ref = Reference('<', t1['id'], t2['product_id'])
+        self.assertIs(ref.table1, t1)
+        ref.col1 = [t2['product_id']]
+        self.assertIs(ref.table1, t2)
+        ref.col1 = [t1['id']]
+        self.assertIs(ref.table1, t1)
+        ref.col1.append(t2['product_id'])
+        with self.assertRaises(DBMLError):
+            ref.table1
+        ref.col1.pop()
+        t3 = Table('items')
+        t3.add_column(t1.delete_column(t1['id']))
+        self.assertIs(ref.table1, t3)
+        ref.col1[0].table = None
+        self.assertIsNone(ref.table1)
+
+    def test_tables_reset_on_item_replace(self) -> None:
+        t1 = Table('products', columns=[Column('id', 'integer')])
+        t2 = Table('orders', columns=[Column('product_id', 'integer')])
+        t3 = Table('items', columns=[Column('product_id', 'integer')])
+        ref = Reference('<', t1['id'], t2['product_id'])
+        self.assertIs(ref.table2, t2)
+        ref.col2[0] = t3['product_id']
+        self.assertIs(ref.table2, t3)
+        ref.col1[0] = t3['product_id']
+        self.assertIs(ref.table1, t3)
+
     def test_join_table(self) -> None:
         t1 = Table('books')
         c11 = Column('id', 'integer', pk=True)
@@ -38,6 +38,66 @@ class TestTable(TestCase):
         with self.assertRaises(ColumnNotFoundError):
             t['wrong']
 
+    def test_getitem_after_delete(self) -> None:
+        t = Table('products')
+        c1 = Column('col1', 'integer')
+        c2 = Column('col2', 'integer')
+        t.add_column(c1)
+        t.add_column(c2)
+        t.delete_column(c1)
+        with self.assertRaises(ColumnNotFoundError):
+            t['col1']
+        t.delete_column(0)
+        with self.assertRaises(ColumnNotFoundError):
+            t['col2']
+
+    def test_getitem_after_rename(self) -> None:
+        t = Table('products')
+        c1 = Column('col1', 'integer')
+        t.add_column(c1)
+        c1.name = 'renamed'
+        self.assertIs(t['renamed'], c1)
+        with self.assertRaises(ColumnNotFoundError):
+            t['col1']
+        t.delete_column(c1)
+        c1.name = 'col1'
+        with self.assertRaises(ColumnNotFoundError):
+            t['col1']
+
+    def test_getitem_duplicate_names(self) -> None:
+        t = Table('products')
+        c1 = Column('col', 'integer')
+        c2 = Column('col', 'varchar')
+        t.add_column(c1)
+        t.add_column(c2)
+        self.assertIs(t['col'], c1)
+        c1.name = 'other'
+        self.assertIs(t['col'], c2)
+        c1.name = 'col'
+        self.assertIs(t['col'], c1)
+        t.delete_column(c1)
+        self.assertIs(t['col'], c2)
+
+    def test_getitem_after_list_changes(self) -> None:
+        c1 = Column('col1', 'integer')
+        c2 = Column('col2', 'integer')
+        t = Table('products', columns=[c1, c2])
+        t.columns.remove(c1)
+        with self.assertRaises(ColumnNotFoundError):
+            t['col1']
+        self.assertIs(t['col2'], c2)
+        t.columns.pop()
+        with self.assertRaises(ColumnNotFoundError):
+            t['col2']
+        c3 = Column('col1', 'varchar')
+        t.columns.append(c3)
+        self.assertIs(t['col1'], c3)
+        t.columns[0] = c1
+        self.assertIs(t['col1'], c1)
+        t.columns.insert(0, c2)
+        self.assertIs(t['col2'], c2)
+        self.assertIs(t['col1'], c1)
+
     def test_init_with_columns(self) -> None:
         t = Table(
             'products',
@@ -175,12 +235,81 @@ class TestTable(TestCase):
         self.assertEqual(t.get_refs(), [r1, r2, r3])
         self.assertEqual(t2.get_refs(), [])
 
+    def test_get_refs_after_changes(self):
+        t = Table('products')
+        c11 = Column('id', 'integer')
+        c12 = Column('name', 'varchar2')
+        t.add_column(c11)
+        t.add_column(c12)
+        t2 = Table('names')
+        c21 = Column('id', 'integer')
+        t2.add_column(c21)
+        s = Database()
+        s.add(t)
+        s.add(t2)
+        r1 = Reference('>', c12, c21)
+        r2 = Reference('-', c11, c21)
+        s.add(r1)
+        s.add(r2)
+        self.assertEqual(t.get_refs(), [r1, r2])
+        self.assertEqual(c12.get_refs(), [r1])
+        s.delete(r1)
+        self.assertEqual(t.get_refs(), [r2])
+        self.assertEqual(c12.get_refs(), [])
+        r2.col1 = [c21]
+        r2.col2 = [c11]
+        self.assertEqual(t.get_refs(), [])
+        self.assertEqual(t2.get_refs(), [r2])
+        t2.delete_column(c21)
+        self.assertEqual(t2.get_refs(), [])
+        s.refs.append(r1)
+        self.assertEqual(t.get_refs(), [r1])
+
     def test_note_property(self):
         note1 = Note('table note')
         t = Table(name='test')
         t.note = note1
         self.assertIs(t.note.parent, t)
 
+    def test_primary_key(self) -> None:
+        c1 = Column('id', 'integer', pk=True)
+        c2 = Column('name', 'varchar')
+        t = Table('products', columns=[c1, c2])
+        self.assertEqual(t.primary_key, (c1,))
+        self.assertFalse(t._has_composite_pk())
+        c2.pk = True
+        self.assertEqual(t.primary_key, (c1, c2))
+        self.assertTrue(t._has_composite_pk())
+        t.delete_column(c1)
+        self.assertEqual(t.primary_key, (c2,))
+        c3 = Column('code', 'varchar', pk=True)
+        t.add_column(c3)
+        self.assertEqual(t.primary_key, (c2, c3))
+        c1.pk = False  # not in the table anymore
+        self.assertEqual(t.primary_key, (c2, c3))
+
+    def test_primary_key_columns_changed(self) -> None:
+        c1 = Column('id', 'integer', pk=True)
+        t = Table('products', columns=[c1, Column('name', 'varchar')])
+        self.assertEqual(t.primary_key, (c1,))
+        c2 = Column('code', 'varchar', pk=True)
+        t.columns.append(c2)
+        self.assertEqual(t.primary_key, (c1, c2))
+        db = Database()
+        db.add(t)
+        t.sql
+        c3 = Column('name', 'varchar', pk=True)
+        t.columns[1] = c3
+        db.invalidate()
+        self.assertEqual(t.primary_key, (c1, c3, c2))
+        self.assertIn('PRIMARY KEY ("id", "name", "code")', t.sql)
+
+    def test_primary_key_not_compared(self) -> None:
+        t1 = Table('products', columns=[Column('id', 'integer', pk=True)])
+        t2 = Table('products', columns=[Column('id', 'integer', pk=True)])
+        t1.primary_key
+        self.assertEqual(t1, t2)
+
 
 class TestAddIndex:
     @staticmethod
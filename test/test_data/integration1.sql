@@ -4,14 +4,6 @@ CREATE TYPE "level" AS ENUM (
   'senior'
 );
 
-CREATE TABLE "books" (
-  "id" integer PRIMARY KEY AUTOINCREMENT,
-  "title" varchar,
-  "author" varchar,
-  "country_id" integer,
-  CONSTRAINT "Country Reference" FOREIGN KEY ("country_id") REFERENCES "countries" ("id")
-);
-
 CREATE TABLE "Employees" (
   "id" integer PRIMARY KEY AUTOINCREMENT,
   "name" varchar,
@@ -31,4 +23,12 @@ CREATE UNIQUE INDEX ON "countries" ("name");
 
 CREATE INDEX ON "countries" ((UPPER(name)));
 
+CREATE TABLE "books" (
+  "id" integer PRIMARY KEY AUTOINCREMENT,
+  "title" varchar,
+  "author" varchar,
+  "country_id" integer,
+  CONSTRAINT "Country Reference" FOREIGN KEY ("country_id") REFERENCES "countries" ("id")
+);
+
 ALTER TABLE "Employees" ADD FOREIGN KEY ("favorite_book_id") REFERENCES "books" ("id");
\ No newline at end of file
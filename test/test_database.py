@@ -1,9 +1,13 @@
 import os
+import pickle
 
+from copy import deepcopy
+from io import StringIO
 from pathlib import Path
 from unittest import TestCase
 from unittest.mock import Mock
 
+from pydbml import PyDBML
 from pydbml.classes import Column
 from pydbml.classes import Enum
 from pydbml.classes import EnumItem
@@ -126,6 +130,37 @@ class TestDatabase(TestCase):
         with self.assertRaises(DatabaseValidationError):
             database.add_reference(ref3)
 
+    def test_add_equal_reference(self) -> None:
+        c = Column('test', 'varchar', True)
+        t = Table('test_table')
+        t.add_column(c)
+        database = Database()
+        database.add_table(t)
+        c2 = Column('test2', 'integer')
+        t2 = Table('test_table2')
+        t2.add_column(c2)
+        database.add_table(t2)
+        database.add_reference(Reference('>', c, c2))
+        with self.assertRaises(DatabaseValidationError):
+            database.add_reference(Reference('>', c, c2))
+        ref = database.add_reference(Reference('<', c, c2))
+        self.assertIs(database.refs[-1], ref)
+
+    def test_add_equal_reference_after_rename(self) -> None:
+        database = Database()
+        t1 = database.add(Table('t1', columns=[Column('a', 'int')]))
+        t2 = database.add(Table('t2', columns=[Column('id', 'int')]))
+        ref = database.add(Reference('>', t1['a'], t2['id']))
+        t1['a'].name = 'renamed'
+        with self.assertRaises(DatabaseValidationError):
+            database.add_reference(Reference('>', t1['renamed'], t2['id']))
+        t2.name = 'renamed'
+        ref.type = '<'
+        with self.assertRaises(DatabaseValidationError):
+            database.add_reference(Reference('<', t1['renamed'], t2['id']))
+        database.delete_reference(ref)
+        database.add_reference(Reference('<', t1['renamed'], t2['id']))
+
     def test_delete_reference(self) -> None:
         c = Column('test', 'varchar', True)
         t = Table('test_table')
@@ -192,6 +227,32 @@ class TestDatabase(TestCase):
             database.delete_enum(e)
         self.assertIsNone(e.database)
 
+    def test_delete_equal_enum(self) -> None:
+        e = Enum('myenum', [EnumItem('a'), EnumItem('b')])
+        database = Database()
+        database.add_enum(e)
+        e2 = Enum('myenum', [EnumItem('a'), EnumItem('b')])
+        with self.assertRaises(DatabaseValidationError):
+            database.delete_enum(e2)
+        self.assertIs(e.database, database)
+        self.assertIs(database.enums[0], e)
+
+    def test_add_enum_after_rename(self) -> None:
+        e = Enum('myenum', [EnumItem('a'), EnumItem('b')])
+        database = Database()
+        database.add_enum(e)
+        e.name = 'renamed'
+        e2 = Enum('myenum', [EnumItem('a2'), EnumItem('b2')])
+        database.add_enum(e2)
+        self.assertEqual(database.enums, [e, e2])
+        e3 = Enum('renamed', [EnumItem('a3')])
+        with self.assertRaises(DatabaseValidationError):
+            database.add_enum(e3)
+        e.schema = 'other'
+        database.add_enum(e3)
+        with self.assertRaises(DatabaseValidationError):
+            database.add_enum(Enum('renamed', [EnumItem('a4')], schema='other'))
+
     def test_add_table_group(self) -> None:
         t1 = Table('table1')
         t2 = Table('table2')
@@ -214,6 +275,21 @@ class TestDatabase(TestCase):
         with self.assertRaises(DatabaseValidationError):
             database.add_table_group(tg2)
 
+    def test_add_table_group_after_rename(self) -> None:
+        t1 = Table('table1')
+        tg = TableGroup('mytablegroup', [t1])
+        database = Database()
+        database.add_table_group(tg)
+        tg.name = 'renamed'
+        tg2 = TableGroup('mytablegroup', [t1])
+        database.add_table_group(tg2)
+        self.assertEqual(database.table_groups, [tg, tg2])
+        with self.assertRaises(DatabaseValidationError):
+            database.add_table_group(TableGroup('renamed', [t1]))
+        database.delete_table_group(tg2)
+        with self.assertRaises(DatabaseValidationError):
+            database.delete_table_group(tg2)
+
     def test_delete_table_group(self) -> None:
         t1 = Table('table1')
         t2 = Table('table2')
@@ -369,6 +445,31 @@ class TestDatabase(TestCase):
         with self.assertRaises(AttributeError):
             t.database
 
+    def test_write(self) -> None:
+        database = PyDBML(TEST_DATA_PATH / 'general.dbml')
+        sql = StringIO()
+        database.write_sql(sql)
+        self.assertEqual(sql.getvalue(), database.sql)
+        dbml = StringIO()
+        database.write_dbml(dbml)
+        self.assertEqual(dbml.getvalue(), database.dbml)
+
+    def test_copy(self) -> None:
+        database = PyDBML(TEST_DATA_PATH / 'general.dbml')
+        sql = database.sql
+        for copy in (deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):
+            with self.subTest(copy=copy):
+                copied = copy(database)
+                self.assertEqual(copied.sql, sql)
+                ref = copied.refs[0]
+                self.assertIs(copied.delete(ref), ref)
+                self.assertIs(copied.add(ref), ref)
+                enum = copied.enums[0]
+                enum.name = 'renamed'
+                self.assertIn('"renamed"', copied.sql)
+                self.assertIs(copied.delete(enum), enum)
+        self.assertEqual(database.sql, sql)
+
 
 def test_repr() -> None:
     assert repr(Database()) == "<Database>"
@@ -1,5 +1,6 @@
 import doctest
 
+from pydbml import changes
 from pydbml import database
 from pydbml._classes import column
 from pydbml._classes import enum
@@ -10,10 +11,16 @@ from pydbml._classes import project
 from pydbml._classes import reference
 from pydbml._classes import table
 from pydbml._classes import table_group
+from pydbml.parser import incremental
 from pydbml.parser import parser
+from pydbml.parser import profiler
+from pydbml.parser import scanner
+from pydbml.parser import span
+from pydbml.renderer.sql.default import utils as sql_utils
 
 
 def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(changes))
     tests.addTests(doctest.DocTestSuite(column))
     tests.addTests(doctest.DocTestSuite(enum))
     tests.addTests(doctest.DocTestSuite(expression))
@@ -25,4 +32,9 @@ def load_tests(loader, tests, ignore):
     tests.addTests(doctest.DocTestSuite(table))
     tests.addTests(doctest.DocTestSuite(table_group))
     tests.addTests(doctest.DocTestSuite(parser))
+    tests.addTests(doctest.DocTestSuite(profiler))
+    tests.addTests(doctest.DocTestSuite(incremental))
+    tests.addTests(doctest.DocTestSuite(scanner))
+    tests.addTests(doctest.DocTestSuite(span))
+    tests.addTests(doctest.DocTestSuite(sql_utils))
     return tests
@@ -0,0 +1,157 @@
+import os
+import pickle
+
+from copy import deepcopy
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.classes import Column
+from pydbml.classes import Enum
+from pydbml.classes import Index
+from pydbml.classes import Note
+from pydbml.classes import Project
+from pydbml.classes import Reference
+from pydbml.classes import Table
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestFingerprint(TestCase):
+    def setUp(self) -> None:
+        self.source = (TEST_DATA_PATH / 'general.dbml').read_text()
+        self.db = PyDBML(self.source)
+
+    def test_same_schema(self) -> None:
+        other = PyDBML(self.source)
+        self.assertEqual(self.db.fingerprint(), other.fingerprint())
+        for table, other_table in zip(self.db.tables, other.tables):
+            self.assertEqual(table.fingerprint(), other_table.fingerprint())
+        for ref, other_ref in zip(self.db.refs, other.refs):
+            self.assertEqual(ref.fingerprint(), other_ref.fingerprint())
+        self.assertEqual(len(self.db.fingerprint()), 32)
+
+    def test_equal_values(self) -> None:
+        c1 = Column('id', 'int', default=1, pk=True)
+        c2 = Column('id', 'int', default=True, pk=1)
+        self.assertEqual(c1, c2)
+        self.assertEqual(c1.fingerprint(), c2.fingerprint())
+        self.assertNotEqual(c1.fingerprint(), Column('id', 'int', default='1').fingerprint())
+
+    def test_column_change(self) -> None:
+        db_fingerprint = self.db.fingerprint()
+        table, other_table = self.db.tables[:2]
+        table_fingerprint = table.fingerprint()
+        column = table.columns[0]
+        column_fingerprint = column.fingerprint()
+        column.not_null = not column.not_null
+        self.assertIsNone(table._fingerprint)
+        self.assertIsNotNone(other_table._fingerprint)
+        self.assertNotEqual(column.fingerprint(), column_fingerprint)
+        self.assertNotEqual(table.fingerprint(), table_fingerprint)
+        self.assertNotEqual(self.db.fingerprint(), db_fingerprint)
+        column.not_null = not column.not_null
+        self.assertEqual(self.db.fingerprint(), db_fingerprint)
+
+    def test_note_change(self) -> None:
+        table = self.db.tables[0]
+        fingerprint = self.db.fingerprint()
+        table.columns[0].note = Note('new note')
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+        fingerprint = self.db.fingerprint()
+        table.columns[0].note.text = 'changed'
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+
+    def test_add_delete(self) -> None:
+        table = self.db.tables[0]
+        fingerprint = self.db.fingerprint()
+        column = Column('new', 'int')
+        table.add_column(column)
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+        table.add_index(Index([column]))
+        table.delete_index(len(table.indexes) - 1)
+        table.delete_column(column)
+        self.assertEqual(self.db.fingerprint(), fingerprint)
+        new_table = self.db.add(Table('new', columns=[Column('id', 'int')]))
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+        self.db.delete(new_table)
+        self.assertEqual(self.db.fingerprint(), fingerprint)
+
+    def test_enum_change(self) -> None:
+        enum = self.db.enums[0]
+        column = next(c for t in self.db.tables for c in t.columns if c.type is enum)
+        fingerprint = self.db.fingerprint()
+        column_fingerprint = column.fingerprint()
+        enum.items[0].name = 'renamed'
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+        self.assertNotEqual(column.fingerprint(), column_fingerprint)
+        column_fingerprint = column.fingerprint()
+        enum.name = 'renamed'
+        self.assertNotEqual(column.fingerprint(), column_fingerprint)
+        enum.add_item('new')
+        self.assertIsNone(enum._fingerprint)
+
+    def test_table_rename(self) -> None:
+        ref = self.db.refs[0]
+        ref_fingerprint = ref.fingerprint()
+        fingerprint = self.db.fingerprint()
+        ref.col1[0].table.name = 'renamed'
+        # table names are a part of the database fingerprint only
+        self.assertEqual(ref.fingerprint(), ref_fingerprint)
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+
+    def test_database_members(self) -> None:
+        self.db.add(Project('project'))
+        fingerprint = self.db.fingerprint()
+        self.db.table_groups[0].color = '#000'
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+        fingerprint = self.db.fingerprint()
+        self.db.project.note = Note('new note')
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+
+    def test_equality_short_circuit(self) -> None:
+        t1 = Table('t', columns=[Column('id', 'int')])
+        t2 = Table('t', columns=[Column('id', 'int')])
+        self.assertEqual(t1, t2)
+        t1.fingerprint()
+        t2.fingerprint()
+        self.assertEqual(t1, t2)
+        # a mismatch is enough to tell the tables apart
+        t2._fingerprint = 'other'
+        self.assertNotEqual(t1, t2)
+
+    def test_standalone_column_change(self) -> None:
+        c1 = Column('id', 'int')
+        c2 = Column('id', 'bigint')
+        t1 = Table('t1', columns=[c1])
+        t2 = Table('t1', columns=[c2])
+        ref1 = Reference('>', c1, Column('a', 'int'))
+        ref2 = Reference('>', c2, Column('a', 'int'))
+        index1 = Index([c1])
+        index2 = Index([c2])
+        for obj, other in ((ref1, ref2), (index1, index2)):
+            with self.subTest(obj=obj):
+                self.assertNotEqual(obj.fingerprint(), other.fingerprint())
+        # neither the references nor the detached indexes hear of the change
+        c1.type = 'bigint'
+        self.assertEqual(t1, t2)
+        for obj, other in ((ref1, ref2), (index1, index2)):
+            with self.subTest(obj=obj):
+                self.assertEqual(obj, other)
+                self.assertEqual(obj.fingerprint(), other.fingerprint())
+
+    def test_cached(self) -> None:
+        enum = Enum('e', ['a'])
+        self.assertIs(enum.fingerprint(), enum.fingerprint())
+        self.assertIs(self.db.fingerprint(), self.db.fingerprint())
+
+    def test_copy(self) -> None:
+        fingerprint = self.db.fingerprint()
+        for copy in (deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))):
+            with self.subTest(copy=copy):
+                table = copy(self.db.tables[0])
+                self.assertEqual(table.fingerprint(), self.db.tables[0].fingerprint())
+                table.columns[0].not_null = not table.columns[0].not_null
+                self.assertNotEqual(table.fingerprint(), self.db.tables[0].fingerprint())
+                self.assertEqual(self.db.fingerprint(), fingerprint)
@@ -0,0 +1,133 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+import pyparsing as pp
+
+from pydbml import PyDBML
+from pydbml.exceptions import TableNotFoundError
+from pydbml.parser import incremental
+from pydbml.parser.incremental import IncrementalParser
+from pydbml.parser.incremental import common_prefix
+from pydbml.parser.incremental import common_suffix
+from pydbml.parser.scanner import ScanError
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+SOURCE = '''\
+enum status {
+  active
+  archived
+}
+
+Table users {
+  id int [pk]
+  status status
+}
+
+Table posts {
+  id int [pk]
+  user_id int [ref: > users.id]
+}
+
+Ref: posts.id - users.id
+
+TableGroup g {
+  users
+  posts
+}
+'''
+
+
+class TestCommon(TestCase):
+    def test_prefix_suffix(self) -> None:
+        self.assertEqual(common_prefix('abcdef', 'abcxef'), 3)
+        self.assertEqual(common_prefix('abc', 'abc'), 3)
+        self.assertEqual(common_prefix('', 'abc'), 0)
+        self.assertEqual(common_suffix('abcdef', 'abcxef', 3), 2)
+        self.assertEqual(common_suffix('aaa', 'aaaa', 1), 1)
+
+
+class TestIncrementalParser(TestCase):
+    def assert_same_as_parse(self, parser: IncrementalParser, source: str) -> None:
+        db = parser.update(source)
+        expected = PyDBML.parse(source)
+        self.assertEqual(db.sql, expected.sql)
+        self.assertEqual(db.dbml, expected.dbml)
+
+    def test_test_data(self) -> None:
+        parser = IncrementalParser()
+        for path in sorted(TEST_DATA_PATH.glob('*.dbml')):
+            if not path.name.startswith('wrong_'):
+                with self.subTest(path=path.name):
+                    self.assert_same_as_parse(parser, path.read_text(encoding='utf8'))
+
+    def test_unchanged_objects_are_kept(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        users, posts = db.tables
+        inline_ref, ref = db.refs
+        with patch.object(incremental, 'parse_block_sources', wraps=incremental.parse_block_sources) as parse:
+            new_db = parser.update(SOURCE.replace('  user_id int', '  title varchar\n  user_id int'))
+        self.assertIs(new_db, db)
+        self.assertEqual(parse.call_count, 1)
+        self.assertIs(db.tables[0], users)
+        self.assertIsNot(db.tables[1], posts)
+        self.assertEqual([c.name for c in db.tables[1].columns], ['id', 'title', 'user_id'])
+        # both refs point to the rebuilt posts table
+        self.assertIsNot(db.refs[0], inline_ref)
+        self.assertIsNot(db.refs[1], ref)
+        self.assertIs(db.refs[1].table1, db.tables[1])
+        self.assertIs(db.table_groups[0].items[1], db.tables[1])
+
+    def test_moved_block_is_not_parsed(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        enum = db.enums[0]
+        enum_block, rest = SOURCE.split('\n\n', 1)
+        parser.update(rest + '\n' + enum_block + '\n')
+        self.assertIs(db.enums[0], enum)
+        self.assertIs(db.tables[0]['status'].type, enum)
+
+    def test_enum_change(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        users = db.tables[0]
+        self.assert_same_as_parse(parser, SOURCE.replace('  archived\n', '  archived\n  deleted\n'))
+        self.assertIsNot(db.tables[0], users)
+        self.assertIs(db.tables[0]['status'].type, db.enums[0])
+
+    def test_table_rename(self) -> None:
+        parser = IncrementalParser()
+        parser.update(SOURCE)
+        self.assert_same_as_parse(parser, SOURCE.replace('users', 'people'))
+        self.assert_same_as_parse(parser, SOURCE.replace('Table users {', 'Table users as people {'))
+
+    def test_syntax_error(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        tables = list(db.tables)
+        bad = SOURCE.replace('id int [pk]\n  status', 'id int [pk\n  status')
+        with self.assertRaises(pp.ParseBaseException) as e:
+            parser.update(bad)
+        with self.assertRaises(pp.ParseBaseException) as expected:
+            PyDBML.parse(bad)
+        self.assertEqual(str(e.exception), str(expected.exception))
+        # the fast path error is not chained to the full grammar one
+        context = e.exception.__context__
+        while context is not None:
+            self.assertNotIsInstance(context, ScanError)
+            context = context.__context__
+        self.assertEqual(db.tables, tables)
+
+    def test_missing_table(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        with self.assertRaises(TableNotFoundError):
+            parser.update(SOURCE.replace('Ref: posts.id', 'Ref: missing.id'))
+        new_db = parser.update(SOURCE)
+        self.assertIsNot(new_db, db)
+        self.assertEqual(new_db.sql, PyDBML.parse(SOURCE).sql)
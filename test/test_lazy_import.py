@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import List
+from unittest import TestCase
+
+from pydbml import Database
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+
+
+ROOT = Path(__file__).parent.parent
+
+
+def loaded_modules(code: str) -> List[str]:
+    code += '\nimport sys\nprint(" ".join(sorted(sys.modules)))'
+    result = subprocess.run([sys.executable, '-c', code], check=True, capture_output=True, text=True, cwd=ROOT)
+    return result.stdout.split()
+
+
+class TestLazyImport(TestCase):
+    def test_import(self) -> None:
+        modules = loaded_modules('import pydbml')
+        self.assertNotIn('pydbml.parser', modules)
+        self.assertNotIn('pydbml.definitions', modules)
+        self.assertNotIn('pydbml.renderer.sql.default', modules)
+        self.assertNotIn('pydbml.renderer.dbml.default', modules)
+
+    def test_renderer_on_use(self) -> None:
+        modules = loaded_modules(
+            'from pydbml import Database\n'
+            'from pydbml.classes import Column, Table\n'
+            'db = Database()\n'
+            'db.add(Table("t", columns=[Column("id", "int")]))\n'
+            'db.sql'
+        )
+        self.assertIn('pydbml.renderer.sql.default', modules)
+        self.assertNotIn('pydbml.renderer.dbml.default', modules)
+        self.assertNotIn('pydbml.parser', modules)
+
+    def test_parser_on_use(self) -> None:
+        modules = loaded_modules('from pydbml import PyDBML')
+        self.assertIn('pydbml.parser.parser', modules)
+
+    def test_default_renderers(self) -> None:
+        db = Database()
+        self.assertIs(db.sql_renderer, DefaultSQLRenderer)
+        self.assertIs(db.dbml_renderer, DefaultDBMLRenderer)
+        db.sql_renderer = DefaultDBMLRenderer
+        self.assertIs(db.sql_renderer, DefaultDBMLRenderer)
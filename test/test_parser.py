@@ -1,12 +1,20 @@
 import os
+import pickle
 
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 
+import pyparsing as pp
+
 from pydbml import PyDBML
 from pydbml.exceptions import ColumnNotFoundError
+from pydbml.exceptions import SourceFileError
 from pydbml.exceptions import TableNotFoundError
 from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.parser import get_syntax
+from pydbml.parser.parser import packrat_parsing
+from pydbml.parser.scanner import split_blocks
 
 
 TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
@@ -185,3 +193,157 @@ def test_repr_pydbml() -> None:
 def test_repr_pydbml_parser() -> None:
     assert repr(PyDBMLParser('')) == "<PyDBMLParser>"
 
+
+class TestSyntaxCache(TestCase):
+    def test_syntax_is_shared(self) -> None:
+        p1 = PyDBMLParser('')
+        p2 = PyDBMLParser('')
+        p1._set_syntax()
+        p2._set_syntax()
+        self.assertIs(p1._syntax, p2._syntax)
+        self.assertIs(p1._syntax, get_syntax(False))
+
+    def test_syntax_per_allow_properties(self) -> None:
+        self.assertIsNot(get_syntax(False), get_syntax(True))
+        source = 'Table t {\n    id int\n    foo: "bar"\n}\n'
+        db = PyDBML.parse(source, allow_properties=True)
+        self.assertEqual(db.tables[0].properties, {'foo': 'bar'})
+
+    def test_blueprints_not_shared_between_parses(self) -> None:
+        source = (TEST_DATA_PATH / 'general.dbml').read_text()
+        p1 = PyDBMLParser(source)
+        p1.parse()
+        p2 = PyDBMLParser(source)
+        p2.parse()
+        self.assertEqual(len(p1.tables), len(p2.tables))
+        self.assertTrue(all(t.parser is p1 for t in p1.tables))
+        self.assertTrue(all(t.parser is p2 for t in p2.tables))
+
+
+class TestPackrat(TestCase):
+    def test_same_result(self) -> None:
+        source = (TEST_DATA_PATH / 'general.dbml').read_text()
+        expected = PyDBML.parse(source)
+        result = PyDBML.parse(source, packrat=True, cache_size=16)
+        self.assertEqual(result.dbml, expected.dbml)
+        self.assertEqual(result.sql, expected.sql)
+
+    def test_global_state_restored(self) -> None:
+        parse_method = pp.ParserElement._parse
+        PyDBML.parse('Table t {\n    id int\n}\n', packrat=True)
+        self.assertFalse(pp.ParserElement._packratEnabled)
+        self.assertIs(pp.ParserElement._parse, parse_method)
+
+    def test_global_state_restored_on_error(self) -> None:
+        with self.assertRaises(pp.ParseBaseException):
+            PyDBML.parse('Table t {\n', packrat=True)
+        self.assertFalse(pp.ParserElement._packratEnabled)
+
+    def test_nested(self) -> None:
+        with packrat_parsing():
+            self.assertTrue(pp.ParserElement._packratEnabled)
+            with packrat_parsing():
+                self.assertTrue(pp.ParserElement._packratEnabled)
+            self.assertTrue(pp.ParserElement._packratEnabled)
+        self.assertFalse(pp.ParserElement._packratEnabled)
+
+
+class TestWorkers(TestCase):
+    def test_same_result(self) -> None:
+        source = (TEST_DATA_PATH / 'integration1.dbml').read_text()
+        expected = PyDBML.parse(source)
+        result = PyDBML.parse(source, workers=2)
+        self.assertEqual(result.dbml, expected.dbml)
+        self.assertEqual(result.sql, expected.sql)
+
+    def test_blueprints_attached_in_order(self) -> None:
+        source = (TEST_DATA_PATH / 'general.dbml').read_text()
+        expected = PyDBMLParser(source)
+        expected.parse()
+        parser = PyDBMLParser(source, workers=2)
+        parser.parse()
+        self.assertEqual([t.name for t in parser.tables], [t.name for t in expected.tables])
+        self.assertEqual(repr(parser.refs), repr(expected.refs))
+        self.assertTrue(all(t.parser is parser for t in parser.tables))
+        self.assertTrue(all(c.parser is parser for t in parser.tables for c in t.columns))
+
+    def test_errors(self) -> None:
+        with self.assertRaises(SyntaxError):
+            PyDBML.parse('Table a {\n  id int\n}\nTable b {\n}\n', workers=2)
+
+
+class TestParseFiles(TestCase):
+    def setUp(self) -> None:
+        self.tmp = TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+        self.source = (TEST_DATA_PATH / 'general.dbml').read_text()
+        # one block per file, refs come before the tables they point to
+        (self.path / 'refs').mkdir()
+        self.files = {}
+        for i, block in enumerate(split_blocks(self.source)):
+            folder = self.path / 'refs' if block.keyword == 'ref' else self.path
+            path = folder / f'{i:02}.dbml'
+            path.write_text(self.source[block.start:block.end])
+            self.files.setdefault(block.keyword, path)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_same_result(self) -> None:
+        expected = PyDBML.parse(self.source)
+        result = PyDBML.parse_directory(self.path)
+        self.assertEqual(result.sql, expected.sql)
+        self.assertEqual(len(result.refs), len(expected.refs))
+        self.assertEqual(len(result.table_groups), len(expected.table_groups))
+
+    def test_workers(self) -> None:
+        expected = PyDBML.parse_directory(self.path)
+        result = PyDBML.parse_directory(self.path, workers=2)
+        self.assertEqual(result.dbml, expected.dbml)
+
+    def test_spans(self) -> None:
+        path = self.files['table']
+        table = PyDBML.parse_files([path]).tables[0]
+        self.assertEqual(table.span.file, str(path))
+        self.assertEqual(table.span.text, path.read_text().strip())
+
+    def test_pattern(self) -> None:
+        expected = PyDBML.parse(self.source)
+        result = PyDBML.parse_directory(self.path, pattern='*.dbml')
+        self.assertEqual(len(result.tables), len(expected.tables))
+        # only inline refs, the files with Ref blocks are in a subdirectory
+        self.assertLess(len(result.refs), len(expected.refs))
+
+    def test_syntax_error(self) -> None:
+        path = self.path / 'wrong.dbml'
+        path.write_text('Table wrong {\n  id int\n  name\n}\n')
+        for workers in (None, 2):
+            with self.assertRaises(pp.ParseBaseException) as context:
+                PyDBML.parse_directory(self.path, workers=workers)
+            self.assertIsInstance(context.exception, SourceFileError)
+            self.assertEqual(context.exception.path, str(path))
+            self.assertIsInstance(context.exception.error, pp.ParseBaseException)
+            self.assertEqual(context.exception.lineno, context.exception.error.lineno)
+            self.assertIn('wrong.dbml: ', str(context.exception))
+
+    def test_build_error(self) -> None:
+        path = self.path / 'refs' / 'wrong.dbml'
+        path.write_text('Ref: missing.id > users.id\n')
+        with self.assertRaises(TableNotFoundError) as context:
+            PyDBML.parse_directory(self.path)
+        self.assertIsInstance(context.exception, SourceFileError)
+        self.assertEqual(context.exception.path, str(path))
+        self.assertIsInstance(context.exception.error, TableNotFoundError)
+
+    def test_wrapped_error(self) -> None:
+        class Unrecreatable(Exception):
+            def __init__(self, value: int) -> None:
+                super().__init__()
+
+        error = SourceFileError.wrap('a.dbml', TableNotFoundError('missing'))
+        copied = pickle.loads(pickle.dumps(error))
+        self.assertIsInstance(copied, TableNotFoundError)
+        self.assertEqual(str(copied), 'a.dbml: missing')
+        fallback = SourceFileError.wrap('a.dbml', Unrecreatable(1))
+        self.assertIs(type(fallback), SourceFileError)
+        self.assertIsInstance(fallback.error, Unrecreatable)
@@ -0,0 +1,74 @@
+import json
+import os
+
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydbml.parser import parser as parser_module
+from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.parser import get_syntax
+from pydbml.parser.profiler import COUNTERS
+from pydbml.parser.profiler import ParseProfile
+from pydbml.parser.profiler import named_elements
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestParseProfile(TestCase):
+    def setUp(self) -> None:
+        self.source = (TEST_DATA_PATH / 'general.dbml').read_text()
+
+    def test_report(self) -> None:
+        profile = ParseProfile()
+        db = PyDBMLParser(self.source).parse(profile=profile)
+        report = profile.report()
+        for phase in (
+            'set_syntax',
+            'parse_string',
+            'add_blueprints',
+            'build_database',
+            'build_database.tables',
+            'build_database.refs',
+        ):
+            self.assertGreaterEqual(report['phases'][phase], 0, phase)
+        table = report['elements']['table']
+        self.assertEqual(table['hits'], len(db.tables))
+        for counters in report['elements'].values():
+            self.assertEqual(list(counters), list(COUNTERS))
+            self.assertEqual(counters['tries'], counters['hits'] + counters['misses'])
+        self.assertEqual(json.loads(profile.to_json()), report)
+
+    def test_backtracks(self) -> None:
+        # index subjects are parsed with `^`, all alternatives are tried
+        source = 'Table a {\n  id int\n\n  indexes {\n    id\n  }\n}\n'
+        profile = ParseProfile()
+        PyDBMLParser(source).parse(profile=profile)
+        self.assertGreater(profile.report()['elements']['subject']['backtracks'], 0)
+
+    def test_grammar_restored(self) -> None:
+        elements = named_elements([get_syntax()])
+        before = [(e.debug, e.debugActions) for e in elements]
+        with self.assertRaises(Exception):
+            PyDBMLParser('Table a {\n  id int [foo]\n}').parse(profile=ParseProfile())
+        PyDBMLParser(self.source).parse(profile=ParseProfile())
+        self.assertEqual([(e.debug, e.debugActions) for e in elements], before)
+
+    def test_other_parses_not_counted(self) -> None:
+        profile = ParseProfile()
+        with profile.grammar([get_syntax()]) as (syntax,):
+            self.assertIsNot(syntax, get_syntax())
+            db = PyDBMLParser(self.source).parse()
+            self.assertFalse(profile.counters)
+            syntax.parse_string(self.source, parse_all=True)
+            self.assertTrue(profile.counters)
+        profiled = PyDBMLParser(self.source).parse(profile=ParseProfile())
+        self.assertEqual(profiled.dbml, db.dbml)
+
+    def test_no_workers(self) -> None:
+        profile = ParseProfile()
+        with patch.object(parser_module, 'ProcessPoolExecutor') as executor:
+            PyDBMLParser(self.source, workers=2).parse(profile=profile)
+        executor.assert_not_called()
+        self.assertIn('table', profile.report()['elements'])
@@ -0,0 +1,122 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.classes import Column
+from pydbml.classes import EnumItem
+from pydbml.classes import Note
+from pydbml.classes import Reference
+from pydbml.classes import Table
+from pydbml.classes import TableGroup
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestRenderCache(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(TEST_DATA_PATH / 'general.dbml')
+
+    def test_database(self) -> None:
+        sql = self.db.sql
+        self.assertIs(self.db.sql, sql)
+        dbml = self.db.dbml
+        self.assertIs(self.db.dbml, dbml)
+        self.assertEqual(self.db.sql_renderer.render_db(self.db), sql)
+
+    def test_objects(self) -> None:
+        table = self.db.tables[0]
+        column = table.columns[0]
+        self.assertIs(table.sql, table.sql)
+        self.assertIs(column.dbml, column.dbml)
+        self.assertIs(self.db.refs[0].sql, self.db.refs[0].sql)
+        self.assertIs(self.db.enums[0].items[0].sql, self.db.enums[0].items[0].sql)
+
+    def test_column_change(self) -> None:
+        sql = self.db.sql
+        table = self.db.tables[0]
+        table_sql = table.sql
+        column = table.columns[0]
+        column.not_null = not column.not_null
+        self.assertNotEqual(self.db.sql, sql)
+        self.assertNotEqual(table.sql, table_sql)
+        column.not_null = not column.not_null
+        self.assertEqual(self.db.sql, sql)
+
+    def test_note_and_enum_change(self) -> None:
+        dbml = self.db.dbml
+        self.db.tables[0].columns[0].note = Note('new note')
+        self.assertIn('new note', self.db.dbml)
+        self.db.enums[0].items[0].name = 'renamed'
+        self.assertIn('renamed', self.db.dbml)
+        self.assertNotEqual(self.db.dbml, dbml)
+
+    def test_reference_changes(self) -> None:
+        ref = next(r for r in self.db.refs if r.type == '>')
+        table = ref.col1[0].table
+        sql = table.sql
+        ref.inline = True
+        self.assertIn('FOREIGN KEY', table.sql)
+        sql = table.sql
+        ref.col2[0].table.name = 'renamed'
+        self.assertIn('"renamed"', table.sql)
+        self.assertNotEqual(table.sql, sql)
+
+        ref_sql = ref.sql
+        ref.on_delete = 'cascade'
+        self.assertNotEqual(ref.sql, ref_sql)
+
+    def test_items_changed_in_place(self) -> None:
+        enum = self.db.enums[0]
+        sql, dbml = self.db.sql, self.db.dbml
+        enum.items.append(EnumItem('new_item'))
+        self.assertIn("'new_item'", self.db.sql)
+        self.assertIn('new_item', self.db.dbml)
+        enum.items.pop()
+        self.assertEqual(self.db.sql, sql)
+        self.assertEqual(self.db.dbml, dbml)
+
+        table_group = TableGroup('new_group', [self.db.tables[0]])
+        self.db.add(table_group)
+        dbml = self.db.dbml
+        table_group.items.append(self.db.tables[1])
+        self.assertNotEqual(self.db.dbml, dbml)
+        self.assertIn(self.db.tables[1].name, table_group.dbml)
+
+    def test_invalidate(self) -> None:
+        table = self.db.tables[0]
+        sql, fingerprint = table.sql, self.db.fingerprint()
+        table.columns.append(Column('added', 'int'))
+        self.assertEqual(table.sql, sql)
+        self.db.invalidate()
+        self.assertIn('"added"', table.sql)
+        self.assertNotEqual(self.db.fingerprint(), fingerprint)
+
+    def test_add_delete(self) -> None:
+        sql = self.db.sql
+        table = self.db.add(Table('new_table', columns=[Column('id', 'int')]))
+        self.assertIn('new_table', self.db.sql)
+        self.db.delete(table)
+        self.assertEqual(self.db.sql, sql)
+        users, posts = self.db.tables[:2]
+        ref = self.db.add(Reference('>', posts.columns[-1], users.columns[0]))
+        self.assertNotEqual(self.db.sql, sql)
+        self.db.delete(ref)
+        self.assertEqual(self.db.sql, sql)
+
+    def test_renderer_and_properties(self) -> None:
+        self.db.tables[0].properties = {'key': 'value'}
+        self.assertNotIn("key: 'value'", self.db.dbml)
+        self.db.allow_properties = True
+        self.assertIn("key: 'value'", self.db.dbml)
+        self.db.sql_renderer = DefaultDBMLRenderer
+        self.assertEqual(self.db.sql, self.db.dbml)
+
+    def test_detached(self) -> None:
+        column = Column('id', 'int')
+        sql = column.sql
+        column.type = 'bigint'
+        self.assertNotEqual(column.sql, sql)
@@ -38,3 +38,16 @@ class TestRender:
             _unsupported_renderer = unsupported_renderer
 
         assert SampleRenderer2.render(1) == 'unsupported'
+
+
+def test_iter_render_db() -> None:
+    class SampleRenderer3(BaseRenderer):
+        model_renderers = {}
+
+        @classmethod
+        def render_db(cls, db) -> str:
+            return 'db'
+
+    assert list(SampleRenderer3.iter_render_db(None)) == ['db']
+    assert list(SampleRenderer3.iter_render_db(None, slice(0, None, 2))) == ['db']
+    assert list(SampleRenderer3.iter_render_db(None, slice(1, None, 2))) == []
@@ -31,14 +31,14 @@ def test_default_to_str(input: Any, expected: str) -> None:
 class TestRenderOptions:
     @staticmethod
     def test_refs(simple_column: Column) -> None:
-        simple_column.get_refs = Mock(
-            return_value=[
-                Mock(dbml="ref1", inline=True),
-                Mock(dbml="ref2", inline=False),
-                Mock(dbml="ref3", inline=True),
-            ]
-        )
-        assert render_options(simple_column) == " [ref1, ref3]"
+        refs = [
+            Mock(dbml="ref1", inline=True),
+            Mock(dbml="ref2", inline=False),
+            Mock(dbml="ref3", inline=True),
+        ]
+        # Column has __slots__, methods are patched on the class
+        with patch.object(Column, "get_refs", Mock(return_value=refs)):
+            assert render_options(simple_column) == " [ref1, ref3]"
 
     @staticmethod
     def test_pk(simple_column_with_table: Column) -> None:
@@ -93,13 +93,11 @@ class TestRenderOptions:
     @staticmethod
     def test_all_options(complex_column: Column) -> None:
         complex_column.table = Mock(database=Mock(allow_properties=True))
-        complex_column.get_refs = Mock(
-            return_value=[
-                Mock(dbml="ref1", inline=True),
-                Mock(dbml="ref2", inline=False),
-                Mock(dbml="ref3", inline=True),
-            ]
-        )
+        refs = [
+            Mock(dbml="ref1", inline=True),
+            Mock(dbml="ref2", inline=False),
+            Mock(dbml="ref3", inline=True),
+        ]
         complex_column.default = "null"
 
         expected = (
@@ -112,7 +110,7 @@ class TestRenderOptions:
         with patch(
             "pydbml.renderer.dbml.default.column.note_option_to_dbml",
             Mock(return_value="note"),
-        ):
+        ), patch.object(Column, "get_refs", Mock(return_value=refs)):
             assert render_options(complex_column) == expected
 
 
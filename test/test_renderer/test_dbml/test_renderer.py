@@ -18,3 +18,36 @@ def test_render_db() -> None:
     ) as render_mock:
         DefaultDBMLRenderer.render_db(db)
         assert render_mock.call_count == 12
+
+
+def test_iter_render_db() -> None:
+    db = Mock(
+        project=None,
+        refs=(Mock(inline=False), Mock(inline=True)),
+        tables=[Mock()],
+        enums=[Mock()],
+        table_groups=[Mock()],
+        sticky_notes=[],
+    )
+
+    with patch.object(
+        DefaultDBMLRenderer, "render", Mock(side_effect=["e", "t", "r", "tg"])
+    ):
+        assert list(DefaultDBMLRenderer.iter_render_db(db)) == ["e", "t", "r", "tg"]
+
+
+def test_iter_render_db_part() -> None:
+    db = Mock(
+        project=None,
+        refs=(Mock(inline=False), Mock(inline=True)),
+        tables=[Mock()],
+        enums=[Mock()],
+        table_groups=[Mock()],
+        sticky_notes=[],
+    )
+
+    with patch.object(
+        DefaultDBMLRenderer, "render", Mock(side_effect=lambda model: model)
+    ):
+        part = list(DefaultDBMLRenderer.iter_render_db(db, slice(1, None, 2)))
+        assert part == [db.tables[0], db.table_groups[0]]
@@ -0,0 +1,40 @@
+import multiprocessing
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.renderer.dbml.default import DefaultDBMLRenderer
+from pydbml.renderer.parallel import iter_render_db_parallel
+from pydbml.renderer.sql.default import DefaultSQLRenderer
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent.parent / 'test_data'
+
+
+class TestRenderParallel(TestCase):
+    def setUp(self) -> None:
+        self.db = PyDBML(TEST_DATA_PATH / 'general.dbml')
+
+    def test_sql(self) -> None:
+        expected = DefaultSQLRenderer.render_db(self.db)
+        self.assertEqual(DefaultSQLRenderer.render_db(self.db, workers=2), expected)
+        self.assertEqual(DefaultSQLRenderer.render_db(self.db, workers=3), expected)
+
+    def test_dbml(self) -> None:
+        expected = DefaultDBMLRenderer.render_db(self.db)
+        self.assertEqual(DefaultDBMLRenderer.render_db(self.db, workers=2), expected)
+
+    def test_more_workers_than_pieces(self) -> None:
+        expected = list(DefaultSQLRenderer.iter_render_db(self.db))
+        workers = len(expected) + 2
+        self.assertEqual(list(iter_render_db_parallel(DefaultSQLRenderer, self.db, workers)), expected)
+
+    def test_spawn(self) -> None:
+        expected = list(DefaultSQLRenderer.iter_render_db(self.db))
+        context = multiprocessing.get_context('spawn')
+        self.assertEqual(list(iter_render_db_parallel(DefaultSQLRenderer, self.db, 2, context)), expected)
+
+    def test_one_worker(self) -> None:
+        self.assertEqual(DefaultSQLRenderer.render_db(self.db, workers=1), self.db.sql)
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, patch
 
+from pydbml import PyDBML
 from pydbml.renderer.sql.default import DefaultSQLRenderer
 
 
@@ -18,8 +19,8 @@ def test_render_db() -> None:
     )
 
     with patch(
-        "pydbml.renderer.sql.default.renderer.reorder_tables_for_sql",
-        Mock(return_value=db.tables),
+        "pydbml.renderer.sql.default.renderer.sort_tables_for_sql",
+        Mock(return_value=(db.tables, [])),
     ) as reorder_mock:
         with patch.object(
             DefaultSQLRenderer, "render", Mock(return_value="")
@@ -27,3 +28,69 @@ def test_render_db() -> None:
             result = DefaultSQLRenderer.render_db(db)
             assert reorder_mock.called
             assert render_mock.call_count == 7
+
+
+def test_iter_render_db() -> None:
+    db = Mock(
+        refs=(Mock(inline=False), Mock(inline=True)),
+        tables=[Mock(), Mock()],
+        enums=[Mock()],
+    )
+
+    with patch(
+        "pydbml.renderer.sql.default.renderer.sort_tables_for_sql",
+        Mock(return_value=(db.tables, [])),
+    ):
+        with patch.object(
+            DefaultSQLRenderer, "render", Mock(side_effect=["e", "t1", "t2", "r"])
+        ):
+            assert list(DefaultSQLRenderer.iter_render_db(db)) == ["e", "t1", "t2", "r"]
+
+
+def test_iter_render_db_part() -> None:
+    db = Mock(
+        refs=(Mock(inline=False), Mock(inline=True)),
+        tables=[Mock(), Mock()],
+        enums=[Mock()],
+    )
+
+    with patch(
+        "pydbml.renderer.sql.default.renderer.sort_tables_for_sql",
+        Mock(return_value=(db.tables, [])),
+    ):
+        with patch.object(
+            DefaultSQLRenderer, "render", Mock(side_effect=lambda model: model)
+        ):
+            part = list(DefaultSQLRenderer.iter_render_db(db, slice(0, None, 2)))
+            assert part == [db.enums[0], db.tables[1]]
+
+
+def test_render_db_cycle() -> None:
+    source = '''
+Table a {
+  id int [pk]
+  b_id int [ref: > b.id]
+}
+
+Table b {
+  id int [pk]
+  a_id int [ref: > a.id]
+}
+'''
+    db = PyDBML(source)
+    expected = '''CREATE TABLE "a" (
+  "id" int PRIMARY KEY,
+  "b_id" int
+);
+
+CREATE TABLE "b" (
+  "id" int PRIMARY KEY,
+  "a_id" int,
+  FOREIGN KEY ("a_id") REFERENCES "a" ("id")
+);
+
+ALTER TABLE "a" ADD FOREIGN KEY ("b_id") REFERENCES "b" ("id");'''
+    assert DefaultSQLRenderer.render_db(db) == expected
+    # deferring is only done when rendering the whole database
+    assert 'FOREIGN KEY ("b_id")' in db.tables[0].sql
+    assert db.refs[0].sql == 'FOREIGN KEY ("b_id") REFERENCES "b" ("id")'
@@ -1,10 +1,12 @@
 from unittest.mock import Mock
 
 from pydbml.classes import Enum
-from pydbml.constants import ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY
+from pydbml.constants import ONE_TO_MANY, MANY_TO_ONE, MANY_TO_MANY, ONE_TO_ONE
 from pydbml.renderer.sql.default.utils import (
     get_full_name_for_sql,
     reorder_tables_for_sql,
+    sort_tables_for_sql,
+    strongly_connected_components,
 )
 
 
@@ -20,12 +22,12 @@ class TestGetFullNameForSQL:
 
 
 def test_reorder_tables() -> None:
-    t1 = Mock(name="table1")  # 1 ref
-    t2 = Mock(name="table2")  # 2 refs
+    t1 = Mock(name="table1")  # depends on t10
+    t2 = Mock(name="table2")  # depends on t1, t6
     t3 = Mock(name="table3")
-    t4 = Mock(name="table4")  # 1 ref
+    t4 = Mock(name="table4")  # depends on t3
     t5 = Mock(name="table5")
-    t6 = Mock(name="table6")  # 3 refs
+    t6 = Mock(name="table6")  # depends on t7, t8, t9
     t7 = Mock(name="table7")
     t8 = Mock(name="table8")
     t9 = Mock(name="table9")
@@ -45,6 +47,73 @@ def test_reorder_tables() -> None:
         Mock(type=MANY_TO_MANY, table1=t1, table2=t2, inline=True),  # ignored m2m
     ]
     original = [t1, t2, t3, t4, t5, t6, t7, t8, t9, t10]
-    expected = [t6, t2, t1, t4, t3, t5, t7, t8, t9, t10]
+    expected = [t3, t4, t5, t7, t8, t9, t6, t10, t1, t2]
     result = reorder_tables_for_sql(original, refs)  # type: ignore
     assert expected == result
+
+
+class TestSortTablesForSQL:
+    @staticmethod
+    def test_chain() -> None:
+        t1, t2, t3, t4 = (Mock(name=f"table{i}") for i in range(1, 5))
+        refs = [
+            Mock(type=MANY_TO_ONE, table1=t1, table2=t2, inline=True),
+            Mock(type=ONE_TO_ONE, table1=t2, table2=t3, inline=True),
+            Mock(type=ONE_TO_MANY, table1=t4, table2=t3, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t1, table2=t1, inline=True),  # self-reference
+        ]
+        assert sort_tables_for_sql([t1, t2, t3, t4], refs) == ([t4, t3, t2, t1], [])
+
+    @staticmethod
+    def test_cycle() -> None:
+        t1, t2, t3, t4 = (Mock(name=f"table{i}") for i in range(1, 5))
+        refs = [
+            Mock(type=MANY_TO_ONE, table1=t1, table2=t2, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t2, table2=t3, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t3, table2=t1, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t3, table2=t4, inline=True),
+        ]
+        tables, deferred = sort_tables_for_sql([t1, t2, t3, t4], refs)
+        assert tables == [t4, t1, t3, t2]
+        assert deferred == [refs[0]]
+
+    @staticmethod
+    def test_table_waiting_for_cycle() -> None:
+        c, a, b = (Mock(name=name) for name in 'cab')
+        refs = [
+            Mock(type=MANY_TO_ONE, table1=c, table2=a, inline=True),
+            Mock(type=MANY_TO_ONE, table1=a, table2=b, inline=True),
+            Mock(type=MANY_TO_ONE, table1=b, table2=a, inline=True),
+        ]
+        tables, deferred = sort_tables_for_sql([c, a, b], refs)
+        # c is not on the cycle, its foreign key stays in CREATE TABLE
+        assert tables == [a, c, b]
+        assert deferred == [refs[1]]
+
+    @staticmethod
+    def test_two_cycles() -> None:
+        t1, t2, t3, t4 = (Mock(name=f"table{i}") for i in range(1, 5))
+        refs = [
+            Mock(type=MANY_TO_ONE, table1=t1, table2=t2, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t2, table2=t1, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t2, table2=t3, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t3, table2=t4, inline=True),
+            Mock(type=MANY_TO_ONE, table1=t4, table2=t3, inline=True),
+        ]
+        tables, deferred = sort_tables_for_sql([t1, t2, t3, t4], refs)
+        assert tables == [t1, t3, t2, t4]
+        assert deferred == [refs[0], refs[3]]
+
+    @staticmethod
+    def test_unknown_table() -> None:
+        t1, t2 = Mock(name="table1"), Mock(name="table2")
+        refs = [Mock(type=MANY_TO_ONE, table1=t1, table2=t2, inline=True)]
+        assert sort_tables_for_sql([t1], refs) == ([t1], [])
+
+
+def test_strongly_connected_components() -> None:
+    graph = [[1], [2], [0, 3], [4], [3, 5], []]
+    component = strongly_connected_components(graph)
+    assert component[0] == component[1] == component[2]
+    assert component[3] == component[4]
+    assert len({component[0], component[3], component[5]}) == 3
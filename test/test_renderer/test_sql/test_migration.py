@@ -0,0 +1,228 @@
+import pytest
+
+from pydbml import Database
+from pydbml._classes.reference import Reference
+from pydbml.changes import ADD, ALTER, DROP, Change
+from pydbml.classes import Column, Enum, Expression, Index, Note, Table
+from pydbml.exceptions import TableNotFoundError
+from pydbml.renderer.sql.migration import (
+    render_changes,
+    render_column_alter,
+    render_column_change,
+    render_enum_change,
+    render_index_change,
+    render_reference_change,
+    render_table_change,
+)
+
+
+class TestRenderEnumChange:
+    @staticmethod
+    def test_add(enum1: Enum) -> None:
+        assert render_enum_change(Change(ADD, new=enum1))[0].startswith('CREATE TYPE "product status"')
+
+    @staticmethod
+    def test_drop(enum1: Enum) -> None:
+        assert render_enum_change(Change(DROP, old=enum1)) == ['DROP TYPE "product status";']
+
+    @staticmethod
+    def test_items(enum1: Enum) -> None:
+        new = Enum('product status', ('draft', 'production', 'archived'))
+        expected = [
+            'ALTER TYPE "product status" ADD VALUE \'draft\' BEFORE \'production\';',
+            'ALTER TYPE "product status" ADD VALUE \'archived\' AFTER \'production\';',
+            "-- items 'development' were removed from the type \"product status\", "
+            "which is not supported by ALTER TYPE",
+        ]
+        assert render_enum_change(Change(ALTER, enum1, new, ('items',))) == expected
+
+    @staticmethod
+    def test_items_before_existing() -> None:
+        old = Enum('e', ('c',))
+        new = Enum('e', ('a', 'b', 'c'))
+        expected = [
+            'ALTER TYPE "e" ADD VALUE \'a\' BEFORE \'c\';',
+            'ALTER TYPE "e" ADD VALUE \'b\' AFTER \'a\';',
+        ]
+        assert render_enum_change(Change(ALTER, old, new, ('items',))) == expected
+
+
+class TestRenderTableChange:
+    @staticmethod
+    def test_add_without_foreign_keys(db: Database, table2: Table, table3: Table, reference1: Reference) -> None:
+        db.add(table2)
+        db.add(table3)
+        reference1.inline = True
+        db.add(reference1)
+        result = render_table_change(Change(ADD, new=table3))[0]
+        assert 'CREATE TABLE "orders"' in result
+        assert 'FOREIGN KEY' not in result
+
+    @staticmethod
+    def test_drop() -> None:
+        table = Table('orders', schema='shop')
+        assert render_table_change(Change(DROP, old=table)) == ['DROP TABLE "shop"."orders";']
+
+    @staticmethod
+    def test_note(table1: Table) -> None:
+        new = Table('products', note="it's a note")
+        expected = ['COMMENT ON TABLE "products" IS \'it"s a note\';']
+        assert render_table_change(Change(ALTER, table1, new, ('note',))) == expected
+        expected = ['COMMENT ON TABLE "products" IS NULL;']
+        assert render_table_change(Change(ALTER, new, table1, ('note',))) == expected
+
+
+class TestRenderColumnChange:
+    @staticmethod
+    def test_add(table1: Table) -> None:
+        column = Column('price', 'float', not_null=True, note='in cents')
+        table1.add_column(column)
+        expected = [
+            'ALTER TABLE "products" ADD COLUMN "price" float NOT NULL;',
+            'COMMENT ON COLUMN "products"."price" IS \'in cents\';',
+        ]
+        assert render_column_change(Change(ADD, new=column)) == expected
+
+    @staticmethod
+    def test_drop(table1: Table) -> None:
+        expected = ['ALTER TABLE "products" DROP COLUMN "name";']
+        assert render_column_change(Change(DROP, old=table1['name'])) == expected
+
+    @staticmethod
+    def test_alter(table1: Table, enum1: Enum) -> None:
+        old = table1['id']
+        new = Column('id', enum1, not_null=True, unique=True, pk=True, default=Expression('now()'))
+        Table('products', columns=[new])
+        fields = ('type', 'not_null', 'default', 'unique', 'pk', 'note')
+        expected = [
+            'ALTER TABLE "products" ALTER COLUMN "id" TYPE "product status";',
+            'ALTER TABLE "products" ALTER COLUMN "id" SET NOT NULL;',
+            'ALTER TABLE "products" ALTER COLUMN "id" SET DEFAULT (now());',
+            'ALTER TABLE "products" ADD UNIQUE ("id");',
+            'ALTER TABLE "products" ADD PRIMARY KEY ("id");',
+            'COMMENT ON COLUMN "products"."id" IS NULL;',
+        ]
+        assert render_column_alter(old, new, fields) == expected
+
+    @staticmethod
+    def test_alter_drop(table1: Table) -> None:
+        old = Column('id', 'integer', not_null=True, unique=True, pk=True, default=0)
+        Table('products', columns=[old])
+        new = table1['id']
+        expected = [
+            'ALTER TABLE "products" ALTER COLUMN "id" DROP NOT NULL;',
+            'ALTER TABLE "products" ALTER COLUMN "id" DROP DEFAULT;',
+            'ALTER TABLE "products" DROP CONSTRAINT "products_id_key";',
+            'ALTER TABLE "products" DROP CONSTRAINT "products_pkey";',
+        ]
+        assert render_column_alter(old, new, ('not_null', 'default', 'unique', 'pk')) == expected
+
+    @staticmethod
+    def test_composite_pk() -> None:
+        old = Table('t', columns=[Column('a', 'int', pk=True), Column('b', 'int')])
+        new = Table('t', columns=[Column('a', 'int', pk=True), Column('b', 'int', pk=True)])
+        expected = [
+            'ALTER TABLE "t" DROP CONSTRAINT "t_pkey";',
+            'ALTER TABLE "t" ADD PRIMARY KEY ("a", "b");',
+        ]
+        assert render_column_alter(old['b'], new['b'], ('pk',)) == expected
+        assert render_column_alter(new['b'], old['b'], ('pk',)) == [
+            'ALTER TABLE "t" DROP CONSTRAINT "t_pkey";',
+            'ALTER TABLE "t" ADD PRIMARY KEY ("a");',
+        ]
+
+    @staticmethod
+    def test_composite_pk_replaced_once() -> None:
+        from pydbml import diff
+        old, new = Database(), Database()
+        old.add(Table('t', columns=[Column('a', 'int', pk=True), Column('b', 'int'), Column('c', 'int')]))
+        new.add(Table('t', columns=[Column('a', 'int'), Column('b', 'int', pk=True), Column('c', 'int', pk=True)]))
+        expected = (
+            'ALTER TABLE "t" DROP CONSTRAINT "t_pkey";\n'
+            'ALTER TABLE "t" ADD PRIMARY KEY ("b", "c");'
+        )
+        assert render_changes(diff(old, new)) == expected
+
+    @staticmethod
+    def test_no_table() -> None:
+        column = Column('price', 'float')
+        with pytest.raises(TableNotFoundError):
+            render_column_change(Change(DROP, old=column))
+
+
+class TestRenderIndexChange:
+    @staticmethod
+    def test_add(index1: Index) -> None:
+        expected = ['CREATE INDEX ON "products" ("name");']
+        assert render_index_change(Change(ADD, new=index1)) == expected
+
+    @staticmethod
+    def test_add_pk(table1: Table) -> None:
+        index = Index([table1['id'], table1['name']], pk=True)
+        table1.add_index(index)
+        expected = ['ALTER TABLE "products" ADD PRIMARY KEY ("id", "name");']
+        assert render_index_change(Change(ADD, new=index)) == expected
+
+    @staticmethod
+    def test_drop(index1: Index) -> None:
+        assert render_index_change(Change(DROP, old=index1)) == ['DROP INDEX "products_name_idx";']
+        index1.name = 'product_names'
+        assert render_index_change(Change(DROP, old=index1)) == ['DROP INDEX "product_names";']
+
+    @staticmethod
+    def test_drop_pk(table1: Table) -> None:
+        index = Index([table1['id'], table1['name']], pk=True)
+        table1.add_index(index)
+        expected = ['ALTER TABLE "products" DROP CONSTRAINT "products_pkey";']
+        assert render_index_change(Change(DROP, old=index)) == expected
+
+
+class TestRenderReferenceChange:
+    @staticmethod
+    def test_add(reference1: Reference) -> None:
+        reference1.inline = True
+        expected = ['ALTER TABLE "orders" ADD FOREIGN KEY ("product_id") REFERENCES "products" ("id");']
+        assert render_reference_change(Change(ADD, new=reference1)) == expected
+
+    @staticmethod
+    def test_drop(reference1: Reference) -> None:
+        expected = ['ALTER TABLE "orders" DROP CONSTRAINT "orders_product_id_fkey";']
+        assert render_reference_change(Change(DROP, old=reference1)) == expected
+        reference1.name = 'fk_product'
+        expected = ['ALTER TABLE "orders" DROP CONSTRAINT "fk_product";']
+        assert render_reference_change(Change(DROP, old=reference1)) == expected
+
+    @staticmethod
+    def test_drop_one_to_many(reference1: Reference) -> None:
+        reference1.type = '<'
+        reference1.col1, reference1.col2 = reference1.col2, reference1.col1
+        expected = ['ALTER TABLE "orders" DROP CONSTRAINT "orders_product_id_fkey";']
+        assert render_reference_change(Change(DROP, old=reference1)) == expected
+
+
+def test_render_changes(table1: Table) -> None:
+    column = Column('price', 'float')
+    table1.add_column(column)
+    changes = [Change(ADD, new=column), Change(DROP, old=table1['name'])]
+    expected = (
+        'ALTER TABLE "products" ADD COLUMN "price" float;\n\n'
+        'ALTER TABLE "products" DROP COLUMN "name";'
+    )
+    assert render_changes(changes) == expected
+
+
+def test_render_diff() -> None:
+    from pydbml import diff
+    old, new = Database(), Database()
+    old.add(Table('products', columns=[Column('id', 'int'), Column('name', 'varchar')]))
+    table = new.add(Table('products', columns=[Column('id', 'int'), Column('name', 'varchar', note=Note('name'))]))
+    new.add(Table('orders', columns=[Column('product_id', 'int')]))
+    new.add(Reference('>', new['public.orders']['product_id'], table['id'], inline=True))
+    expected = (
+        'CREATE TABLE "orders" (\n'
+        '  "product_id" int\n'
+        ');\n\n'
+        'COMMENT ON COLUMN "products"."name" IS \'name\';\n\n'
+        'ALTER TABLE "orders" ADD FOREIGN KEY ("product_id") REFERENCES "products" ("id");'
+    )
+    assert render_changes(diff(old, new)) == expected
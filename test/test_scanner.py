@@ -0,0 +1,122 @@
+import os
+
+from pathlib import Path
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.scanner import Block
+from pydbml.parser.scanner import ScanError
+from pydbml.parser.scanner import split_blocks
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestSplitBlocks(TestCase):
+    def test_keywords(self) -> None:
+        source = '''\
+Project p {
+  Note: 'n'
+}
+enum e {
+  a
+}
+Table t {
+  id int
+}
+TableGroup g {
+  t
+}
+Ref: t.id > t.id
+Note n {
+  'text'
+}
+'''
+        blocks = split_blocks(source)
+        self.assertEqual(
+            [b.keyword for b in blocks],
+            ['project', 'enum', 'table', 'tablegroup', 'ref', 'note']
+        )
+        self.assertEqual(blocks[0].start, 0)
+        for prev, next_ in zip(blocks, blocks[1:]):
+            self.assertEqual(prev.end, next_.start)
+
+    def test_comments_belong_to_next_block(self) -> None:
+        source = 'Table a {\n  id int\n} // after a\n// before b\nTable b {\n  id int\n}'
+        a, b = split_blocks(source)
+        self.assertEqual(source[a.start:a.end], 'Table a {\n  id int\n} // after a\n')
+        self.assertEqual(source[b.start:b.end], '// before b\nTable b {\n  id int\n}')
+
+    def test_short_ref_ends_at_line_break(self) -> None:
+        source = 'Ref: a.id > b.id [delete: cascade,\n  update: no action] // c\nRef: b.id > c.id'
+        first, second = split_blocks(source)
+        self.assertEqual(
+            source[first.start:first.end],
+            'Ref: a.id > b.id [delete: cascade,\n  update: no action] // c'
+        )
+        self.assertEqual(second, Block('ref', first.end, len(source)))
+
+    def test_long_ref(self) -> None:
+        source = 'Ref name {\n  a.id > b.id [delete: cascade]\n}\n'
+        self.assertEqual(split_blocks(source), [Block('ref', 0, len(source))])
+
+    def test_braces_in_strings_and_comments(self) -> None:
+        source = '''\
+Table a [note: '}'] {
+  id int [default: "{", note: \'\'\'
+    multiline }
+  \'\'\']
+  /* } */ name varchar // }
+  expr int [default: `'}'`]
+}
+'''
+        self.assertEqual(split_blocks(source), [Block('table', 0, len(source))])
+
+    def test_trailing_comments(self) -> None:
+        source = 'Table a {\n  id int\n}\n\n// trailing\n/* block\n comment */\n'
+        self.assertEqual(len(split_blocks(source)), 1)
+
+    def test_errors(self) -> None:
+        bad_sources = (
+            'Tabel a {\n  id int\n}',
+            'Table a {\n  id int\n',
+            'Table a {\n  id int\n} junk',
+            "Table a [note: 'unterminated\n] {\n  id int\n}",
+            'Table a {\n  id int\n}\n/* unterminated',
+            'Ref: a.id > b.id {',
+        )
+        for source in bad_sources:
+            with self.assertRaises(ScanError, msg=source):
+                split_blocks(source)
+
+
+class TestFastPath(TestCase):
+    def assert_same_as_full_grammar(self, source: str, allow_properties: bool = False) -> None:
+        parser = PyDBMLParser(source, allow_properties=allow_properties)
+        parser._set_syntax()
+        full = parser._collect_blueprints(parser._syntax.parse_string(source, parse_all=True))
+        fast = parser._parse_blocks()
+        self.assertEqual(repr(fast), repr(full))
+
+    def test_test_data(self) -> None:
+        files = [
+            *TEST_DATA_PATH.glob('*.dbml'),
+            *(TEST_DATA_PATH / 'docs').glob('*.dbml'),
+        ]
+        for path in files:
+            source = path.read_text(encoding='utf8').lstrip('﻿')
+            with self.subTest(path=path.name):
+                self.assert_same_as_full_grammar(source)
+                self.assert_same_as_full_grammar(source, allow_properties=True)
+
+    def test_tabs(self) -> None:
+        source = "Table a {\n\tid int [note: 'a\ttab']\n}\n\tRef: a.id > a.id\n"
+        self.assert_same_as_full_grammar(source)
+
+    def test_fallback_keeps_errors(self) -> None:
+        with self.assertRaises(SyntaxError) as e:
+            PyDBML.parse('Table a {\n  id int\n}\nTable b {\n}\n')
+        self.assertIn('position 21', str(e.exception))
+        # the fast path failure is not chained to the error
+        self.assertIsNone(e.exception.__context__)
@@ -0,0 +1,130 @@
+import os
+import struct
+import zlib
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from pydbml import PyDBML
+from pydbml._classes.note import EMPTY_NOTE
+from pydbml.classes import Column
+from pydbml.classes import Expression
+from pydbml.classes import Reference
+from pydbml.classes import Table
+from pydbml.database import Database
+from pydbml.exceptions import SnapshotError
+from pydbml.snapshot import FORMAT_VERSION
+from pydbml.snapshot import MAGIC
+from pydbml.snapshot import dumps
+from pydbml.snapshot import loads
+
+
+TEST_DATA_PATH = Path(os.path.abspath(__file__)).parent / 'test_data'
+
+
+class TestSnapshot(TestCase):
+    def test_round_trip(self) -> None:
+        files = [
+            *TEST_DATA_PATH.glob('*.dbml'),
+            *(TEST_DATA_PATH / 'docs').glob('*.dbml'),
+        ]
+        for path in files:
+            if path.name.startswith('wrong_'):
+                continue
+            with self.subTest(path=path.name):
+                db = PyDBML(path)
+                loaded = loads(dumps(db))
+                if loaded.project:
+                    self.assertIs(loaded.project.database, loaded)
+                self.assertEqual(loaded.sql, db.sql)
+                self.assertEqual(loaded.dbml, db.dbml)
+
+    def test_links(self) -> None:
+        db = PyDBML(TEST_DATA_PATH / 'general.dbml')
+        loaded = loads(dumps(db))
+        for table in loaded.tables:
+            self.assertIs(table.database, loaded)
+            self.assertIs(table.note.parent, table)
+            self.assertIs(loaded[table.full_name], table)
+            for column in table.columns:
+                self.assertIs(column.table, table)
+                if column.note:
+                    self.assertIs(column.note.parent, column)
+                else:
+                    self.assertIs(column._note, EMPTY_NOTE)
+            for index in table.indexes:
+                self.assertIs(index.table, table)
+                for subject in index.subjects:
+                    if isinstance(subject, Column):
+                        self.assertIs(subject.table, table)
+        for ref in loaded.refs:
+            self.assertIs(ref.database, loaded)
+            self.assertIn(ref.table1, loaded.tables)
+            self.assertIn(ref.table2, loaded.tables)
+        for enum in loaded.enums:
+            self.assertIs(enum.database, loaded)
+        self.assertIs(loaded['public.products']['status'].type, loaded.enums[1])
+
+    def test_expressions(self) -> None:
+        source = '''
+Table a {
+  id int [default: `now()`]
+  name varchar [default: 'now()']
+
+  indexes {
+    (`lower(name)`, id)
+  }
+}
+'''
+        loaded = loads(dumps(PyDBML(source)))
+        table = loaded['public.a']
+        self.assertEqual(table['id'].default, Expression('now()'))
+        self.assertEqual(table['name'].default, 'now()')
+        self.assertEqual(table.indexes[0].subjects, [Expression('lower(name)'), table['id']])
+
+    def test_spans(self) -> None:
+        source = 'Table a {\n\tid int [pk]\n}\n\nTable b {\n  a_id int [ref: > a.id]\n}\n'
+        db = PyDBML(source)
+        db.add_table(Table('c'))
+        loaded = loads(dumps(db))
+        column = loaded['public.a']['id']
+        self.assertEqual((column.span.line, column.span.column), (2, 2))
+        self.assertEqual(column.span.text, 'id int [pk]')
+        self.assertEqual(loaded.refs[0].span.text, 'ref: > a.id')
+        self.assertEqual(loaded['public.b'].span, db['public.b'].span)
+        self.assertIsNone(loaded['public.c'].span)
+
+    def test_file(self) -> None:
+        db = PyDBML(TEST_DATA_PATH / 'general.dbml')
+        with TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'general.snapshot'
+            db.dump_snapshot(path)
+            loaded = Database.load_snapshot(str(path))
+        self.assertEqual(loaded.sql, db.sql)
+
+    def test_bad_data(self) -> None:
+        data = dumps(PyDBML(TEST_DATA_PATH / 'general.dbml'))
+        with self.assertRaises(SnapshotError):
+            loads(b'Table a {}')
+        with self.assertRaises(SnapshotError):
+            loads(MAGIC + struct.pack('>H', FORMAT_VERSION + 1) + data[len(MAGIC) + 2:])
+        with self.assertRaises(SnapshotError):
+            loads(data[:-10])
+        header = MAGIC + struct.pack('>H', FORMAT_VERSION)
+        for payload in (b'{}', b'[]', b'{"allow_properties":false,"enums":[1]}'):
+            with self.assertRaises(SnapshotError):
+                loads(header + zlib.compress(payload))
+
+    def test_table_outside_database(self) -> None:
+        t1 = Table('t1')
+        c1 = Column('id', 'int')
+        t1.add_column(c1)
+        t2 = Table('t2')
+        c2 = Column('id', 'int')
+        t2.add_column(c2)
+        db = Database()
+        db.add(t1)
+        db.add(Reference('>', c1, c2))
+        with self.assertRaises(SnapshotError):
+            dumps(db)
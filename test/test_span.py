@@ -0,0 +1,106 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pydbml import PyDBML
+from pydbml.parser.incremental import IncrementalParser
+from pydbml.parser.parser import PyDBMLParser
+from pydbml.parser.scanner import ScanError
+from pydbml.parser.span import LineIndex
+from pydbml.parser.span import SourceSpan
+
+
+SOURCE = '''\
+// users
+Table users as U {
+  id int [pk] // id
+  name varchar
+  indexes {
+    (id, name) [unique]
+  }
+}
+
+enum status {
+  active
+}
+
+Table posts {
+  id int
+  user_id int [ref: > users.id]
+}
+
+Ref {
+  posts.id - users.id
+}
+'''
+
+
+class TestLineIndex(TestCase):
+    def test_position(self) -> None:
+        lines = LineIndex('ab\ncd\n')
+        self.assertEqual(lines.position(0), (1, 1))
+        self.assertEqual(lines.position(2), (1, 3))
+        self.assertEqual(lines.position(3), (2, 1))
+        self.assertEqual(lines.position(6), (3, 1))
+
+    def test_tabs(self) -> None:
+        source = 'a\tb\n\tc'
+        lines = LineIndex(source)
+        expanded = source.expandtabs()
+        self.assertEqual(lines.offset(expanded.index('b')), source.index('b'))
+        self.assertEqual(lines.offset(expanded.index('c')), source.index('c'))
+        self.assertEqual(LineIndex('a b').offset(2), 2)
+
+
+class TestSourceSpan(TestCase):
+    def check_spans(self, source: str) -> None:
+        db = PyDBML(source)
+        users, posts = db.tables
+        self.assertEqual(users.span.text[:18], 'Table users as U {')
+        self.assertEqual((users.span.line, users.span.column), (2, 1))
+        self.assertEqual((users.span.end_line, users.span.end_column), (8, 2))
+        self.assertEqual(users['id'].span.text, 'id int [pk] // id')
+        self.assertEqual(users['name'].span.text, 'name varchar')
+        self.assertEqual(users.indexes[0].span.text, '(id, name) [unique]')
+        self.assertEqual(db.enums[0].span.text, 'enum status {\n  active\n}')
+        inline, ref = db.refs
+        self.assertEqual(inline.span.text, 'ref: > users.id')
+        self.assertEqual((inline.span.line, inline.span.column), (16, 16))
+        self.assertEqual(ref.span.text, 'Ref {\n  posts.id - users.id\n}')
+        self.assertEqual(posts.span.end, source.index('}\n\nRef') + 1)
+
+    def test_blocks(self) -> None:
+        self.check_spans(SOURCE)
+
+    def test_full_grammar(self) -> None:
+        with patch.object(PyDBMLParser, '_parse_blocks', side_effect=ScanError):
+            self.check_spans(SOURCE)
+
+    def test_tabs(self) -> None:
+        source = SOURCE.replace('  ', '\t')
+        db = PyDBML(source)
+        column = db['public.users']['name']
+        self.assertEqual(column.span.text, 'name varchar')
+        self.assertEqual((column.span.line, column.span.column), (4, 2))
+
+    def test_not_compared(self) -> None:
+        db1 = PyDBML(SOURCE)
+        db2 = PyDBML('\n' + SOURCE)
+        self.assertNotEqual(db1.tables[0].span, db2.tables[0].span)
+        self.assertEqual(db1.tables[0], db2.tables[0])
+
+    def test_not_bound(self) -> None:
+        span = SourceSpan(3, 5)
+        self.assertEqual((span.start, span.end), (3, 5))
+        with self.assertRaises(RuntimeError):
+            span.line
+
+    def test_incremental(self) -> None:
+        parser = IncrementalParser()
+        db = parser.update(SOURCE)
+        posts = db.tables[1]
+        source = '// new\n' + SOURCE.replace('  active\n', '  active\n  archived\n')
+        parser.update(source)
+        self.assertIs(db.tables[1], posts)
+        self.assertEqual(posts.span.text, source[source.index('Table posts'):source.index('}\n\nRef') + 1])
+        self.assertEqual(posts.span.line, 16)
+        self.assertEqual(db.enums[0].span.text, 'enum status {\n  active\n  archived\n}')